@@ -0,0 +1 @@
+"""Performance benchmarks (run with ``make bench``)."""
@@ -0,0 +1,103 @@
+"""Per-frame HUD rendering benchmark.
+
+Times ``HUD.draw`` across common capture resolutions with a synthetic hand
+that moves between lanes, so both the cached static layers and the dirty-
+region restore path are exercised.
+
+Usage::
+
+    python -m benchmarks.hud_draw
+    python -m benchmarks.hud_draw --frames 1000 --max-p95-ms 2.0
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.domain.actions import Action
+from src.domain.models import GestureSnapshot
+from src.ui.display import HUD
+
+RESOLUTIONS: tuple[tuple[int, int], ...] = ((320, 240), (640, 480), (1280, 720), (1920, 1080))
+_ACTIONS = (Action.LEFT, Action.CENTER, Action.RIGHT, Action.JUMP, Action.IDLE)
+
+
+@dataclass(slots=True)
+class _Point:
+    x: float
+    y: float
+    z: float = 0.0
+
+
+def _synthetic_hand(step: int) -> list[list[_Point]]:
+    """21 landmarks arranged in a fan, drifting horizontally with *step*."""
+    cx = 0.5 + 0.35 * math.sin(step / 25.0)
+    hand = [_Point(cx, 0.8)]
+    for finger in range(5):
+        angle = math.pi * (0.15 + 0.175 * finger)
+        for joint in range(1, 5):
+            radius = 0.06 * joint
+            hand.append(_Point(cx - radius * math.cos(angle), 0.8 - radius * math.sin(angle)))
+    return [hand]
+
+
+def bench_resolution(width: int, height: int, frames: int) -> dict[str, float]:
+    hud = HUD()
+    frame = np.zeros((height, width, 3), dtype=np.uint8)
+    # First call builds the layer cache; keep it out of the steady-state numbers.
+    warmup_start = time.perf_counter()
+    hud.draw(frame, GestureSnapshot(), None, 0, "default")
+    build_ms = (time.perf_counter() - warmup_start) * 1000
+
+    samples: list[float] = []
+    for step in range(frames):
+        action = _ACTIONS[(step // 30) % len(_ACTIONS)]
+        landmarks = _synthetic_hand(step) if action != Action.IDLE else None
+        snapshot = GestureSnapshot(action=action, has_hand=landmarks is not None)
+        start = time.perf_counter()
+        hud.draw(frame, snapshot, landmarks, 30 + step % 30, "default")
+        samples.append((time.perf_counter() - start) * 1000)
+
+    samples.sort()
+    return {
+        "build_ms": build_ms,
+        "mean_ms": statistics.fmean(samples),
+        "p50_ms": samples[len(samples) // 2],
+        "p95_ms": samples[int(len(samples) * 0.95) - 1],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark HUD.draw per resolution.")
+    parser.add_argument("--frames", type=int, default=600, help="Frames per resolution.")
+    parser.add_argument(
+        "--max-p95-ms",
+        type=float,
+        default=None,
+        help="Exit non-zero when any resolution's p95 exceeds this budget.",
+    )
+    args = parser.parse_args()
+
+    print(f"{'resolution':>12} {'build':>9} {'mean':>9} {'p50':>9} {'p95':>9}")
+    over_budget = False
+    for width, height in RESOLUTIONS:
+        stats = bench_resolution(width, height, args.frames)
+        print(
+            f"{width:>5}x{height:<6} "
+            f"{stats['build_ms']:>7.2f}ms {stats['mean_ms']:>7.3f}ms "
+            f"{stats['p50_ms']:>7.3f}ms {stats['p95_ms']:>7.3f}ms"
+        )
+        if args.max_p95_ms is not None and stats["p95_ms"] > args.max_p95_ms:
+            over_budget = True
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
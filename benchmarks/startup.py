@@ -0,0 +1,101 @@
+"""Cold-start import benchmark per execution mode.
+
+Each run is a fresh interpreter that imports ``main`` plus the modules the
+mode pulls in once ``main()`` dispatches, mirroring the lazy imports there.
+Besides timing, every mode has modules it must never load (``--mode api``
+must not pay for OpenCV/MediaPipe, the controller must not pay for FastAPI);
+loading one fails the run even without a time budget.
+
+Usage::
+
+    python -m benchmarks.startup
+    python -m benchmarks.startup --runs 10 --max-ms 400
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# mode -> (modules main() imports for it, modules that must stay unloaded)
+MODES: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {
+    "bare": ((), ("cv2", "mediapipe", "fastapi", "uvicorn", "numpy")),
+    "controller": (("src.app.runner",), ("fastapi", "uvicorn", "starlette", "pydantic")),
+    "api": (("src.api.app",), ("cv2", "mediapipe")),
+    "all": (("src.app.runner", "src.api.app", "src.services.preview_service", "uvicorn"), ()),
+}
+
+_PROBE = """
+import importlib, json, sys, time
+start = time.perf_counter()
+import main
+for name in {modules!r}:
+    importlib.import_module(name)
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({{"ms": elapsed, "loaded": [m for m in {forbidden!r} if m in sys.modules]}}))
+"""
+
+
+def measure(mode: str) -> tuple[float, list[str]]:
+    """Import time of *mode* in a new interpreter, and any forbidden modules it loaded.
+
+    Raises:
+        RuntimeError: the mode cannot be imported here (missing dependency).
+    """
+    modules, forbidden = MODES[mode]
+    probe = _PROBE.format(modules=modules, forbidden=forbidden)
+    completed = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        lines = completed.stderr.strip().splitlines()
+        raise RuntimeError(lines[-1] if lines else f"exit status {completed.returncode}")
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    return float(result["ms"]), list(result["loaded"])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark cold-start imports per mode.")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per mode.")
+    parser.add_argument(
+        "--max-ms",
+        type=float,
+        default=None,
+        help="Exit non-zero when any mode's median exceeds this budget.",
+    )
+    args = parser.parse_args()
+
+    print(f"{'mode':>10} {'median':>10} {'min':>10}  unexpected imports")
+    failed = False
+    for mode in MODES:
+        samples: list[float] = []
+        leaked: set[str] = set()
+        try:
+            for _ in range(args.runs):
+                elapsed, loaded = measure(mode)
+                samples.append(elapsed)
+                leaked.update(loaded)
+        except RuntimeError as exc:
+            print(f"{mode:>10} {'skipped':>10} {'':>10}  {exc}")
+            continue
+        median = statistics.median(samples)
+        print(
+            f"{mode:>10} {median:>8.1f}ms {min(samples):>8.1f}ms  "
+            f"{', '.join(sorted(leaked)) or '-'}"
+        )
+        if leaked or (args.max_ms is not None and median > args.max_ms):
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
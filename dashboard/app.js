@@ -11,6 +11,11 @@ const apiKeyInput = document.getElementById("apiKeyInput");
 const lastUpdateText = document.getElementById("lastUpdateText");
 const sparkline = document.getElementById("fpsSparkline");
 const sparkCtx = sparkline.getContext("2d");
+const previewImage = document.getElementById("previewImage");
+const previewState = document.getElementById("previewState");
+const togglePreviewBtn = document.getElementById("togglePreviewBtn");
+
+let previewController = null;
 
 apiKeyInput.value = localStorage.getItem("subway_api_key") || "";
 
@@ -76,9 +81,10 @@ function drawSparkline(history) {
   sparkCtx.stroke();
 }
 
-async function refreshTelemetry() {
-  const data = await apiFetch("/v1/telemetry?limit=80");
-  const latest = data.latest;
+const TELEMETRY_HISTORY_LIMIT = 80;
+const telemetryHistory = [];
+
+function renderTelemetry(latest) {
   if (!latest) {
     trackingState.textContent = "No stream";
     return;
@@ -90,7 +96,135 @@ async function refreshTelemetry() {
   trackingState.textContent = latest.has_hand ? "Hand detected" : "No hand";
   activeProfile.textContent = latest.profile;
   lastUpdateText.textContent = `Last update: ${latest.timestamp}`;
-  drawSparkline(data.history || []);
+  drawSparkline(telemetryHistory);
+}
+
+function pushTelemetry(sample) {
+  telemetryHistory.push(sample);
+  if (telemetryHistory.length > TELEMETRY_HISTORY_LIMIT) telemetryHistory.shift();
+  renderTelemetry(sample);
+}
+
+async function refreshTelemetry() {
+  const data = await apiFetch(`/v1/telemetry?limit=${TELEMETRY_HISTORY_LIMIT}`);
+  telemetryHistory.splice(0, telemetryHistory.length, ...(data.history || []));
+  renderTelemetry(data.latest);
+}
+
+// Server-Sent Events read through fetch (EventSource cannot send x-api-key).
+// Each "telemetry" event carries one new snapshot; history is kept client-side.
+async function streamTelemetry() {
+  const response = await fetch("/v1/telemetry/stream", { headers: getHeaders() });
+  if (!response.ok || !response.body) throw new Error(`HTTP ${response.status}`);
+
+  const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+  let buffer = "";
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) return;
+    buffer += value;
+    let boundary = buffer.indexOf("\n\n");
+    while (boundary >= 0) {
+      const event = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+      const data = event
+        .split("\n")
+        .filter((line) => line.startsWith("data:"))
+        .map((line) => line.slice(5).trimStart())
+        .join("\n");
+      if (data) pushTelemetry(JSON.parse(data));
+      boundary = buffer.indexOf("\n\n");
+    }
+  }
+}
+
+function connectTelemetry() {
+  streamTelemetry()
+    .catch(() => {
+      trackingState.textContent = "Connection lost";
+    })
+    .finally(() => {
+      // Resync the history missed while disconnected, then reconnect.
+      setTimeout(() => {
+        refreshTelemetry()
+          .catch(() => {})
+          .finally(connectTelemetry);
+      }, 2000);
+    });
+}
+
+function indexOfSequence(bytes, sequence, from = 0) {
+  outer: for (let i = from; i <= bytes.length - sequence.length; i += 1) {
+    for (let j = 0; j < sequence.length; j += 1) {
+      if (bytes[i + j] !== sequence[j]) continue outer;
+    }
+    return i;
+  }
+  return -1;
+}
+
+function showPreviewFrame(jpeg) {
+  const previousUrl = previewImage.src;
+  previewImage.src = URL.createObjectURL(new Blob([jpeg], { type: "image/jpeg" }));
+  previewImage.className = "live";
+  if (previousUrl.startsWith("blob:")) URL.revokeObjectURL(previousUrl);
+}
+
+// <img src> cannot send x-api-key, so the multipart stream is read with fetch
+// and each JPEG part is handed to the image as a blob URL.
+async function readPreview(signal) {
+  const response = await fetch("/v1/stream.mjpg", { headers: getHeaders(), signal });
+  if (!response.ok || !response.body) {
+    const body = await response.json().catch(() => ({}));
+    throw new Error(body.detail || `HTTP ${response.status}`);
+  }
+
+  const separator = new TextEncoder().encode("\r\n\r\n");
+  const reader = response.body.getReader();
+  let buffer = new Uint8Array(0);
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) return;
+    const merged = new Uint8Array(buffer.length + value.length);
+    merged.set(buffer);
+    merged.set(value, buffer.length);
+    buffer = merged;
+
+    for (;;) {
+      const headerEnd = indexOfSequence(buffer, separator);
+      if (headerEnd < 0) break;
+      const headers = new TextDecoder().decode(buffer.subarray(0, headerEnd));
+      const match = /content-length:\s*(\d+)/i.exec(headers);
+      if (!match) throw new Error("Malformed preview stream.");
+      const start = headerEnd + separator.length;
+      const end = start + Number(match[1]);
+      if (buffer.length < end + 2) break;
+      showPreviewFrame(buffer.slice(start, end));
+      buffer = buffer.slice(end + 2);
+    }
+  }
+}
+
+function stopPreview(message = "Preview stopped.") {
+  if (previewController) previewController.abort();
+  previewController = null;
+  previewImage.className = "";
+  previewState.textContent = message;
+  togglePreviewBtn.textContent = "Start preview";
+}
+
+function startPreview() {
+  const controller = new AbortController();
+  previewController = controller;
+  previewState.textContent = "Connecting...";
+  togglePreviewBtn.textContent = "Stop preview";
+  readPreview(controller.signal)
+    .then(() => {
+      if (previewController === controller) stopPreview("Preview ended.");
+    })
+    .catch((error) => {
+      if (previewController === controller) stopPreview(error.message);
+    });
 }
 
 function renderProfiles(payload) {
@@ -171,6 +305,11 @@ refreshProfilesBtn.addEventListener("click", () => {
 
 profileForm.addEventListener("submit", submitProfile);
 
+togglePreviewBtn.addEventListener("click", () => {
+  if (previewController) stopPreview();
+  else startPreview();
+});
+
 async function bootstrap() {
   try {
     await refreshProfiles();
@@ -181,9 +320,4 @@ async function bootstrap() {
   }
 }
 
-bootstrap();
-setInterval(() => {
-  refreshTelemetry().catch(() => {
-    trackingState.textContent = "Connection lost";
-  });
-}, 1200);
+bootstrap().finally(connectTelemetry);
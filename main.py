@@ -10,14 +10,19 @@ from __future__ import annotations
 import argparse
 import logging
 import threading
+from typing import TYPE_CHECKING
 
-import uvicorn
-
-from src.api.app import create_api_app, run_api_server
-from src.app.runner import VirtualControllerApp
 from src.utils.config import AppConfig, load_config
 from src.utils.logger import configure_logging
 
+# Each mode imports its own stack inside main(): the API does not need
+# OpenCV/MediaPipe and the bare controller does not need FastAPI/uvicorn.
+# benchmarks/startup.py measures the cold start of every mode.
+if TYPE_CHECKING:
+    from src.ports import ProfileStorePort
+    from src.services.flight_recorder import FlightRecorder
+    from src.services.preview_service import PreviewService
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -56,8 +61,24 @@ def _override_config(config: AppConfig, args: argparse.Namespace) -> AppConfig:
     return config
 
 
-def _start_api_background(config: AppConfig) -> threading.Thread:
-    app = create_api_app(config=config)
+def _start_api_background(
+    config: AppConfig,
+    preview: PreviewService,
+    profile_service: ProfileStorePort,
+    flight_recorder: FlightRecorder,
+) -> threading.Thread:
+    import uvicorn
+
+    from src.api.app import create_api_app
+
+    # Sharing the controller's store lets API writes reach it through the
+    # in-process change listeners instead of the polling interval.
+    app = create_api_app(
+        config=config,
+        profile_service=profile_service,
+        preview_service=preview,
+        flight_recorder=flight_recorder,
+    )
     thread = threading.Thread(
         target=uvicorn.run,
         kwargs={
@@ -75,25 +96,33 @@ def _start_api_background(config: AppConfig) -> threading.Thread:
 def main() -> None:
     args = parse_args()
     config = _override_config(load_config(), args)
-    configure_logging(config.log_level, config.logs_dir)
+    configure_logging(config.log_level, config.logs_dir, queue_size=config.log_queue_size)
     logger = logging.getLogger("main")
 
     if args.mode == "api":
+        from src.api.app import run_api_server
+
         logger.info("Starting in API mode on %s:%s", config.api_host, config.api_port)
         run_api_server(config)
         return
 
+    from src.app.runner import VirtualControllerApp
+
+    preview: PreviewService | None = None
     if args.mode == "all":
+        from src.services.preview_service import PreviewService
+
+        preview = PreviewService(config.preview_max_fps, config.preview_jpeg_quality)
+
+    app = VirtualControllerApp(config, preview=preview, initial_profile=args.profile)
+    if preview is not None:
         logger.info("Starting API in background on %s:%s", config.api_host, config.api_port)
-        _start_api_background(config)
-
-    app = VirtualControllerApp(config)
-    if args.profile:
-        try:
-            app.profile = app.profile_service.activate_profile(args.profile)
-        except (FileNotFoundError, ValueError) as exc:
-            logger.warning("Could not activate profile '%s': %s", args.profile, exc)
-    app.run()
+        _start_api_background(config, preview, app.profile_service, app.flight)
+    try:
+        app.run()
+    finally:
+        if preview is not None:
+            preview.close()
 
 
 if __name__ == "__main__":
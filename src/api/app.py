@@ -1,38 +1,145 @@
 from __future__ import annotations
 
-from typing import Any
+import concurrent.futures
+import secrets
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Annotated, Any, Literal
 
 import uvicorn
-from fastapi import Depends, FastAPI, HTTPException, status
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
+from fastapi.responses import PlainTextResponse, RedirectResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 
+from src.api.cache import ResponseCache
+from src.api.metrics import PROMETHEUS_CONTENT_TYPE, RequestLatencyMiddleware
 from src.api.schemas import (
+    CalibrationPayload,
+    CalibrationResponse,
+    FlightDumpItem,
+    FlightDumpListResponse,
+    FlightDumpResponse,
     HealthResponse,
     ProfileActionResponse,
     ProfileListResponse,
     ProfilePayload,
+    RollupResponse,
     TelemetryResponse,
 )
 from src.api.security import api_key_guard
+from src.api.serialization import EncodedTelemetry, TelemetryFormatter
+from src.api.telemetry_stream import TelemetryBroadcaster
 from src.domain.models import Profile
-from src.services.profile_service import ProfileService
+from src.infrastructure.telemetry_channel import TelemetryChannelReader
+from src.ports import ProfileStorePort
+from src.services.calibration_service import CalibrationService
+from src.services.flight_recorder import DUMP_NAME_PATTERN, FlightRecorder, list_dumps
+from src.services.preview_service import PreviewService
+from src.services.profile_service import create_profile_service
+from src.services.telemetry_rollup import RollupFollower
 from src.services.telemetry_service import TelemetryService
 from src.utils.config import AppConfig, load_config
+from src.utils.metrics import REGISTRY
+
+_MJPEG_BOUNDARY = "frame"
+_ROLLUP_DEFAULT_WINDOW = {"second": timedelta(minutes=5), "minute": timedelta(hours=1)}
+# The channel keeps telemetry_max_history samples (minutes at the controller's
+# publish rate); draining it this often keeps the shared rollups exact.
+_ROLLUP_FOLLOW_INTERVAL_S = 1.0
+
+
+async def _multipart_jpeg(frames: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Wrap JPEG payloads as ``multipart/x-mixed-replace`` parts."""
+    async for jpeg in frames:
+        yield (
+            (
+                f"--{_MJPEG_BOUNDARY}\r\n"
+                "Content-Type: image/jpeg\r\n"
+                f"Content-Length: {len(jpeg)}\r\n\r\n"
+            ).encode("ascii")
+            + jpeg
+            + b"\r\n"
+        )
+
+
+def _json_response(body: bytes, headers: dict[str, str] | None = None) -> Response:
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """RFC 9110 weak comparison of *etag* against an ``If-None-Match`` header."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def _as_utc(moment: datetime) -> datetime:
+    """Treat naive query datetimes as UTC, matching the telemetry timestamps."""
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc)
 
 
 def create_api_app(
     config: AppConfig | None = None,
-    profile_service: ProfileService | None = None,
+    profile_service: ProfileStorePort | None = None,
     telemetry_service: TelemetryService | None = None,
+    preview_service: PreviewService | None = None,
+    flight_recorder: FlightRecorder | None = None,
 ) -> FastAPI:
     cfg = config or load_config()
-    profiles = profile_service or ProfileService(cfg.profiles_dir, cfg.active_profile_file)
-    telemetry = telemetry_service or TelemetryService(cfg.telemetry_file)
+    profiles = profile_service or create_profile_service(
+        cfg.profile_store,
+        cfg.profiles_dir,
+        cfg.active_profile_file,
+        cfg.profiles_db_file,
+        stat_interval_s=cfg.profile_stat_interval_ms / 1000,
+    )
+    telemetry = telemetry_service or TelemetryService(
+        cfg.telemetry_file, max_history=cfg.telemetry_max_history
+    )
+    # A controller in another process (or the same one, in --mode all) publishes
+    # through shared memory; the file-backed service is the fallback before it starts.
+    shared_telemetry = (
+        None if telemetry_service else TelemetryChannelReader(cfg.telemetry_channel_file)
+    )
     guard = api_key_guard(cfg.api_key)
 
+    def telemetry_source() -> TelemetryService | TelemetryChannelReader:
+        if shared_telemetry is not None and shared_telemetry.total:
+            return shared_telemetry
+        return telemetry
+
+    broadcaster = TelemetryBroadcaster(telemetry_source)
+    formatter = TelemetryFormatter()
+    # Distinguishes ETags issued by this process from those of a previous run,
+    # whose sample counter may have reached the same value with other data.
+    etag_token = secrets.token_hex(4)
+    cache = ResponseCache()
+    # Rollups for the shared channel start from the log, like the file-backed
+    # service's, and are drained in the background while the app runs.
+    shared_rollups = RollupFollower().seed(
+        telemetry.history(limit=cfg.telemetry_max_history) if shared_telemetry else ()
+    )
+    calibration = CalibrationService(profiles)
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        if shared_telemetry is None:
+            yield
+            return
+        shared_rollups.follow(shared_telemetry, _ROLLUP_FOLLOW_INTERVAL_S)
+        try:
+            yield
+        finally:
+            shared_rollups.stop()
+
     app = FastAPI(
+        lifespan=lifespan,
         title="Subway Surf Motion Controller API",
         version="3.1.0",
         description=(
@@ -57,6 +164,7 @@ def create_api_app(
         allow_headers=["*"],
         allow_credentials=False,
     )
+    app.add_middleware(RequestLatencyMiddleware)
 
     dashboard_dir = cfg.project_root / "dashboard"
     if dashboard_dir.exists():
@@ -77,28 +185,49 @@ def create_api_app(
         return HealthResponse(status="ok", service="subway-surf-motion-api")
 
     @app.get("/v1/config", dependencies=[Depends(guard)])
-    def get_runtime_config() -> dict[str, Any]:
-        data: dict[str, Any] = cfg.to_public_dict()
-        data["active_profile"] = profiles.get_active_profile_name()
-        return data
+    def get_runtime_config() -> Response:
+        def build() -> dict[str, Any]:
+            data: dict[str, Any] = cfg.to_public_dict()
+            data["active_profile"] = profiles.get_active_profile_name()
+            return data
+
+        return _json_response(cache.get("config", profiles.version, build))
 
     @app.get("/v1/profiles", dependencies=[Depends(guard)], response_model=ProfileListResponse)
-    def list_profiles() -> dict[str, Any]:
-        active = profiles.get_active_profile_name()
-        return {
-            "active": active,
-            "items": [p.to_dict() for p in profiles.list_profiles()],
-        }
+    def list_profiles(
+        offset: Annotated[int, Query(ge=0)] = 0,
+        limit: Annotated[int | None, Query(ge=1, le=500)] = None,
+    ) -> Response:
+        def build() -> dict[str, Any]:
+            if limit is None:
+                everything = profiles.list_profiles()
+                items, total = everything[offset:], len(everything)
+            else:
+                items, total = profiles.list_page(offset, limit)
+            listing = ProfileListResponse.model_validate(
+                {
+                    "active": profiles.get_active_profile_name(),
+                    "total": total,
+                    "items": [p.to_dict() for p in items],
+                }
+            )
+            return listing.model_dump()
+
+        body = cache.get(("profiles", offset, limit), profiles.version, build)
+        return _json_response(body)
 
     @app.get("/v1/profiles/{name}", dependencies=[Depends(guard)])
-    def get_profile(name: str) -> dict[str, Any]:
+    def get_profile(name: str) -> Response:
+        def build() -> dict[str, Any]:
+            return profiles.get_profile(name).to_dict()
+
         try:
-            profile = profiles.get_profile(name)
+            body = cache.get(("profile", name), profiles.version, build)
         except FileNotFoundError as exc:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
         except ValueError as exc:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
-        return profile.to_dict()
+        return _json_response(body)
 
     @app.put(
         "/v1/profiles/{name}",
@@ -137,12 +266,165 @@ def create_api_app(
         except ValueError as exc:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
-    @app.get("/v1/telemetry", dependencies=[Depends(guard)], response_model=TelemetryResponse)
-    def get_telemetry(limit: int = 30) -> TelemetryResponse:
-        latest = telemetry.latest()
-        return TelemetryResponse(
-            latest=latest.to_dict() if latest else None,
-            history=telemetry.history(limit=limit),
+    @app.post(
+        "/v1/profiles/{name}/calibrate",
+        dependencies=[Depends(guard)],
+        response_model=CalibrationResponse,
+    )
+    def calibrate_profile(name: str, payload: CalibrationPayload) -> CalibrationResponse:
+        window = min(payload.window or cfg.telemetry_max_history, cfg.telemetry_max_history)
+        history = telemetry_source().history(limit=window)
+        samples = [record["center_x"] for record in history if record["has_hand"]]
+        try:
+            profile, fit = calibration.calibrate(samples, name=name, activate=payload.activate)
+        except ValueError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+        return CalibrationResponse(
+            status="activated" if payload.activate else "saved",
+            profile=profile.to_dict(),
+            centers=list(fit.centers),
+            samples=fit.samples,
+        )
+
+    @app.get(
+        "/v1/telemetry",
+        dependencies=[Depends(guard)],
+        response_model=TelemetryResponse,
+        responses={304: {"description": "Nenhuma amostra nova desde o ETag informado."}},
+    )
+    def get_telemetry(
+        # A default rather than Annotated: string annotations cannot see `cfg`.
+        limit: int = Query(30, ge=1, le=cfg.telemetry_max_history),
+        since: Annotated[int | None, Query(ge=0)] = None,
+        if_none_match: Annotated[str | None, Header()] = None,
+    ) -> Response:
+        source = telemetry_source()
+        total = source.total
+        kind = "shm" if source is shared_telemetry else "log"
+        etag = f'"{etag_token}-{kind}-{total}-{limit}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        if since is not None and since > total:
+            since = None  # the store was reset since the cursor was issued: full window
+
+        def build() -> EncodedTelemetry:
+            # The whole window, filtered by seq per request: samples published
+            # after reading total cannot push unseen ones out of a cursor's reply.
+            history = source.history(limit=limit) if total else []
+            latest = source.latest()
+            return EncodedTelemetry.build(formatter, history, latest.to_dict() if latest else None)
+
+        tail = cache.value(("telemetry", limit), (kind, total), build)
+        return _json_response(tail.body(since, total), headers)
+
+    @app.get(
+        "/v1/telemetry/rollups",
+        dependencies=[Depends(guard)],
+        response_model=RollupResponse,
+    )
+    def get_telemetry_rollups(
+        start: Annotated[datetime | None, Query(alias="from")] = None,
+        end: Annotated[datetime | None, Query(alias="to")] = None,
+        resolution: Literal["second", "minute"] = "minute",
+    ) -> RollupResponse:
+        end = _as_utc(end) if end else datetime.now(timezone.utc)
+        start = _as_utc(start) if start else end - _ROLLUP_DEFAULT_WINDOW[resolution]
+        if start >= end:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="'from' must be before 'to'."
+            )
+
+        if shared_telemetry is None:
+            buckets = telemetry.rollups(start.timestamp(), end.timestamp(), resolution)
+        else:
+            shared_rollups.catch_up(shared_telemetry)
+            buckets = shared_rollups.query(start.timestamp(), end.timestamp(), resolution)
+        return RollupResponse.model_validate(
+            {
+                "resolution": resolution,
+                "from": start.isoformat(timespec="seconds"),
+                "to": end.isoformat(timespec="seconds"),
+                "buckets": buckets,
+            }
+        )
+
+    @app.get("/v1/telemetry/stream", dependencies=[Depends(guard)])
+    def stream_telemetry() -> StreamingResponse:
+        return StreamingResponse(
+            broadcaster.events(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"},
+        )
+
+    @app.get("/metrics", dependencies=[Depends(guard)], include_in_schema=False)
+    def metrics() -> PlainTextResponse:
+        # Counters live in this process: controller metrics only appear here
+        # when the controller runs alongside the API (--mode all).
+        return PlainTextResponse(REGISTRY.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+    @app.post(
+        "/v1/flight-recorder/dump",
+        dependencies=[Depends(guard)],
+        response_model=FlightDumpResponse,
+    )
+    def dump_flight_recorder() -> FlightDumpResponse:
+        if flight_recorder is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="The flight recorder runs in the controller process (--mode all).",
+            )
+        frames = len(flight_recorder)
+        # Caught before OSError: from Python 3.11 this is the builtin TimeoutError.
+        try:
+            path = flight_recorder.dump("api").result(timeout=10.0)
+        except concurrent.futures.TimeoutError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="The flight recorder dump is still being written; try again later.",
+            ) from exc
+        except OSError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Could not write the flight recorder dump: {exc}",
+            ) from exc
+        return FlightDumpResponse(status="dumped", name=path.name, frames=frames)
+
+    @app.get(
+        "/v1/flight-recorder/dumps",
+        dependencies=[Depends(guard)],
+        response_model=FlightDumpListResponse,
+    )
+    def list_flight_dumps() -> FlightDumpListResponse:
+        # Read from disk, so dumps written by a controller in another process show up too.
+        return FlightDumpListResponse(
+            items=[
+                FlightDumpItem(name=path.name, size_bytes=path.stat().st_size)
+                for path in list_dumps(cfg.flight_dump_dir)
+            ]
+        )
+
+    @app.get("/v1/flight-recorder/dumps/{name}", dependencies=[Depends(guard)])
+    def get_flight_dump(name: str) -> Response:
+        path = cfg.flight_dump_dir / name
+        if not DUMP_NAME_PATTERN.match(name) or not path.is_file():
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail=f"Dump '{name}' not found."
+            )
+        return _json_response(path.read_bytes())
+
+    @app.get("/v1/stream.mjpg", dependencies=[Depends(guard)])
+    def stream_preview() -> StreamingResponse:
+        if preview_service is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Live preview requires the controller in the same process (--mode all).",
+            )
+        return StreamingResponse(
+            _multipart_jpeg(preview_service.frames()),
+            media_type=f"multipart/x-mixed-replace; boundary={_MJPEG_BOUNDARY}",
+            headers={"Cache-Control": "no-store"},
         )
 
     return app
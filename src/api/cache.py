@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Callable, Hashable
+from threading import Lock
+from typing import Any, TypeVar, cast
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - optional speed-up
+    HAS_ORJSON = False
+
+
+def json_bytes(payload: Any) -> bytes:
+    """Compact UTF-8 JSON, through orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+T = TypeVar("T")
+
+
+class ResponseCache:
+    """Serialized JSON bodies keyed by request, tagged with a source version.
+
+    Callers pass the current version of whatever the body was built from
+    (``ProfileService.version``, the telemetry sample count, ...).  A hit is
+    a dict lookup and a version comparison; a miss, or a version change,
+    rebuilds and re-encodes the body once.  Once *max_entries* distinct keys
+    accumulate, the oldest key is evicted, which bounds memory for
+    parameterised endpoints.  Endpoints run on threadpool workers, so the
+    entries are guarded by a lock; builds run outside it.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self._entries: dict[Hashable, tuple[Hashable, Any]] = {}
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, version: Hashable, build: Callable[[], Any]) -> bytes:
+        """JSON body for *key*, encoded from ``build()`` when *version* changed."""
+        return self.value(key, version, lambda: json_bytes(build()))
+
+    def value(self, key: Hashable, version: Hashable, build: Callable[[], T]) -> T:
+        """Like :meth:`get`, but caches whatever *build* returns as is."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self.hits += 1
+                return cast(T, entry[1])
+            self.misses += 1
+        built = build()
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.max_entries:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (version, built)
+        return built
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.utils.metrics import API_REQUEST_LATENCY
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class RequestLatencyMiddleware:
+    """Records the time from request arrival to response start per route.
+
+    Requests are labelled with the matched route template (``/v1/profiles/{name}``),
+    never the raw path, so the number of series stays bounded.  Streaming
+    endpoints are timed until their headers go out, not for the lifetime of
+    the stream.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        observed = False
+
+        def observe() -> None:
+            nonlocal observed
+            if not observed:
+                observed = True
+                API_REQUEST_LATENCY.labels(scope["method"], _route_label(scope)).observe(
+                    time.perf_counter() - start
+                )
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                observe()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            observe()
+
+
+def _route_label(scope: Scope) -> str:
+    route: Any = scope.get("route")
+    path = getattr(route, "path", None)
+    if isinstance(path, str):
+        return path
+    return "unmatched"
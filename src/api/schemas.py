@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class ProfilePayload(BaseModel):
@@ -26,6 +26,17 @@ class ProfilePayload(BaseModel):
         return self
 
 
+class CalibrationPayload(BaseModel):
+    """Request body for POST /v1/profiles/{name}/calibrate.
+
+    ``window`` is how many of the latest telemetry samples to fit (all that
+    are kept when omitted); only samples with a detected hand are used.
+    """
+
+    window: int | None = Field(default=None, ge=1)
+    activate: bool = True
+
+
 class ProfileItem(BaseModel):
     """Single profile as returned by the API."""
 
@@ -40,9 +51,10 @@ class ProfileItem(BaseModel):
 
 
 class ProfileListResponse(BaseModel):
-    """Response for GET /v1/profiles."""
+    """Response for GET /v1/profiles (``total`` counts all profiles, not just this page)."""
 
     active: str
+    total: int = 0
     items: list[ProfileItem]
 
 
@@ -53,13 +65,71 @@ class ProfileActionResponse(BaseModel):
     profile: dict[str, Any]
 
 
+class CalibrationResponse(BaseModel):
+    """Response for POST /v1/profiles/{name}/calibrate."""
+
+    status: str
+    profile: dict[str, Any]
+    centers: list[float]
+    samples: int
+
+
+class FlightDumpItem(BaseModel):
+    """One flight recorder dump file."""
+
+    name: str
+    size_bytes: int
+
+
+class FlightDumpListResponse(BaseModel):
+    """Response for GET /v1/flight-recorder/dumps (newest first)."""
+
+    items: list[FlightDumpItem] = Field(default_factory=list)
+
+
+class FlightDumpResponse(BaseModel):
+    """Response for POST /v1/flight-recorder/dump."""
+
+    status: str
+    name: str
+    frames: int
+
+
 class TelemetryResponse(BaseModel):
-    """Response for GET /v1/telemetry."""
+    """Response for GET /v1/telemetry.
+
+    ``seq`` is the newest sample covered by the response; pass it back as
+    ``since`` to receive only later samples.
+    """
 
+    seq: int = 0
     latest: dict[str, Any] | None = None
     history: list[dict[str, Any]] = Field(default_factory=list)
 
 
+class RollupBucket(BaseModel):
+    """One aggregated time bucket of telemetry."""
+
+    start: str
+    samples: int
+    fps_min: int
+    fps_avg: float
+    fps_max: int
+    hand_ratio: float
+    actions: dict[str, int]
+
+
+class RollupResponse(BaseModel):
+    """Response for GET /v1/telemetry/rollups."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    resolution: str
+    from_: str = Field(alias="from")
+    to: str
+    buckets: list[RollupBucket]
+
+
 class HealthResponse(BaseModel):
     """Response for GET /v1/health."""
 
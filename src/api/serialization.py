@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import Any, NamedTuple
+
+from src.api.cache import json_bytes
+from src.domain.models import iso_timestamp
+
+_NS_PER_SECOND = 1_000_000_000
+
+
+class TelemetryFormatter:
+    """Adds the ISO-8601 ``timestamp`` to telemetry records at response time.
+
+    Records carry integer ``timestamp_ns`` values end to end; the string form
+    is only produced here.  Formatted seconds are memoised, since consecutive
+    samples mostly share the same second.
+    """
+
+    def __init__(self) -> None:
+        self._stamps: dict[int, str] = {}
+
+    def item(self, record: dict[str, Any]) -> dict[str, Any]:
+        timestamp_ns = record.get("timestamp_ns")
+        if timestamp_ns is None:
+            return record
+        second = timestamp_ns // _NS_PER_SECOND
+        stamp = self._stamps.get(second)
+        if stamp is None:
+            if len(self._stamps) >= 1024:
+                self._stamps.clear()
+            stamp = self._stamps[second] = iso_timestamp(second)
+        return {**record, "timestamp": stamp}
+
+    def items(self, records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        return [self.item(record) for record in records]
+
+
+class EncodedTelemetry(NamedTuple):
+    """The newest telemetry samples, each encoded once, sliced per cursor.
+
+    ``/v1/telemetry`` caches one of these per ``limit`` and sample count, so
+    clients polling with different ``since`` cursors share it instead of
+    each filling the response cache with its own body.
+    """
+
+    latest: bytes
+    seqs: list[int]
+    items: list[bytes]
+
+    @classmethod
+    def build(
+        cls,
+        formatter: TelemetryFormatter,
+        history: list[dict[str, Any]],
+        latest: dict[str, Any] | None,
+    ) -> EncodedTelemetry:
+        return cls(
+            latest=json_bytes(formatter.item(latest)) if latest is not None else b"null",
+            seqs=[record["seq"] for record in history],
+            items=[json_bytes(item) for item in formatter.items(history)],
+        )
+
+    def body(self, since: int | None, total: int) -> bytes:
+        """``TelemetryResponse`` JSON with the samples after *since*."""
+        start = 0 if since is None else bisect_right(self.seqs, since)
+        seq = self.seqs[-1] if self.seqs else total
+        history = b",".join(self.items[start:])
+        return b'{"seq":%d,"latest":%s,"history":[%s]}' % (seq, self.latest, history)
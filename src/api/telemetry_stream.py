@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+from collections.abc import AsyncIterator, Callable
+
+from src.api.serialization import TelemetryFormatter
+from src.ports import TelemetryFeedPort
+
+_KEEPALIVE = b": keepalive\n\n"
+# Extra samples requested beyond ``total - seen``: anything published between
+# reading ``total`` and calling ``history`` still fits in the window.
+_RACE_MARGIN = 32
+
+
+class TelemetryBroadcaster:
+    """Pushes each new telemetry sample to every Server-Sent Events subscriber.
+
+    One polling task per event loop watches the feed's ``total`` counter and,
+    when it grows, reads the tail of the history and delivers the samples
+    whose ``seq`` is past the last one sent.  Each is encoded as an SSE frame
+    once and the same bytes are offered to every subscriber.  Each subscriber has
+    its own bounded queue: a slow client loses its oldest pending frames
+    (counted in :attr:`dropped`) instead of delaying anyone else.  The task
+    only runs while at least one client is connected.
+    """
+
+    def __init__(
+        self,
+        feed: Callable[[], TelemetryFeedPort],
+        poll_interval_s: float = 0.05,
+        queue_size: int = 64,
+    ) -> None:
+        self._feed = feed
+        self.poll_interval_s = poll_interval_s
+        self.queue_size = queue_size
+        self._subscribers: set[asyncio.Queue[bytes]] = set()
+        self._task: asyncio.Task[None] | None = None
+        self._dropped = 0
+        self._formatter = TelemetryFormatter()
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subscribers)
+
+    @property
+    def dropped(self) -> int:
+        """Frames discarded because a subscriber's queue was full."""
+        return self._dropped
+
+    def subscribe(self) -> asyncio.Queue[bytes]:
+        """Register a client; must be called from the event loop."""
+        queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.add(queue)
+        if self._task is None or self._task.done():
+            # Capture the starting point now so samples published before the
+            # task first runs are still delivered.
+            feed = self._feed()
+            self._task = asyncio.get_running_loop().create_task(self._poll(feed, feed.total))
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[bytes]) -> None:
+        self._subscribers.discard(queue)
+        if not self._subscribers and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def events(self, keepalive_s: float = 15.0) -> AsyncIterator[bytes]:
+        """SSE byte stream for one client, ending when the client goes away."""
+        queue = self.subscribe()
+        try:
+            yield b"retry: 2000\n\n"
+            while True:
+                try:
+                    yield await asyncio.wait_for(queue.get(), keepalive_s)
+                except asyncio.TimeoutError:
+                    yield _KEEPALIVE
+        finally:
+            self.unsubscribe(queue)
+
+    def broadcast(self, frame: bytes) -> None:
+        for queue in self._subscribers:
+            if queue.full():
+                with contextlib.suppress(asyncio.QueueEmpty):
+                    queue.get_nowait()
+                self._dropped += 1
+            queue.put_nowait(frame)
+
+    async def _poll(self, feed: TelemetryFeedPort, seen: int) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval_s)
+            current = self._feed()
+            total = current.total
+            if current is not feed or total < seen:
+                # The source switched (e.g. the controller came online) or restarted.
+                feed, seen = current, total
+                continue
+            if total == seen:
+                continue
+            # Filter on seq rather than trusting the count: samples published
+            # after reading total are sent now and skipped on the next poll.
+            for record in feed.history(limit=total - seen + _RACE_MARGIN):
+                seq = record["seq"]
+                if seq <= seen:
+                    continue
+                data = json.dumps(self._formatter.item(record), separators=(",", ":"))
+                # The SSE id is the sample's seq, the same cursor /v1/telemetry accepts.
+                self.broadcast(f"id: {seq}\nevent: telemetry\ndata: {data}\n\n".encode())
+                seen = seq
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from typing import Any
 
 import cv2
@@ -12,24 +15,71 @@ from src.domain.actions import Action
 from src.domain.models import GestureSnapshot, Profile, TelemetrySnapshot
 from src.infrastructure.camera import CameraStream
 from src.infrastructure.keyboard_adapter import KeyboardAdapter
+from src.infrastructure.telemetry_channel import TelemetryChannel
+from src.services.calibration_service import (
+    CalibrationService,
+    CalibrationSession,
+    LaneFit,
+)
+from src.services.flight_recorder import FlightRecorder
 from src.services.gesture_service import GestureInterpreter
-from src.services.profile_service import ProfileService
+from src.services.preview_service import PreviewService
+from src.services.profile_service import create_profile_service
+from src.services.profile_watcher import ProfileWatcher
 from src.services.telemetry_service import TelemetryService
 from src.ui.display import HUD
 from src.utils.config import AppConfig
+from src.utils.logger import RateLimitedLogger, log_queue_depth
+from src.utils.metrics import (
+    ACTIONS_EMITTED,
+    DETECTOR_LATENCY,
+    FRAMES_DROPPED,
+    FRAMES_PROCESSED,
+    LOOP_LATENCY,
+    TELEMETRY_PUBLISH_LATENCY,
+)
+
+# Consecutive failed reads that dump the flight recorder (the loop gives up at 30).
+_READ_FAILURES_BEFORE_DUMP = 5
 
 
 class VirtualControllerApp:
-    def __init__(self, config: AppConfig):
+    def __init__(
+        self,
+        config: AppConfig,
+        preview: PreviewService | None = None,
+        initial_profile: str | None = None,
+    ):
         self.config = config
+        self.preview = preview
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.profile_service = ProfileService(config.profiles_dir, config.active_profile_file)
-        self.telemetry = TelemetryService(config.telemetry_file)
+        self._frame_log = RateLimitedLogger(self.logger)
+        self.flight = FlightRecorder(
+            config.flight_dump_dir,
+            capacity=config.flight_recorder_frames,
+            spike_ms=config.flight_spike_ms,
+        )
+        # The profile store is built up front: it decides the detector
+        # settings, and --mode all hands it to the API before run().
+        self.profile_service = create_profile_service(
+            config.profile_store,
+            config.profiles_dir,
+            config.active_profile_file,
+            config.profiles_db_file,
+            stat_interval_s=config.profile_stat_interval_ms / 1000,
+        )
+        if initial_profile:
+            try:
+                self.profile_service.activate_profile(initial_profile)
+            except (FileNotFoundError, ValueError) as exc:
+                self.logger.warning("Could not activate profile '%s': %s", initial_profile, exc)
+        # Built concurrently by _start_up() while the splash screen is shown.
+        self.telemetry: TelemetryService
+        self.detector: HandDetector
         self.hud = HUD()
         self.camera = CameraStream(config.camera_index, config.frame_width, config.frame_height)
 
         self.profile = self.profile_service.get_active_profile()
-        self.detector = self._create_detector(self.profile)
         self.gesture = GestureInterpreter(self.profile.left_bound, self.profile.right_bound)
         self.keyboard = KeyboardAdapter(config.key_map, cooldown_ms=self.profile.cooldown_ms)
         self.controller = GameController(
@@ -41,20 +91,51 @@ class VirtualControllerApp:
         self._last_frame_time = time.perf_counter()
         self._last_telemetry_push = time.perf_counter()
         self._fps = 0
+        self._action_counters = {action: ACTIONS_EMITTED.labels(action.value) for action in Action}
 
-    def run(self) -> None:
-        if not self.camera.open():
-            raise RuntimeError("Could not open webcam. Check CAMERA_INDEX and camera permissions.")
+        # Profile changes (API, dashboard, another process, the "p" key) are
+        # prepared on the watcher thread and swapped in between frames.
+        self._pending_profile: tuple[Profile, HandDetector | None] | None = None
+        # Last profile handed to the frame loop; read and written by the watcher
+        # thread under _pending_lock, never compared with the live self.profile.
+        self._prepared_profile = self.profile
+        self._pending_lock = threading.Lock()
+        self._profile_watcher = ProfileWatcher(
+            self.profile_service,
+            self._prepare_profile,
+            current=self.profile,
+            interval_s=config.profile_watch_ms / 1000,
+        )
+        self.calibration = CalibrationService(self.profile_service)
+        self._calibration_session: CalibrationSession | None = None
+        # Saving writes JSON/SQLite; the watcher then applies the new profile.
+        self._calibration_writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="calibration"
+        )
 
+    def run(self) -> None:
+        self._start_up()
         self.logger.info("Controller started with profile '%s'.", self.profile.name)
-        self.hud.show_startup_screen(self.config.window_title)
+        self._profile_watcher.start()
 
         read_failures = 0
         try:
             while self.camera.is_opened():
+                if self._pending_profile is not None:
+                    self._apply_pending_profile()
+                read_start = time.perf_counter()
                 success, frame = self.camera.read()
+                frame_start = time.perf_counter()
+                read_ms = (frame_start - read_start) * 1000
                 if not success or frame is None:
+                    FRAMES_DROPPED.inc()
                     read_failures += 1
+                    self._frame_log.warning(
+                        "camera-read", "Camera read failed (%d in a row).", read_failures
+                    )
+                    self._record_frame(False, read_failures, read_ms, 0.0, 0.0, read_ms, None)
+                    if read_failures == _READ_FAILURES_BEFORE_DUMP:
+                        self.flight.trigger("read-failures")
                     if read_failures > 30:
                         raise RuntimeError("Camera read failed for too long.")
                     continue
@@ -62,12 +143,19 @@ class VirtualControllerApp:
 
                 frame = cv2.flip(frame, 1)
                 rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                detect_start = time.perf_counter()
                 detection = self.detector.detect(rgb_frame)
+                detect_s = time.perf_counter() - detect_start
+                DETECTOR_LATENCY.observe(detect_s)
 
                 snapshot = self._resolve_snapshot(detection)
-                self.controller.perform_action(snapshot.action)
+                if self._calibration_session is not None:
+                    self._feed_calibration(snapshot)
+                if self.controller.perform_action(snapshot.action):
+                    self._action_counters[snapshot.action].inc()
 
                 self._fps = self._calculate_fps()
+                render_start = time.perf_counter()
                 rendered = self.hud.draw(
                     frame=frame,
                     snapshot=snapshot,
@@ -77,7 +165,23 @@ class VirtualControllerApp:
                 )
 
                 cv2.imshow(self.config.window_title, rendered)
+                if self.preview is not None:
+                    self.preview.submit(rendered)
+                render_ms = (time.perf_counter() - render_start) * 1000
                 self._maybe_publish_telemetry(snapshot)
+                FRAMES_PROCESSED.inc()
+                frame_end = time.perf_counter()
+                LOOP_LATENCY.observe(frame_end - frame_start)
+                self._record_frame(
+                    True,
+                    0,
+                    read_ms,
+                    detect_s * 1000,
+                    render_ms,
+                    (frame_end - read_start) * 1000,
+                    detection,
+                    snapshot,
+                )
 
                 key_code = cv2.waitKey(1) & 0xFF
                 if key_code == ord("q"):
@@ -86,13 +190,114 @@ class VirtualControllerApp:
                     self.hud.toggle_help()
                 if key_code == ord("p"):
                     self._cycle_profile()
+                if key_code == ord("c"):
+                    self._start_calibration()
+        except Exception:
+            self.flight.dump("exception")
+            raise
         finally:
             self.cleanup()
 
+    def _record_frame(
+        self,
+        read_ok: bool,
+        read_failures: int,
+        read_ms: float,
+        detect_ms: float,
+        render_ms: float,
+        loop_ms: float,
+        detection: Any,
+        snapshot: GestureSnapshot | None = None,
+    ) -> None:
+        hands = detection.hand_landmarks if detection else None
+        wrist = hands[0][0] if hands else None
+        self.flight.record(
+            read_ok=read_ok,
+            read_failures=read_failures,
+            read_ms=read_ms,
+            detect_ms=detect_ms,
+            render_ms=render_ms,
+            loop_ms=loop_ms,
+            fps=self._fps,
+            action=snapshot.action if snapshot else Action.IDLE,
+            hands=len(hands) if hands else 0,
+            center_x=snapshot.center_x if snapshot else 0.0,
+            wrist_x=wrist.x if wrist else 0.0,
+            wrist_y=wrist.y if wrist else 0.0,
+            telemetry_queue=self.telemetry.pending,
+            log_queue=log_queue_depth(),
+        )
+
+    def _start_up(self) -> None:
+        """Open the camera, load the model and bootstrap telemetry in parallel.
+
+        The splash screen is redrawn as each step finishes and closes as
+        soon as the last one does.  On failure everything that did start
+        is released before the first error is raised.
+        """
+        steps: dict[str, Callable[[], Any]] = {
+            "Camera": self._open_camera,
+            "Hand model": self._load_detector,
+            "Telemetry": self._create_telemetry,
+        }
+        with ThreadPoolExecutor(max_workers=len(steps), thread_name_prefix="startup") as pool:
+            futures = {label: pool.submit(step) for label, step in steps.items()}
+            pending = set(futures.values())
+            while True:
+                self.hud.show_startup_screen(
+                    self.config.window_title,
+                    [(label, _step_status(future)) for label, future in futures.items()],
+                )
+                if not pending:
+                    break
+                _, pending = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
+
+        failures = [exc for future in futures.values() if (exc := future.exception())]
+        if failures:
+            if futures["Camera"].exception() is None:
+                self.camera.release()
+            for label in ("Hand model", "Telemetry"):
+                if futures[label].exception() is None:
+                    futures[label].result().close()
+            raise failures[0]
+        self.detector = futures["Hand model"].result()
+        self.telemetry = futures["Telemetry"].result()
+
+    def _open_camera(self) -> None:
+        if not self.camera.open():
+            raise RuntimeError("Could not open webcam. Check CAMERA_INDEX and camera permissions.")
+
+    def _load_detector(self) -> HandDetector:
+        return self._create_detector(self.profile)
+
+    def _create_telemetry(self) -> TelemetryService:
+        config = self.config
+        return TelemetryService(
+            config.telemetry_file,
+            max_history=config.telemetry_max_history,
+            segment_max_bytes=config.telemetry_segment_bytes,
+            segment_max_age_s=config.telemetry_segment_seconds,
+            write_behind=config.telemetry_write_behind,
+            flush_interval_s=config.telemetry_flush_ms / 1000,
+            channel=TelemetryChannel(
+                config.telemetry_channel_file, capacity=config.telemetry_max_history
+            ),
+        )
+
     def cleanup(self) -> None:
         self.logger.info("Shutting down controller.")
+        self._calibration_writer.shutdown(wait=True)
+        self._profile_watcher.stop()
+        self.flight.close()
         self.camera.release()
         self.detector.close()
+        with self._pending_lock:
+            pending, self._pending_profile = self._pending_profile, None
+        if pending is not None and pending[1] is not None:
+            pending[1].close()
+        self.telemetry.close()
+        if self.telemetry.dropped:
+            self.logger.warning("Dropped %d telemetry records.", self.telemetry.dropped)
         cv2.destroyAllWindows()
 
     def _resolve_snapshot(self, detection_result: Any) -> GestureSnapshot:
@@ -122,6 +327,7 @@ class VirtualControllerApp:
                 center_x=snapshot.center_x,
             )
         )
+        TELEMETRY_PUBLISH_LATENCY.observe(time.perf_counter() - now)
 
     def _cycle_profile(self) -> None:
         profiles = self.profile_service.list_profiles()
@@ -134,23 +340,113 @@ class VirtualControllerApp:
         else:
             next_index = (names.index(current) + 1) % len(names)
             next_name = names[next_index]
+        # The watcher is notified and prepares the switch off the frame loop.
+        self.profile_service.activate_profile(next_name)
 
-        self.profile = self.profile_service.activate_profile(next_name)
-        self.logger.info("Activated profile '%s'.", self.profile.name)
-        self.gesture.update_bounds(self.profile.left_bound, self.profile.right_bound)
-        self.detector.close()
-        self.detector = self._create_detector(self.profile)
-        self.keyboard = KeyboardAdapter(self.config.key_map, cooldown_ms=self.profile.cooldown_ms)
-        self.controller = GameController(
-            keyboard=self.keyboard,
-            window_title=self.config.game_window_title,
-            auto_focus_window=self.config.auto_focus_window,
+    def _start_calibration(self) -> None:
+        self._calibration_session = CalibrationSession(self.config.calibration_seconds)
+        self.logger.info(
+            "Calibrating for %.0f s: hold the hand in the left, centre and right lanes.",
+            self.config.calibration_seconds,
+        )
+
+    def _feed_calibration(self, snapshot: GestureSnapshot) -> None:
+        session = self._calibration_session
+        if session is None:
+            return
+        if snapshot.has_hand:
+            session.add(snapshot.center_x)
+        if not session.done:
+            return
+        self._calibration_session = None
+        try:
+            profile, fit = self.calibration.fit_profile(session.samples, base=self.profile)
+        except ValueError as exc:
+            self.logger.warning("Calibration failed: %s", exc)
+            return
+        # The fit is a few k-means passes over at most a few thousand floats;
+        # the disk writes go to the worker and the switch arrives through
+        # the profile watcher like any other profile change.
+        self._calibration_writer.submit(self._save_calibration, profile, fit)
+
+    def _save_calibration(self, profile: Profile, fit: LaneFit) -> None:
+        """Calibration worker: persist and activate a fitted profile."""
+        try:
+            self.calibration.save(profile)
+        except Exception:
+            self.logger.exception("Could not save calibrated profile '%s'.", profile.name)
+            return
+        self.logger.info(
+            "Calibrated profile '%s': bounds %.3f / %.3f from %d samples.",
+            profile.name,
+            fit.left_bound,
+            fit.right_bound,
+            fit.samples,
         )
 
+    def _prepare_profile(self, profile: Profile) -> None:
+        """Watcher thread: build whatever is expensive for *profile* ahead of the swap."""
+        with self._pending_lock:
+            prepared = self._prepared_profile
+        detector: HandDetector | None = None
+        if _detector_settings(profile) != _detector_settings(prepared):
+            detector = self._create_detector(profile)
+        with self._pending_lock:
+            replaced, self._pending_profile = self._pending_profile, (profile, detector)
+            self._prepared_profile = profile
+            if detector is None and replaced is not None:
+                # Same detector settings as the profile it supersedes, which
+                # may not have been applied yet: keep the detector built for it.
+                self._pending_profile = (profile, replaced[1])
+                replaced = None
+        if replaced is not None and replaced[1] is not None:
+            replaced[1].close()
+
+    def _apply_pending_profile(self) -> None:
+        """Frame loop: swap in the prepared profile; only cheap assignments happen here."""
+        with self._pending_lock:
+            pending, self._pending_profile = self._pending_profile, None
+        if pending is None:
+            return
+        profile, detector = pending
+        previous, self.profile = self.profile, profile
+        self.gesture.update_bounds(profile.left_bound, profile.right_bound)
+        if detector is not None:
+            self.detector.close()
+            self.detector = detector
+        if profile.cooldown_ms != previous.cooldown_ms:
+            self.keyboard = KeyboardAdapter(self.config.key_map, cooldown_ms=profile.cooldown_ms)
+            self.controller = GameController(
+                keyboard=self.keyboard,
+                window_title=self.config.game_window_title,
+                auto_focus_window=self.config.auto_focus_window,
+            )
+        self.logger.info("Applied profile '%s'.", profile.name)
+
     def _create_detector(self, profile: Profile) -> HandDetector:
-        return HandDetector(
+        detector = HandDetector(
             model_path=self.config.model_path,
             detection_confidence=profile.detection_confidence,
             presence_confidence=profile.presence_confidence,
             tracking_confidence=profile.tracking_confidence,
         )
+        # Both callers run off the frame loop, so the warm-up never stalls it.
+        detector.warmup(
+            self.config.detector_warmup_frames,
+            (self.config.frame_height, self.config.frame_width),
+        )
+        return detector
+
+
+def _detector_settings(profile: Profile) -> tuple[float, float, float]:
+    return (
+        profile.detection_confidence,
+        profile.presence_confidence,
+        profile.tracking_confidence,
+    )
+
+
+def _step_status(future: Future[Any]) -> str:
+    if not future.done():
+        return "pending"
+    return "failed" if future.exception() else "ready"
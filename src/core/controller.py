@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 
 from src.domain.actions import DISCRETE_ACTIONS, Action
-from src.infrastructure.keyboard_adapter import KeyboardAdapter
+from src.ports import KeyboardPort
 
 try:
     import pygetwindow as gw
@@ -14,7 +14,7 @@ except Exception:  # pragma: no cover - unavailable on Linux/headless CI
 class GameController:
     def __init__(
         self,
-        keyboard: KeyboardAdapter,
+        keyboard: KeyboardPort,
         window_title: str,
         auto_focus_window: bool = True,
     ):
@@ -26,25 +26,29 @@ class GameController:
         self._logger = logging.getLogger(self.__class__.__name__)
         self._focus_attempted = False
 
-    def perform_action(self, action: Action) -> None:
+    def perform_action(self, action: Action) -> bool:
+        """Apply *action*; returns whether a key press was sent to the game."""
         if action == Action.IDLE:
             self._reset_discrete()
-            return
+            return False
 
         self._focus_window_once()
 
         if action in DISCRETE_ACTIONS:
             if not self._discrete_state[action] and self.keyboard.send(action):
                 self._discrete_state[action] = True
-            return
+                return True
+            return False
 
         self._reset_discrete()
         if action == Action.CENTER:
             self._last_lane_action = Action.CENTER
-            return
+            return False
 
         if action != self._last_lane_action and self.keyboard.send(action):
             self._last_lane_action = action
+            return True
+        return False
 
     def _reset_discrete(self) -> None:
         for action in self._discrete_state:
@@ -8,6 +8,8 @@ import mediapipe as mp
 import mediapipe.tasks as mp_tasks
 import numpy as np
 
+from src.core.model_assets import load_model_asset
+
 
 class HandDetector:
     """Wraps MediaPipe HandLandmarker in VIDEO mode for per-frame detection.
@@ -30,12 +32,14 @@ class HandDetector:
         self.presence_confidence = presence_confidence
         self.tracking_confidence = tracking_confidence
         self._start_time = time.perf_counter()
+        self._last_timestamp_ms = -1
         self._landmarker = self._create_landmarker()
 
     def _create_landmarker(self) -> Any:
         vision = mp_tasks.vision
         options = vision.HandLandmarkerOptions(
-            base_options=mp_tasks.BaseOptions(model_asset_path=str(self.model_path)),
+            # Shared, already-read bytes instead of a file the task re-reads.
+            base_options=mp_tasks.BaseOptions(model_asset_buffer=load_model_asset(self.model_path)),
             running_mode=vision.RunningMode.VIDEO,
             num_hands=1,
             min_hand_detection_confidence=self.detection_confidence,
@@ -49,10 +53,26 @@ class HandDetector:
 
         Returns a MediaPipe HandLandmarkerResult, or None if detection fails.
         """
-        timestamp_ms = int((time.perf_counter() - self._start_time) * 1000)
+        # VIDEO mode rejects timestamps that do not strictly increase, which
+        # back-to-back calls (warm-up, fast cameras) can produce at 1 ms resolution.
+        timestamp_ms = max(
+            int((time.perf_counter() - self._start_time) * 1000), self._last_timestamp_ms + 1
+        )
+        self._last_timestamp_ms = timestamp_ms
         mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_image)
         return self._landmarker.detect_for_video(mp_image, timestamp_ms)
 
+    def warmup(self, frames: int = 3, size: tuple[int, int] = (480, 640)) -> None:
+        """Run *frames* inferences on a blank ``(height, width)`` image.
+
+        The first calls after creating a landmarker pay for graph
+        initialisation and buffer allocation; doing it here keeps that cost
+        off the first real frames.
+        """
+        blank = np.full((size[0], size[1], 3), 127, dtype=np.uint8)
+        for _ in range(frames):
+            self.detect(blank)
+
     def close(self) -> None:
         """Release the MediaPipe landmarker and free native resources."""
         self._landmarker.close()
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from threading import Lock
+
+# path -> ((mtime_ns, size), sha256) and sha256 -> bytes: detectors created
+# from the same file, or from identical copies of it, share one buffer.
+_by_path: dict[Path, tuple[tuple[int, int], str]] = {}
+_by_digest: dict[str, bytes] = {}
+_lock = Lock()
+
+
+def load_model_asset(path: Path) -> bytes:
+    """Contents of the model file at *path*, read from disk only when it changed.
+
+    A cache hit costs one ``stat``.  When the file's mtime or size changes it
+    is read again and hashed; buffers no longer referenced by any path are
+    dropped.
+
+    Raises:
+        FileNotFoundError: *path* does not exist.
+    """
+    resolved = path.resolve()
+    stat = resolved.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    with _lock:
+        entry = _by_path.get(resolved)
+        if entry is not None and entry[0] == stamp:
+            return _by_digest[entry[1]]
+
+    data = resolved.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    with _lock:
+        data = _by_digest.setdefault(digest, data)
+        _by_path[resolved] = (stamp, digest)
+        live = {known for _, known in _by_path.values()}
+        for stale in _by_digest.keys() - live:
+            del _by_digest[stale]
+    return data
+
+
+def model_cache_size() -> int:
+    """Number of distinct model buffers held in memory."""
+    with _lock:
+        return len(_by_digest)
+
+
+def clear_model_cache() -> None:
+    with _lock:
+        _by_path.clear()
+        _by_digest.clear()
@@ -1,14 +1,42 @@
 from __future__ import annotations
 
 import re
+import time
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from .actions import Action, parse_action
 
 PROFILE_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,40}$")
 
+# Wall clock minus monotonic clock, sampled once per process.  Adding it to a
+# ``time.monotonic_ns()`` stamp yields Unix epoch nanoseconds without reading
+# the wall clock (or formatting a date) for every sample.
+EPOCH_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+
+_UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def iso_timestamp(epoch_seconds: float) -> str:
+    """Format Unix epoch seconds as the ISO-8601 UTC string used in telemetry."""
+    return datetime.fromtimestamp(epoch_seconds, timezone.utc).isoformat(timespec="seconds")
+
+
+def monotonic_ns_at(epoch_ns: int) -> int:
+    """The ``time.monotonic_ns()`` reading of this process at Unix epoch *epoch_ns*."""
+    return epoch_ns - EPOCH_OFFSET_NS
+
+
+def _parse_epoch_ns(stamp: str) -> int | None:
+    try:
+        parsed = datetime.fromisoformat(stamp)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return (parsed - _UNIX_EPOCH) // timedelta(microseconds=1) * 1000
+
 
 @dataclass(slots=True)
 class Profile:
@@ -82,14 +110,33 @@ class GestureSnapshot:
 
 @dataclass(slots=True)
 class TelemetrySnapshot:
+    """One telemetry sample.
+
+    The sample time is a ``time.monotonic_ns()`` stamp, which is cheap to take
+    and gives exact intervals between samples; wall-clock values are derived
+    from it through :data:`EPOCH_OFFSET_NS` only when asked for.
+    """
+
     action: Action
     fps: int
     has_hand: bool
     profile: str
     center_x: float
-    timestamp: str = field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat(timespec="seconds")
-    )
+    monotonic_ns: int = field(default_factory=time.monotonic_ns)
+
+    @property
+    def timestamp_ns(self) -> int:
+        """Sample time in nanoseconds since the Unix epoch."""
+        return self.monotonic_ns + EPOCH_OFFSET_NS
+
+    @property
+    def epoch_seconds(self) -> float:
+        return self.timestamp_ns / 1e9
+
+    @property
+    def timestamp(self) -> str:
+        """ISO-8601 UTC rendering of the sample time, formatted on each access."""
+        return iso_timestamp(self.epoch_seconds)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -98,17 +145,22 @@ class TelemetrySnapshot:
             "has_hand": self.has_hand,
             "profile": self.profile,
             "center_x": round(self.center_x, 4),
-            "timestamp": self.timestamp,
+            "timestamp_ns": self.timestamp_ns,
         }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> TelemetrySnapshot:
+        """Build a snapshot from :meth:`to_dict` output or a legacy ISO ``timestamp`` record."""
+        epoch_ns: int | None = None
+        if data.get("timestamp_ns") is not None:
+            epoch_ns = int(data["timestamp_ns"])
+        elif data.get("timestamp"):
+            epoch_ns = _parse_epoch_ns(str(data["timestamp"]))
         return cls(
             action=parse_action(str(data.get("action", "IDLE"))),
             fps=int(data.get("fps", 0)),
             has_hand=bool(data.get("has_hand", False)),
             profile=str(data.get("profile", "default")),
             center_x=float(data.get("center_x", 0.5)),
-            timestamp=str(data.get("timestamp", ""))
-            or datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            monotonic_ns=time.monotonic_ns() if epoch_ns is None else monotonic_ns_at(epoch_ns),
         )
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import mmap
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from src.domain.actions import Action
+from src.domain.models import TelemetrySnapshot
+
+# Layout of the mapped file: a header of eight little-endian uint64 words
+# followed by a ring of CHANNEL_DTYPE records.
+CHANNEL_DTYPE = np.dtype(
+    [
+        ("action", np.uint8),
+        ("has_hand", np.bool_),
+        ("fps", "<i4"),
+        ("center_x", "<f4"),
+        ("timestamp_ns", "<i8"),  # nanoseconds since the Unix epoch
+        ("profile", "S40"),  # PROFILE_NAME_PATTERN allows at most 40 ASCII chars
+    ]
+)
+_MAGIC = 0x5353_5443_0000_0002  # "SSTC" + layout version 2
+_HEADER = np.dtype("<u8")
+_HEADER_WORDS = 8
+_HEADER_BYTES = _HEADER_WORDS * _HEADER.itemsize
+_MAGIC_WORD, _CAPACITY_WORD, _ITEMSIZE_WORD, _SEQ_WORD, _COUNT_WORD = range(5)
+_READ_ATTEMPTS = 64
+
+_ACTIONS: tuple[Action, ...] = tuple(Action)
+_ACTION_CODES: dict[Action, int] = {action: code for code, action in enumerate(_ACTIONS)}
+
+
+class TelemetryChannel:
+    """Single-writer side of the shared-memory telemetry ring.
+
+    The controller process maps *path* and writes each snapshot into the next
+    ring slot under a seqlock: the sequence word is made odd before the
+    write and even again afterwards, so readers in other processes can
+    detect and retry a torn read without any lock.  An existing compatible
+    file is reused, which keeps the history visible across restarts.
+    """
+
+    def __init__(self, path: Path, capacity: int = 1024) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        self.path = path
+        self.capacity = capacity
+        size = _HEADER_BYTES + capacity * CHANNEL_DTYPE.itemsize
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch(exist_ok=True)
+        with path.open("r+b") as handle:
+            # Never shrink: a reader may still map the old length.
+            if handle.seek(0, os.SEEK_END) < size:
+                handle.truncate(size)
+            self._map = mmap.mmap(handle.fileno(), size)
+        self._header = np.ndarray((_HEADER_WORDS,), dtype=_HEADER, buffer=self._map)
+        self._rows = np.ndarray(
+            (capacity,), dtype=CHANNEL_DTYPE, buffer=self._map, offset=_HEADER_BYTES
+        )
+
+        header = self._header
+        if not (
+            header[_MAGIC_WORD] == _MAGIC
+            and header[_CAPACITY_WORD] == capacity
+            and header[_ITEMSIZE_WORD] == CHANNEL_DTYPE.itemsize
+        ):
+            header[_MAGIC_WORD] = 0  # readers ignore the file while it is re-initialised
+            header[_CAPACITY_WORD] = capacity
+            header[_ITEMSIZE_WORD] = CHANNEL_DTYPE.itemsize
+            header[_COUNT_WORD] = 0
+            header[_MAGIC_WORD] = _MAGIC
+        # A writer that died mid-write leaves the sequence odd; make it even again.
+        header[_SEQ_WORD] += header[_SEQ_WORD] & np.uint64(1)
+
+    def publish(self, snapshot: TelemetrySnapshot) -> None:
+        header = self._header
+        count = int(header[_COUNT_WORD])
+        header[_SEQ_WORD] += np.uint64(1)
+        self._rows[count % self.capacity] = (
+            _ACTION_CODES[snapshot.action],
+            snapshot.has_hand,
+            snapshot.fps,
+            snapshot.center_x,
+            snapshot.timestamp_ns,
+            snapshot.profile.encode("ascii", "replace")[:40],
+        )
+        header[_COUNT_WORD] = count + 1
+        header[_SEQ_WORD] += np.uint64(1)
+
+    def close(self) -> None:
+        del self._header, self._rows
+        self._map.close()
+
+
+class TelemetryChannelReader:
+    """Lock-free reader for a :class:`TelemetryChannel` written by another process.
+
+    The file is mapped read-only on first use and re-probed at most every
+    *reopen_interval_s* while it is missing, so an API started before the
+    controller attaches as soon as the channel appears.  Reads copy the
+    needed rows and retry if the writer's sequence word moved meanwhile.
+    """
+
+    def __init__(self, path: Path, reopen_interval_s: float = 1.0) -> None:
+        self.path = path
+        self.reopen_interval_s = reopen_interval_s
+        self._map: mmap.mmap | None = None
+        self._header: np.ndarray | None = None
+        self._rows: np.ndarray | None = None
+        self._next_probe = 0.0
+
+    @property
+    def total(self) -> int:
+        """Samples written since the channel was initialised (0 when detached)."""
+        header = self._attach()
+        if header is None or header[_MAGIC_WORD] != _MAGIC:
+            return 0
+        return int(header[_COUNT_WORD])
+
+    def latest(self) -> TelemetrySnapshot | None:
+        rows = self._read(1)
+        if not rows:
+            return None
+        return TelemetrySnapshot.from_dict(rows[0])
+
+    def history(self, limit: int = 60) -> list[dict[str, Any]]:
+        return self._read(limit)
+
+    def close(self) -> None:
+        self._header = self._rows = None
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _attach(self) -> np.ndarray | None:
+        if self._header is not None:
+            if self._rows is not None and self._header[_CAPACITY_WORD] == len(self._rows):
+                return self._header
+            self.close()  # the writer re-initialised the file with another capacity
+        now = time.monotonic()
+        if now < self._next_probe:
+            return None
+        self._next_probe = now + self.reopen_interval_s
+        try:
+            with self.path.open("rb") as handle:
+                mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        header: np.ndarray = np.ndarray((_HEADER_WORDS,), dtype=_HEADER, buffer=mapped)
+        capacity = int(header[_CAPACITY_WORD])
+        if (
+            header[_MAGIC_WORD] != _MAGIC
+            or header[_ITEMSIZE_WORD] != CHANNEL_DTYPE.itemsize
+            or len(mapped) < _HEADER_BYTES + capacity * CHANNEL_DTYPE.itemsize
+        ):
+            del header
+            mapped.close()
+            return None
+        self._map = mapped
+        self._header = header
+        self._rows = np.ndarray(
+            (capacity,), dtype=CHANNEL_DTYPE, buffer=mapped, offset=_HEADER_BYTES
+        )
+        return header
+
+    def _read(self, limit: int) -> list[dict[str, Any]]:
+        header = self._attach()
+        rows = self._rows
+        if header is None or rows is None:
+            return []
+        capacity = len(rows)
+        for _ in range(_READ_ATTEMPTS):
+            seq = int(header[_SEQ_WORD])
+            if seq & 1:
+                continue
+            count = int(header[_COUNT_WORD])
+            size = max(0, min(limit, count, capacity))
+            snapshot = rows.take(np.arange(count - size, count), mode="wrap")
+            if int(header[_SEQ_WORD]) == seq and header[_MAGIC_WORD] == _MAGIC:
+                return self._to_dicts(snapshot, count - size + 1)
+        return []
+
+    @staticmethod
+    def _to_dicts(rows: np.ndarray, first_seq: int) -> list[dict[str, Any]]:
+        items: list[dict[str, Any]] = []
+        for seq, (action, has_hand, fps, center_x, timestamp_ns, profile) in enumerate(
+            rows.tolist(), first_seq
+        ):
+            items.append(
+                {
+                    "seq": seq,
+                    "action": _ACTIONS[action].value,
+                    "fps": fps,
+                    "has_hand": has_hand,
+                    "profile": profile.decode("ascii", "replace"),
+                    "center_x": round(center_x, 4),
+                    "timestamp_ns": timestamp_ns,
+                }
+            )
+        return items
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import IO, Any
+
+_TAIL_BLOCK = 8192
+
+
+def _tail_lines(path: Path, count: int) -> list[bytes]:
+    """Return up to the last *count* non-empty lines of *path*, oldest first.
+
+    Reads backwards in fixed-size blocks, so the cost depends on *count*
+    rather than on the file size.
+    """
+    if count <= 0:
+        return []
+    try:
+        with path.open("rb") as handle:
+            end = handle.seek(0, os.SEEK_END)
+            position = end
+            data = b""
+            while position > 0 and data.count(b"\n") <= count:
+                step = min(_TAIL_BLOCK, position)
+                position -= step
+                handle.seek(position)
+                data = handle.read(step) + data
+    except OSError:
+        return []
+    lines = [line for line in data.split(b"\n") if line.strip()]
+    if position > 0:
+        # The first line may be cut in half by the block boundary.
+        lines = lines[1:]
+    return lines[-count:]
+
+
+class TelemetryLog:
+    """Append-only newline-delimited JSON log split into rotating segments.
+
+    Each record is one compact JSON line appended to the active segment
+    (*path*), so a write costs O(1) regardless of how much history exists.
+    The active segment is rotated to ``<path>.1`` (older ones shift to
+    ``.2`` … ``.backup_count``) once it exceeds *max_bytes* or has been open
+    for *max_age_s* seconds.  :meth:`tail` reads backwards from the end of the
+    newest segments instead of parsing whole files.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int = 1_048_576,
+        max_age_s: float | None = None,
+        backup_count: int = 4,
+    ) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_age_s = max_age_s
+        self.backup_count = backup_count
+        self._handle: IO[str] | None = None
+        self._size = 0
+        self._opened_at = 0.0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def append(self, record: dict[str, Any]) -> None:
+        """Write *record* as one line and flush it to the OS."""
+        self.append_many((record,))
+
+    def append_many(self, records: tuple[dict[str, Any], ...] | list[dict[str, Any]]) -> None:
+        """Write several records with a single flush."""
+        if not records:
+            return
+        handle = self._open()
+        payload = "".join(
+            json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+            for record in records
+        )
+        if self._should_rotate():
+            handle = self._rotate()
+        handle.write(payload)
+        handle.flush()
+        self._size += len(payload.encode("utf-8"))
+
+    def tail(self, count: int) -> list[dict[str, Any]]:
+        """Return the last *count* records across segments, oldest first.
+
+        Lines that are not valid JSON objects (e.g. a write cut short by a
+        crash) are skipped.
+        """
+        lines: list[bytes] = []
+        for segment in self.segments():
+            lines = _tail_lines(segment, count - len(lines)) + lines
+            if len(lines) >= count:
+                break
+
+        records: list[dict[str, Any]] = []
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+            if isinstance(record, dict):
+                records.append(record)
+        return records
+
+    def segments(self) -> list[Path]:
+        """Existing segment files, newest first."""
+        candidates = [self.path] + [
+            self._backup_path(index) for index in range(1, self.backup_count + 1)
+        ]
+        return [path for path in candidates if path.exists()]
+
+    def rewrite(self, records: list[dict[str, Any]]) -> None:
+        """Atomically replace the active segment with *records*."""
+        self.close()
+        staging = self.path.with_name(self.path.name + ".tmp")
+        staging.write_text(
+            "".join(
+                json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+                for record in records
+            ),
+            encoding="utf-8",
+        )
+        staging.replace(self.path)
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _backup_path(self, index: int) -> Path:
+        return self.path.with_name(f"{self.path.name}.{index}")
+
+    def _open(self) -> IO[str]:
+        if self._handle is None:
+            needs_newline = False
+            try:
+                with self.path.open("rb") as existing:
+                    if existing.seek(0, os.SEEK_END) > 0:
+                        existing.seek(-1, os.SEEK_END)
+                        needs_newline = existing.read(1) != b"\n"
+            except FileNotFoundError:
+                pass
+            self._handle = self.path.open("a", encoding="utf-8", newline="\n")
+            if needs_newline:
+                # Terminate a line left unfinished by an earlier crash.
+                self._handle.write("\n")
+            self._size = self._handle.tell()
+            self._opened_at = time.monotonic()
+        return self._handle
+
+    def _should_rotate(self) -> bool:
+        if self._size >= self.max_bytes:
+            return True
+        return (
+            self.max_age_s is not None
+            and self._size > 0
+            and time.monotonic() - self._opened_at >= self.max_age_s
+        )
+
+    def _rotate(self) -> IO[str]:
+        self.close()
+        if self.backup_count > 0:
+            oldest = self._backup_path(self.backup_count)
+            oldest.unlink(missing_ok=True)
+            for index in range(self.backup_count - 1, 0, -1):
+                source = self._backup_path(index)
+                if source.exists():
+                    source.replace(self._backup_path(index + 1))
+            self.path.replace(self._backup_path(1))
+        else:
+            self.path.unlink(missing_ok=True)
+        return self._open()
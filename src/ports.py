@@ -9,12 +9,13 @@ makes mocking in tests trivial.
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any, Protocol, runtime_checkable
 
 import numpy as np
 
 from src.domain.actions import Action
-from src.domain.models import GestureSnapshot
+from src.domain.models import GestureSnapshot, Profile
 
 
 @runtime_checkable
@@ -75,3 +76,66 @@ class GestureInterpreterPort(Protocol):
     def update_bounds(self, left_bound: float, right_bound: float) -> None:
         """Hot-reload lane boundaries without recreating the object."""
         ...
+
+
+@runtime_checkable
+class TelemetryFeedPort(Protocol):
+    """Read side of a telemetry store (in-process service or shared channel)."""
+
+    @property
+    def total(self) -> int:
+        """Number of samples appended so far; grows by one per snapshot."""
+        ...
+
+    def history(self, limit: int = 60) -> list[dict[str, Any]]:
+        """Return the last *limit* samples as dicts, oldest first.
+
+        Each dict has a ``seq`` key: the sample's 1-based position in ``total``.
+        """
+        ...
+
+
+@runtime_checkable
+class ProfileStorePort(Protocol):
+    """Persistent store of calibration profiles and the active selection."""
+
+    @property
+    def version(self) -> int:
+        """Changes whenever profiles or the active selection may have changed."""
+        ...
+
+    def list_profiles(self) -> list[Profile]:
+        """All valid profiles, ordered by name."""
+        ...
+
+    def list_page(self, offset: int = 0, limit: int = 50) -> tuple[list[Profile], int]:
+        """One page of profiles ordered by name, plus the total count."""
+        ...
+
+    def get_profile(self, name: str) -> Profile:
+        """Raise FileNotFoundError when *name* does not exist."""
+        ...
+
+    def save_profile(self, profile: Profile) -> Profile:
+        """Validate and insert or replace *profile*."""
+        ...
+
+    def activate_profile(self, name: str) -> Profile:
+        """Make *name* the active profile and return it."""
+        ...
+
+    def get_active_profile_name(self) -> str:
+        """Name of the active profile (``"default"`` when unset)."""
+        ...
+
+    def get_active_profile(self) -> Profile:
+        """The active profile, falling back to ``default`` if it vanished."""
+        ...
+
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        """Call *listener* after every change made through this store."""
+        ...
+
+    def remove_listener(self, listener: Callable[[], None]) -> None:
+        """Stop calling *listener*."""
+        ...
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, replace
+
+import numpy as np
+
+from src.domain.models import Profile
+from src.ports import ProfileStorePort
+
+MIN_SAMPLES = 30
+# Each lane must hold at least this share of the samples, so a player who
+# never moved to one side gets an error instead of two bounds squeezed into
+# the lanes they did use.
+MIN_LANE_SHARE = 0.08
+MIN_LANE_GAP = 0.08
+_BOUND_RANGE = (0.05, 0.95)
+
+
+@dataclass(frozen=True, slots=True)
+class LaneFit:
+    """Lane centres found in a calibration window and the bounds between them."""
+
+    left_bound: float
+    right_bound: float
+    centers: tuple[float, float, float]
+    samples: int
+
+
+def fit_lane_bounds(samples: Sequence[float] | np.ndarray, iterations: int = 32) -> LaneFit:
+    """Fit three lanes to hand positions with a 1-D k-means.
+
+    Centres start at the 1/6, 1/2 and 5/6 quantiles, which already sit near
+    the answer when the player spends similar time in each lane, so a few
+    Lloyd iterations converge.  In one dimension the clusters are contiguous
+    intervals: assignment is a ``searchsorted`` against the midpoints, and
+    those midpoints are the lane bounds.
+
+    Raises:
+        ValueError: too few samples, a lane that was barely visited, or lanes
+            closer than ``MIN_LANE_GAP``.
+    """
+    x = np.asarray(samples, dtype=np.float64).ravel()
+    x = x[np.isfinite(x)]
+    if x.size < MIN_SAMPLES:
+        raise ValueError(f"Calibration needs at least {MIN_SAMPLES} hand samples, got {x.size}.")
+
+    centers = np.quantile(x, (1 / 6, 1 / 2, 5 / 6))
+    counts = np.zeros(3, dtype=np.int64)
+    for _ in range(iterations):
+        edges = (centers[:-1] + centers[1:]) / 2
+        labels = np.searchsorted(edges, x)
+        counts = np.bincount(labels, minlength=3)
+        if not counts.all():
+            break
+        updated = np.bincount(labels, weights=x, minlength=3) / counts
+        if np.allclose(updated, centers, rtol=0.0, atol=1e-6):
+            break
+        centers = updated
+
+    if counts.min() < MIN_LANE_SHARE * x.size:
+        raise ValueError("Move the hand through all three lanes during calibration.")
+    if np.diff(centers).min() < MIN_LANE_GAP:
+        raise ValueError("Hand positions are too close together to separate three lanes.")
+
+    low, high = _BOUND_RANGE
+    left, right = np.clip((centers[:-1] + centers[1:]) / 2, low, high)
+    return LaneFit(
+        left_bound=round(float(left), 3),
+        right_bound=round(float(right), 3),
+        centers=(float(centers[0]), float(centers[1]), float(centers[2])),
+        samples=int(x.size),
+    )
+
+
+class CalibrationSession:
+    """Collects smoothed ``center_x`` samples for *duration_s* seconds.
+
+    Samples land in a preallocated array, so ``add`` is safe to call once
+    per frame from the capture loop.
+    """
+
+    def __init__(self, duration_s: float = 8.0, max_samples: int = 2048) -> None:
+        self.duration_s = duration_s
+        self._buffer = np.empty(max_samples, dtype=np.float32)
+        self._count = 0
+        self._deadline = time.monotonic() + duration_s
+
+    @property
+    def done(self) -> bool:
+        return self._count == self._buffer.size or time.monotonic() >= self._deadline
+
+    @property
+    def remaining_s(self) -> float:
+        return max(0.0, self._deadline - time.monotonic())
+
+    @property
+    def samples(self) -> np.ndarray:
+        return self._buffer[: self._count]
+
+    def add(self, center_x: float) -> None:
+        if self._count < self._buffer.size:
+            self._buffer[self._count] = center_x
+            self._count += 1
+
+
+class CalibrationService:
+    """Turns a window of hand positions into a saved profile."""
+
+    def __init__(self, store: ProfileStorePort) -> None:
+        self.store = store
+
+    def calibrate(
+        self,
+        samples: Sequence[float] | np.ndarray,
+        name: str = "calibrated",
+        base: Profile | None = None,
+        activate: bool = True,
+    ) -> tuple[Profile, LaneFit]:
+        """Fit lane bounds and save them as profile *name*.
+
+        Settings other than the bounds are copied from *base* (the active
+        profile by default).  The new profile is activated unless *activate*
+        is false; a running controller picks it up through its watcher.
+        """
+        profile, fit = self.fit_profile(samples, name, base)
+        return self.save(profile, activate), fit
+
+    def fit_profile(
+        self,
+        samples: Sequence[float] | np.ndarray,
+        name: str = "calibrated",
+        base: Profile | None = None,
+    ) -> tuple[Profile, LaneFit]:
+        """The profile :meth:`calibrate` would save, without touching the store.
+
+        Only reads the store when *base* is omitted.
+        """
+        fit = fit_lane_bounds(samples)
+        template = base if base is not None else self.store.get_active_profile()
+        profile = replace(
+            template,
+            name=name,
+            description=f"Calibrated from {fit.samples} hand samples.",
+            left_bound=fit.left_bound,
+            right_bound=fit.right_bound,
+        )
+        profile.validate()
+        return profile, fit
+
+    def save(self, profile: Profile, activate: bool = True) -> Profile:
+        """Persist a fitted *profile* and, unless *activate* is false, select it."""
+        saved = self.store.save_profile(profile)
+        if activate:
+            self.store.activate_profile(saved.name)
+        return saved
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import json
+import logging
+import re
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+import numpy as np
+
+from src.domain.actions import Action
+
+FLIGHT_DTYPE = np.dtype(
+    [
+        ("t_ns", np.int64),  # time.monotonic_ns() at the start of the frame
+        ("read_ok", np.bool_),
+        ("read_failures", np.uint16),  # consecutive failed reads so far
+        ("read_ms", np.float32),
+        ("detect_ms", np.float32),
+        ("render_ms", np.float32),
+        ("loop_ms", np.float32),
+        ("fps", np.int16),
+        ("action", np.uint8),
+        ("hands", np.uint8),
+        ("center_x", np.float32),
+        ("wrist_x", np.float32),
+        ("wrist_y", np.float32),
+        ("telemetry_queue", np.uint32),
+        ("log_queue", np.uint32),
+    ]
+)
+
+_ACTIONS: tuple[Action, ...] = tuple(Action)
+ACTION_CODES: dict[Action, int] = {action: code for code, action in enumerate(_ACTIONS)}
+DUMP_NAME_PATTERN = re.compile(r"^flight-\d{8}T\d{6}-\d{3}-[a-z0-9-]+\.json$")
+
+
+class FlightRecorder:
+    """Always-on ring of the last *capacity* frames, written out on anomalies.
+
+    Every frame overwrites one row of a preallocated structured array, so
+    recording costs a tuple assignment and no allocation.  :meth:`dump`
+    copies the ring in order (microseconds, on the caller's thread) and
+    writes it as JSON on a background thread.  Automatic dumps for the same
+    reason are spaced at least *min_interval_s* apart so a sustained problem
+    does not flood the disk; only the newest *max_dumps* files are kept.
+
+    A frame whose ``loop_ms`` exceeds both *spike_ms* and *spike_factor*
+    times the running average triggers a ``latency-spike`` dump.
+    """
+
+    def __init__(
+        self,
+        dump_dir: Path,
+        capacity: int = 300,
+        spike_ms: float = 100.0,
+        spike_factor: float = 4.0,
+        min_interval_s: float = 30.0,
+        max_dumps: int = 20,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        self.dump_dir = dump_dir
+        self.capacity = capacity
+        self.spike_ms = spike_ms
+        self.spike_factor = spike_factor
+        self.min_interval_s = min_interval_s
+        self.max_dumps = max_dumps
+        self._rows = np.zeros(capacity, dtype=FLIGHT_DTYPE)
+        self._count = 0
+        self._avg_loop_ms = 0.0
+        self._last_dump: dict[str, float] = {}
+        self._lock = Lock()
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="flight-recorder")
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    def record(
+        self,
+        read_ok: bool,
+        read_failures: int,
+        read_ms: float,
+        detect_ms: float,
+        render_ms: float,
+        loop_ms: float,
+        fps: int,
+        action: Action,
+        hands: int,
+        center_x: float,
+        wrist_x: float,
+        wrist_y: float,
+        telemetry_queue: int,
+        log_queue: int,
+    ) -> None:
+        """Store one frame; called from the frame loop."""
+        self._rows[self._count % self.capacity] = (
+            time.monotonic_ns(),
+            read_ok,
+            min(read_failures, 65535),
+            read_ms,
+            detect_ms,
+            render_ms,
+            loop_ms,
+            fps,
+            ACTION_CODES[action],
+            hands,
+            center_x,
+            wrist_x,
+            wrist_y,
+            telemetry_queue,
+            log_queue,
+        )
+        self._count += 1
+        if not read_ok:
+            return
+        average = self._avg_loop_ms
+        # Only judge spikes once the average has seen a few frames.
+        if self._count > 30 and loop_ms > self.spike_ms and loop_ms > self.spike_factor * average:
+            self.trigger("latency-spike")
+        self._avg_loop_ms = average + (loop_ms - average) * 0.05
+
+    def rows(self) -> np.ndarray:
+        """Copy of the recorded frames, oldest first."""
+        size = len(self)
+        end = self._count % self.capacity if size == self.capacity else size
+        return self._rows.take(np.arange(end - size, end), mode="wrap")
+
+    def trigger(self, reason: str) -> Future[Path] | None:
+        """Automatic dump tagged *reason*; returns ``None`` when rate-limited."""
+        now = time.monotonic()
+        with self._lock:
+            last = self._last_dump.get(reason)
+            if last is not None and now - last < self.min_interval_s:
+                return None
+            self._last_dump[reason] = now
+        return self.dump(reason)
+
+    def dump(self, reason: str) -> Future[Path]:
+        """Copy the ring now and write it to a file in the background."""
+        snapshot = self.rows()
+        self._logger.warning("Flight recorder dump (%s): %d frames.", reason, len(snapshot))
+        return self._writer.submit(self._write, reason, snapshot)
+
+    def close(self) -> None:
+        """Finish pending writes."""
+        self._writer.shutdown(wait=True)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _write(self, reason: str, rows: np.ndarray) -> Path:
+        self.dump_dir.mkdir(parents=True, exist_ok=True)
+        created = datetime.now(timezone.utc)
+        slug = re.sub(r"[^a-z0-9-]+", "-", reason.lower()).strip("-") or "dump"
+        path = self.dump_dir / (
+            f"flight-{created:%Y%m%dT%H%M%S}-{created.microsecond // 1000:03d}-{slug}.json"
+        )
+        payload = {
+            "reason": reason,
+            "created": created.isoformat(timespec="milliseconds"),
+            "frames": _rows_to_dicts(rows),
+        }
+        # Readers list dumps by name pattern; the .tmp file never matches it.
+        partial = path.with_suffix(".tmp")
+        partial.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        partial.replace(path)
+        for stale in list_dumps(self.dump_dir)[self.max_dumps :]:
+            stale.unlink(missing_ok=True)
+        return path
+
+
+def list_dumps(dump_dir: Path) -> list[Path]:
+    """Flight recorder dumps in *dump_dir*, newest first."""
+    if not dump_dir.is_dir():
+        return []
+    dumps = [path for path in dump_dir.iterdir() if DUMP_NAME_PATTERN.match(path.name)]
+    return sorted(dumps, key=lambda path: path.name, reverse=True)
+
+
+def _rows_to_dicts(rows: np.ndarray) -> list[dict[str, Any]]:
+    names = rows.dtype.names or ()
+    frames = []
+    for values in rows.tolist():
+        frame = dict(zip(names, values, strict=True))
+        frame["action"] = _ACTIONS[frame["action"]].value
+        for key in ("read_ms", "detect_ms", "render_ms", "loop_ms"):
+            frame[key] = round(frame[key], 3)
+        for key in ("center_x", "wrist_x", "wrist_y"):
+            frame[key] = round(frame[key], 4)
+        frames.append(frame)
+    return frames
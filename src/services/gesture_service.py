@@ -82,13 +82,27 @@ class GestureInterpreter:
             A GestureSnapshot with the resolved action and smoothed center X.
         """
         if not hand_landmarks:
+            return self.interpret_features(None, 0.0)
+        fingers, center_x = self.hand_features(hand_landmarks[0])
+        return self.interpret_features(fingers, center_x)
+
+    def interpret_features(self, fingers: list[bool] | None, center_x: float) -> GestureSnapshot:
+        """Resolve a frame already reduced to :meth:`hand_features`.
+
+        This is everything :meth:`interpret` does after reading the
+        landmarks, smoothing state included, so offline tools that store
+        features instead of landmarks replay exactly the same decisions.
+
+        Args:
+            fingers:  ``[thumb, index, middle, ring, pinky]`` extension flags,
+                      or ``None`` when no hand is present.
+            center_x: Raw (unsmoothed) weighted X-centre; ignored without a hand.
+        """
+        if fingers is None:
             self._smoothed_center = None
             return GestureSnapshot(action=Action.IDLE, has_hand=False)
 
-        hand = hand_landmarks[0]
-        fingers = self._detect_fingers(hand)
-        raw_center = self._weighted_center_x(hand)
-        smoothed = self._apply_ema(raw_center)
+        smoothed = self._apply_ema(center_x)
         action = self._resolve_action(fingers, smoothed)
 
         return GestureSnapshot(
@@ -98,6 +112,11 @@ class GestureInterpreter:
             has_hand=True,
         )
 
+    @classmethod
+    def hand_features(cls, hand: Sequence[Any]) -> tuple[list[bool], float]:
+        """Finger flags and raw weighted X-centre of one hand's 21 landmarks."""
+        return cls._detect_fingers(hand), cls._weighted_center_x(hand)
+
     # ------------------------------------------------------------------
     # Internals
     # ------------------------------------------------------------------
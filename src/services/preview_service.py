@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import threading
+import time
+from collections.abc import AsyncIterator, Callable
+
+import numpy as np
+
+FrameEncoder = Callable[[np.ndarray], bytes | None]
+
+
+def jpeg_encoder(quality: int = 70) -> FrameEncoder:
+    """Return an OpenCV-backed JPEG encoder with a fixed *quality*."""
+    import cv2
+
+    params = [int(cv2.IMWRITE_JPEG_QUALITY), int(quality)]
+
+    def encode(frame: np.ndarray) -> bytes | None:
+        ok, buffer = cv2.imencode(".jpg", frame, params)
+        return buffer.tobytes() if ok else None
+
+    return encode
+
+
+class PreviewService:
+    """Shares the latest rendered HUD frame as JPEG bytes with any number of viewers.
+
+    Design notes
+    ------------
+    The control loop calls :meth:`submit` once per frame.  The call returns
+    immediately unless a viewer is connected and the ``max_fps`` interval has
+    elapsed, in which case the frame is copied and handed to a single
+    background encoder thread.  Every viewer iterating :meth:`frames` receives
+    the same encoded bytes, so extra viewers cost no extra encoding and the
+    control loop never waits on JPEG compression.
+
+    Viewers are async iterators woken from the encoder thread through their
+    event loop, so an idle viewer holds no worker thread and a disconnect
+    cancels it right away.
+    """
+
+    def __init__(
+        self,
+        max_fps: float = 10.0,
+        jpeg_quality: int = 70,
+        encoder: FrameEncoder | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_fps = max_fps
+        self._interval = 1.0 / max_fps if max_fps > 0 else 0.0
+        self._encode = encoder or jpeg_encoder(jpeg_quality)
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._pending: np.ndarray | None = None
+        self._next_due = 0.0
+        self._jpeg: bytes | None = None
+        self._seq = 0
+        self._waiters: set[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+        self._closed = False
+        self._thread: threading.Thread | None = None
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    @property
+    def viewers(self) -> int:
+        return len(self._waiters)
+
+    def submit(self, frame: np.ndarray) -> bool:
+        """Offer *frame* for encoding; returns True when it was taken.
+
+        The frame is copied, so callers may keep drawing into the same buffer.
+        """
+        if not self._waiters or self._closed:
+            return False
+        now = self._clock()
+        if now < self._next_due:
+            return False
+        with self._cond:
+            self._pending = frame.copy()
+            self._next_due = now + self._interval
+            self._cond.notify_all()
+        return True
+
+    def latest(self) -> tuple[int, bytes | None]:
+        """Return the sequence number and bytes of the newest encoded frame."""
+        with self._cond:
+            return self._seq, self._jpeg
+
+    async def frames(self) -> AsyncIterator[bytes]:
+        """Yield each newly encoded JPEG until the service is closed.
+
+        A viewer that connects after the first encode starts with the newest
+        frame instead of waiting for the next one.  Must be iterated on an
+        event loop.
+        """
+        wake = asyncio.Event()
+        waiter = (asyncio.get_running_loop(), wake)
+        with self._cond:
+            self._waiters.add(waiter)
+            self._start_locked()
+        try:
+            seen = 0
+            while True:
+                with self._cond:
+                    seq, jpeg, closed = self._seq, self._jpeg, self._closed
+                    if seq == seen:
+                        # Cleared under the lock: a later encode sets it again.
+                        wake.clear()
+                if seq != seen:
+                    seen = seq
+                    if jpeg is not None:
+                        yield jpeg
+                    continue
+                if closed:
+                    return
+                await wake.wait()
+        finally:
+            with self._cond:
+                self._waiters.discard(waiter)
+
+    def close(self) -> None:
+        """Stop the encoder thread and end every open :meth:`frames` stream."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            self._wake_viewers_locked()
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout=1.0)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _start_locked(self) -> None:
+        """Start the encoder thread on first use (must be called under _cond)."""
+        if self._thread is None and not self._closed:
+            self._thread = threading.Thread(target=self._run, name="preview-encoder", daemon=True)
+            self._thread.start()
+
+    def _wake_viewers_locked(self) -> None:
+        for loop, wake in self._waiters:
+            # The loop may already be closed if a viewer was abandoned.
+            with contextlib.suppress(RuntimeError):
+                loop.call_soon_threadsafe(wake.set)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._closed or self._pending is not None)
+                if self._closed:
+                    return
+                frame, self._pending = self._pending, None
+            if frame is None:
+                continue
+            jpeg = self._encode(frame)
+            if jpeg is None:
+                continue
+            with self._cond:
+                self._jpeg = jpeg
+                self._seq += 1
+                self._wake_viewers_locked()
@@ -1,19 +1,92 @@
 from __future__ import annotations
 
 import json
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import replace
 from pathlib import Path
+from threading import RLock
 
 from src.domain.models import PROFILE_NAME_PATTERN, Profile
+from src.ports import ProfileStorePort
 
+# Files modified this recently may be rewritten again within the same mtime
+# tick, so an unchanged stamp does not yet prove unchanged content.
+_RACY_WINDOW_NS = 2_000_000_000
 
-class ProfileService:
-    def __init__(self, profiles_dir: Path, active_profile_file: Path):
+# (st_mtime_ns, st_size) of a file; _MISSING when it does not exist.
+_Stamp = tuple[int, int]
+_MISSING: _Stamp = (-1, -1)
+_UNSEEN: _Stamp = (-2, -2)
+
+
+ProfileListener = Callable[[], None]
+
+
+class ProfileChangeNotifier:
+    """In-process change callbacks shared by the profile stores.
+
+    Listeners run synchronously on the writing thread after the change is
+    persisted, so they must be quick (e.g. wake a watcher thread).
+    """
+
+    def __init__(self) -> None:
+        self._listeners: list[ProfileListener] = []
+
+    def add_listener(self, listener: ProfileListener) -> None:
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: ProfileListener) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self) -> None:
+        for listener in list(self._listeners):
+            try:
+                listener()
+            except Exception:
+                logging.getLogger(self.__class__.__name__).exception("Profile listener failed.")
+
+
+class ProfileService(ProfileChangeNotifier):
+    """Profiles stored as ``profiles/<name>.json`` plus an active-profile file.
+
+    Parsed profiles are kept in memory and revalidated against each file's
+    mtime and size at most once per *stat_interval_s*; the directory's own
+    stamp tells when files were added or removed, so unchanged profiles are
+    never re-read.  Writes through the service update the cache directly.
+    Returned profiles are shared with the cache and must not be mutated.
+    """
+
+    def __init__(self, profiles_dir: Path, active_profile_file: Path, stat_interval_s: float = 1.0):
         self.profiles_dir = profiles_dir
         self.active_profile_file = active_profile_file
+        self.stat_interval_s = stat_interval_s
+        super().__init__()
         self.profiles_dir.mkdir(parents=True, exist_ok=True)
         self.active_profile_file.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = RLock()
+        self._version = 0
+        self._files: dict[str, tuple[_Stamp, Profile | None]] = {}  # by file name
+        self._dir_stamp = _UNSEEN
+        self._active = "default"
+        self._active_stamp = _UNSEEN
+        self._next_check = 0.0
         self._bootstrap()
 
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever profiles or the active selection may have changed.
+
+        Bumped by every write through this service, and when a revalidation
+        finds that files changed on disk (e.g. another process activated a
+        profile).
+        """
+        with self._lock:
+            self._refresh()
+            return self._version
+
     def _bootstrap(self) -> None:
         default_profile_path = self._profile_path("default")
         if not default_profile_path.exists():
@@ -35,46 +108,60 @@ class ProfileService:
             raise ValueError("Invalid profile name.")
 
     def list_profiles(self) -> list[Profile]:
-        profiles: list[Profile] = []
-        for file in sorted(self.profiles_dir.glob("*.json")):
-            try:
-                data = json.loads(file.read_text(encoding="utf-8"))
-                profiles.append(Profile.from_dict(data))
-            except (json.JSONDecodeError, ValueError, KeyError):
-                # Skip corrupted files so API/UI remains available.
-                continue
-        return profiles
+        with self._lock:
+            self._refresh()
+            # Corrupted files are skipped so API/UI remains available.
+            return [profile for _, (_, profile) in sorted(self._files.items()) if profile]
+
+    def list_page(self, offset: int = 0, limit: int = 50) -> tuple[list[Profile], int]:
+        """One page of :meth:`list_profiles`, plus the total number of profiles."""
+        profiles = self.list_profiles()
+        offset, limit = max(0, offset), max(0, limit)
+        return profiles[offset : offset + limit], len(profiles)
 
     def get_profile(self, name: str) -> Profile:
         self._validate_name(name)
-        path = self._profile_path(name)
-        if not path.exists():
-            raise FileNotFoundError(f"Profile '{name}' not found.")
-        data = json.loads(path.read_text(encoding="utf-8"))
-        return Profile.from_dict(data)
+        file_name = self._profile_path(name).name
+        with self._lock:
+            self._refresh()
+            if file_name not in self._files:
+                # Created by another process since the last check?
+                self._refresh(force=True)
+            if file_name not in self._files:
+                raise FileNotFoundError(f"Profile '{name}' not found.")
+            profile = self._files[file_name][1]
+        if profile is None:
+            raise ValueError(f"Profile '{name}' is corrupted.")
+        return profile
 
     def save_profile(self, profile: Profile) -> Profile:
         profile.validate()
         self._validate_name(profile.name)
         path = self._profile_path(profile.name)
-        path.write_text(
-            json.dumps(profile.to_dict(), indent=2, ensure_ascii=False),
-            encoding="utf-8",
-        )
+        with self._lock:
+            path.write_text(
+                json.dumps(profile.to_dict(), indent=2, ensure_ascii=False),
+                encoding="utf-8",
+            )
+            self._files[path.name] = (_file_stamp(path), replace(profile))
+            self._version += 1
+        self._notify()
         return profile
 
     def activate_profile(self, name: str) -> Profile:
-        profile = self.get_profile(name)
-        self.active_profile_file.write_text(profile.name, encoding="utf-8")
+        with self._lock:
+            profile = self.get_profile(name)
+            self.active_profile_file.write_text(profile.name, encoding="utf-8")
+            self._active = profile.name
+            self._active_stamp = _file_stamp(self.active_profile_file)
+            self._version += 1
+        self._notify()
         return profile
 
     def get_active_profile_name(self) -> str:
-        if not self.active_profile_file.exists():
-            return "default"
-        active = self.active_profile_file.read_text(encoding="utf-8").strip()
-        if not active:
-            return "default"
-        return active
+        with self._lock:
+            self._refresh()
+            return self._active
 
     def get_active_profile(self) -> Profile:
         active = self.get_active_profile_name()
@@ -82,3 +169,87 @@ class ProfileService:
             return self.get_profile(active)
         except FileNotFoundError:
             return self.activate_profile("default")
+
+    # ------------------------------------------------------------------
+    # Cache revalidation
+    # ------------------------------------------------------------------
+
+    def _refresh(self, force: bool = False) -> None:
+        """Revalidate the cache against the filesystem if the stat interval elapsed."""
+        now = time.monotonic()
+        if not force and now < self._next_check:
+            return
+        self._next_check = now + self.stat_interval_s
+        racy_since = time.time_ns() - _RACY_WINDOW_NS
+        changed = False
+
+        dir_stamp = _file_stamp(self.profiles_dir)
+        if dir_stamp != self._dir_stamp or dir_stamp[0] > racy_since:
+            names = {path.name for path in self.profiles_dir.glob("*.json")}
+            for gone in self._files.keys() - names:
+                del self._files[gone]
+                changed = True
+            for added in names - self._files.keys():
+                self._files[added] = (_UNSEEN, None)
+            self._dir_stamp = dir_stamp
+
+        for file_name, (stamp, profile) in list(self._files.items()):
+            path = self.profiles_dir / file_name
+            current = _file_stamp(path)
+            if current == stamp and stamp[0] <= racy_since:
+                continue
+            if current == _MISSING:
+                del self._files[file_name]
+                changed = True
+                continue
+            loaded = _load_profile(path)
+            changed = changed or loaded != profile
+            self._files[file_name] = (current, loaded)
+
+        active_stamp = _file_stamp(self.active_profile_file)
+        if active_stamp != self._active_stamp or active_stamp[0] > racy_since:
+            active = "default"
+            if active_stamp != _MISSING:
+                try:
+                    active = self.active_profile_file.read_text(encoding="utf-8").strip()
+                except OSError:
+                    active = ""
+            active = active or "default"
+            changed = changed or active != self._active
+            self._active = active
+            self._active_stamp = active_stamp
+
+        if changed:
+            self._version += 1
+
+
+def _load_profile(path: Path) -> Profile | None:
+    try:
+        return Profile.from_dict(json.loads(path.read_text(encoding="utf-8")))
+    except (OSError, json.JSONDecodeError, ValueError, KeyError):
+        return None
+
+
+def _file_stamp(path: Path) -> _Stamp:
+    try:
+        stat = path.stat()
+    except OSError:
+        return _MISSING
+    return stat.st_mtime_ns, stat.st_size
+
+
+def create_profile_service(
+    store: str,
+    profiles_dir: Path,
+    active_profile_file: Path,
+    database_file: Path,
+    stat_interval_s: float = 1.0,
+) -> ProfileStorePort:
+    """Build the profile backend selected by *store* (``"json"`` or ``"sqlite"``)."""
+    if store == "sqlite":
+        from src.services.sqlite_profile_service import SQLiteProfileService
+
+        return SQLiteProfileService(database_file)
+    if store == "json":
+        return ProfileService(profiles_dir, active_profile_file, stat_interval_s=stat_interval_s)
+    raise ValueError(f"Unknown profile store '{store}'; expected 'json' or 'sqlite'.")
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable
+
+from src.domain.models import Profile
+from src.ports import ProfileStorePort
+
+
+class ProfileWatcher:
+    """Reports changes of the active profile from a background thread.
+
+    Two sources feed it: the store's in-process listeners, which wake the
+    thread immediately after a write made in this process (``--mode all``),
+    and a poll of ``store.version`` every *interval_s*, which notices writes
+    from other processes through the store's cheap file-stamp /
+    ``data_version`` check.  *on_change* receives the new active profile and
+    runs on the watcher thread, never on the caller's loop; it is only
+    called when the active profile (name or any setting) actually differs
+    from the last one reported.
+    """
+
+    def __init__(
+        self,
+        store: ProfileStorePort,
+        on_change: Callable[[Profile], None],
+        current: Profile,
+        interval_s: float = 0.5,
+    ) -> None:
+        self.store = store
+        self.on_change = on_change
+        self.interval_s = interval_s
+        self._current = current
+        self._version = store.version
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._logger = logging.getLogger(self.__class__.__name__)
+        self._thread = threading.Thread(target=self._run, name="profile-watcher", daemon=True)
+
+    def start(self) -> ProfileWatcher:
+        self.store.add_listener(self._wake.set)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.store.remove_listener(self._wake.set)
+        self._stopped.set()
+        self._wake.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout=2.0)
+
+    def check(self) -> bool:
+        """Compare the store against the last seen state; returns whether *on_change* ran."""
+        version = self.store.version
+        if version == self._version:
+            return False
+        self._version = version
+        profile = self.store.get_active_profile()
+        if profile == self._current:
+            return False
+        self._current = profile
+        self.on_change(profile)
+        return True
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wake.wait(self.interval_s)
+            self._wake.clear()
+            if self._stopped.is_set():
+                break
+            try:
+                self.check()
+            except Exception:
+                self._logger.exception("Could not apply profile change.")
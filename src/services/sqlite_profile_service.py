@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+from src.domain.models import PROFILE_NAME_PATTERN, Profile
+from src.services.profile_service import ProfileChangeNotifier
+
+# Each entry upgrades the schema from the previous version; the applied
+# version is kept in ``PRAGMA user_version``.  Statements are idempotent so
+# two processes opening a new database at once cannot trip over each other.
+_MIGRATIONS: tuple[str, ...] = (
+    """
+    CREATE TABLE IF NOT EXISTS profiles (
+        name TEXT PRIMARY KEY,
+        description TEXT NOT NULL,
+        left_bound REAL NOT NULL,
+        right_bound REAL NOT NULL,
+        detection_confidence REAL NOT NULL,
+        presence_confidence REAL NOT NULL,
+        tracking_confidence REAL NOT NULL,
+        cooldown_ms INTEGER NOT NULL
+    ) WITHOUT ROWID;
+    CREATE TABLE IF NOT EXISTS settings (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    ) WITHOUT ROWID;
+    """,
+)
+SCHEMA_VERSION = len(_MIGRATIONS)
+
+_COLUMNS = (
+    "name",
+    "description",
+    "left_bound",
+    "right_bound",
+    "detection_confidence",
+    "presence_confidence",
+    "tracking_confidence",
+    "cooldown_ms",
+)
+_SELECT = f"SELECT {', '.join(_COLUMNS)} FROM profiles"
+_VALUES = f"({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})"
+_UPSERT = f"INSERT OR REPLACE INTO profiles {_VALUES}"
+_INSERT_MISSING = f"INSERT OR IGNORE INTO profiles {_VALUES}"
+_ACTIVE_KEY = "active_profile"
+
+
+def bootstrap_profile() -> Profile:
+    """The ``default`` row a new database starts with."""
+    return Profile(name="default", description="Balanced profile for most players.")
+
+
+class SQLiteProfileService(ProfileChangeNotifier):
+    """Profiles and the active-profile selection in one SQLite database.
+
+    Lookups go through the ``name`` primary key, listings are paginated in
+    SQL, and every write is a single transaction, so a crash never leaves a
+    half-written profile behind.  The database runs in WAL mode so the API
+    and the controller can share it from separate processes; commits made
+    by another process are noticed through ``PRAGMA data_version``.
+    """
+
+    def __init__(self, database_file: Path):
+        self.database_file = database_file
+        super().__init__()
+        database_file.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(database_file, check_same_thread=False, timeout=5.0)
+        self._lock = Lock()
+        self._version = 0
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._migrate()
+            self._bootstrap()
+            self._data_version = self._read_data_version()
+
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever profiles or the active selection may have changed."""
+        with self._lock:
+            data_version = self._read_data_version()
+            if data_version != self._data_version:
+                self._data_version = data_version
+                self._version += 1
+            return self._version
+
+    @property
+    def schema_version(self) -> int:
+        with self._lock:
+            row = self._conn.execute("PRAGMA user_version").fetchone()
+        return int(row[0])
+
+    def list_profiles(self) -> list[Profile]:
+        with self._lock:
+            rows = self._conn.execute(f"{_SELECT} ORDER BY name").fetchall()
+        return [_row_to_profile(row) for row in rows]
+
+    def list_page(self, offset: int = 0, limit: int = 50) -> tuple[list[Profile], int]:
+        """One page of profiles ordered by name, plus the total number of profiles."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"{_SELECT} ORDER BY name LIMIT ? OFFSET ?", (max(0, limit), max(0, offset))
+            ).fetchall()
+            total = self._conn.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+        return [_row_to_profile(row) for row in rows], int(total)
+
+    def get_profile(self, name: str) -> Profile:
+        self._validate_name(name)
+        with self._lock:
+            row = self._conn.execute(f"{_SELECT} WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            raise FileNotFoundError(f"Profile '{name}' not found.")
+        return _row_to_profile(row)
+
+    def save_profile(self, profile: Profile) -> Profile:
+        profile.validate()
+        self._validate_name(profile.name)
+        with self._lock, self._conn:
+            self._conn.execute(_UPSERT, _profile_to_row(profile))
+            self._version += 1
+        self._notify()
+        return profile
+
+    def save_many(self, profiles: list[Profile]) -> int:
+        """Insert or replace *profiles* in a single transaction."""
+        for profile in profiles:
+            profile.validate()
+            self._validate_name(profile.name)
+        with self._lock, self._conn:
+            self._conn.executemany(_UPSERT, [_profile_to_row(profile) for profile in profiles])
+            self._version += 1
+        self._notify()
+        return len(profiles)
+
+    def activate_profile(self, name: str) -> Profile:
+        profile = self.get_profile(name)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+                (_ACTIVE_KEY, profile.name),
+            )
+            self._version += 1
+        self._notify()
+        return profile
+
+    def get_active_profile_name(self) -> str:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM settings WHERE key = ?", (_ACTIVE_KEY,)
+            ).fetchone()
+        return str(row[0]) if row and row[0] else "default"
+
+    def get_active_profile(self) -> Profile:
+        active = self.get_active_profile_name()
+        try:
+            return self.get_profile(active)
+        except FileNotFoundError:
+            return self.activate_profile("default")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _validate_name(name: str) -> None:
+        if not PROFILE_NAME_PATTERN.match(name):
+            raise ValueError("Invalid profile name.")
+
+    def _migrate(self) -> None:
+        current = int(self._conn.execute("PRAGMA user_version").fetchone()[0])
+        if current > SCHEMA_VERSION:
+            raise RuntimeError(
+                f"{self.database_file} has schema version {current}; "
+                f"this build supports up to {SCHEMA_VERSION}."
+            )
+        for version in range(current, SCHEMA_VERSION):
+            # executescript() commits on its own; the version bump rides along.
+            self._conn.executescript(
+                f"BEGIN; {_MIGRATIONS[version]} PRAGMA user_version = {version + 1}; COMMIT;"
+            )
+
+    def _bootstrap(self) -> None:
+        with self._conn:
+            self._conn.execute(_INSERT_MISSING, _profile_to_row(bootstrap_profile()))
+            self._conn.execute(
+                "INSERT OR IGNORE INTO settings (key, value) VALUES (?, ?)",
+                (_ACTIVE_KEY, "default"),
+            )
+
+    def _read_data_version(self) -> int:
+        return int(self._conn.execute("PRAGMA data_version").fetchone()[0])
+
+
+def _profile_to_row(profile: Profile) -> tuple[object, ...]:
+    return (
+        profile.name,
+        profile.description,
+        profile.left_bound,
+        profile.right_bound,
+        profile.detection_confidence,
+        profile.presence_confidence,
+        profile.tracking_confidence,
+        profile.cooldown_ms,
+    )
+
+
+def _row_to_profile(row: Any) -> Profile:
+    # Column order matches the Profile field order.
+    return Profile(*row)
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+from src.domain.actions import Action
+from src.domain.models import TelemetrySnapshot
+
+TELEMETRY_DTYPE = np.dtype(
+    [
+        ("action", np.uint8),
+        ("fps", np.int32),
+        ("has_hand", np.bool_),
+        ("profile", np.uint16),
+        ("center_x", np.float32),
+        ("timestamp_ns", np.int64),  # nanoseconds since the Unix epoch
+    ]
+)
+
+_MAX_PROFILE_IDS = int(np.iinfo(TELEMETRY_DTYPE["profile"]).max) + 1
+
+_ACTIONS: tuple[Action, ...] = tuple(Action)
+_ACTION_CODES: dict[Action, int] = {action: code for code, action in enumerate(_ACTIONS)}
+
+
+class TelemetryRing:
+    """Fixed-capacity ring of telemetry samples in a NumPy structured array.
+
+    Appends overwrite the oldest row in O(1) without allocating, and the
+    whole buffer is one contiguous block regardless of *capacity*.  Profile
+    names are interned to small integer ids; dicts are only built for the
+    rows that :meth:`tail` returns.  The intern table is compacted to the
+    names still present in the ring whenever it reaches twice the capacity
+    (or the id space), so it stays bounded however many names go by.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        self.capacity = capacity
+        self._rows = np.zeros(capacity, dtype=TELEMETRY_DTYPE)
+        self._count = 0
+        self._profiles: list[str] = []
+        self._profile_ids: dict[str, int] = {}
+        self._max_profiles = min(2 * capacity, _MAX_PROFILE_IDS)
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    @property
+    def total(self) -> int:
+        """Samples appended since creation, including overwritten ones."""
+        return self._count
+
+    def append(self, snapshot: TelemetrySnapshot) -> None:
+        self._rows[self._count % self.capacity] = (
+            _ACTION_CODES[snapshot.action],
+            snapshot.fps,
+            snapshot.has_hand,
+            self._profile_id(snapshot.profile),
+            snapshot.center_x,
+            snapshot.timestamp_ns,
+        )
+        self._count += 1
+
+    def append_dict(self, record: dict[str, Any]) -> None:
+        """Append a record in :meth:`TelemetrySnapshot.to_dict` form."""
+        self.append(TelemetrySnapshot.from_dict(record))
+
+    def rows(self, limit: int) -> np.ndarray:
+        """Copy of the newest *limit* rows, oldest first."""
+        size = len(self)
+        limit = max(0, min(limit, size))
+        end = self._count % self.capacity if size == self.capacity else size
+        # Negative starts wrap around to the tail of the buffer.
+        return self._rows.take(np.arange(end - limit, end), mode="wrap")
+
+    def tail(self, limit: int) -> list[dict[str, Any]]:
+        """The newest *limit* samples as dicts, oldest first.
+
+        Each dict carries ``seq``, the sample's 1-based position in
+        :attr:`total` order, usable as a cursor for incremental reads.
+        """
+        profiles = self._profiles
+        rows = self.rows(limit)
+        first_seq = self._count - len(rows) + 1
+        items: list[dict[str, Any]] = []
+        for seq, (action, fps, has_hand, profile, center_x, timestamp_ns) in enumerate(
+            rows.tolist(), first_seq
+        ):
+            items.append(
+                {
+                    "seq": seq,
+                    "action": _ACTIONS[action].value,
+                    "fps": fps,
+                    "has_hand": has_hand,
+                    "profile": profiles[profile],
+                    "center_x": round(center_x, 4),
+                    "timestamp_ns": timestamp_ns,
+                }
+            )
+        return items
+
+    def _profile_id(self, name: str) -> int:
+        profile_id = self._profile_ids.get(name)
+        if profile_id is None:
+            if len(self._profiles) >= self._max_profiles:
+                self._compact_profiles()
+            profile_id = len(self._profiles)
+            self._profiles.append(name)
+            self._profile_ids[name] = profile_id
+        return profile_id
+
+    def _compact_profiles(self) -> None:
+        """Drop interned names no row refers to any more and renumber the rest.
+
+        Raises:
+            ValueError: the ring still holds more distinct names than ids fit.
+        """
+        column = self._rows["profile"][: len(self)]
+        live, remapped = np.unique(column, return_inverse=True)
+        if len(live) >= _MAX_PROFILE_IDS:
+            raise ValueError(
+                f"TelemetryRing cannot track more than {_MAX_PROFILE_IDS - 1} distinct "
+                "profile names at once."
+            )
+        column[:] = remapped
+        self._profiles = [self._profiles[profile_id] for profile_id in live.tolist()]
+        self._profile_ids = {name: profile_id for profile_id, name in enumerate(self._profiles)}
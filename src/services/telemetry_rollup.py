@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import logging
+import math
+from collections.abc import Iterable
+from threading import Event, Lock, Thread
+from typing import Any
+
+import numpy as np
+
+from src.domain.actions import Action
+from src.domain.models import TelemetrySnapshot, iso_timestamp
+from src.ports import TelemetryFeedPort
+
+_ACTIONS: tuple[Action, ...] = tuple(Action)
+_ACTION_CODES: dict[Action, int] = {action: code for code, action in enumerate(_ACTIONS)}
+
+RESOLUTIONS: dict[str, int] = {"second": 1, "minute": 60}
+_RACE_MARGIN = 32  # samples requested past ``total - seen`` by RollupFollower
+
+
+class RollupRing:
+    """Fixed-width time buckets in a ring addressed directly by bucket number.
+
+    Bucket ``b`` lives in slot ``b % capacity``, so adding a sample touches
+    exactly one slot and a range query gathers at most ``capacity`` slots —
+    raw samples are never revisited.  Slots still holding an older bucket
+    are reset on first use; samples older than their slot are ignored.
+    Columns are separate arrays so the per-sample update stays a handful of
+    scalar writes.
+    """
+
+    def __init__(self, width_s: int, capacity: int) -> None:
+        self.width_s = width_s
+        self.capacity = capacity
+        self.bucket = np.full(capacity, -1, dtype=np.int64)
+        self.samples = np.zeros(capacity, dtype=np.int64)
+        self.hand = np.zeros(capacity, dtype=np.int64)
+        self.fps_min = np.zeros(capacity, dtype=np.int64)
+        self.fps_max = np.zeros(capacity, dtype=np.int64)
+        self.fps_sum = np.zeros(capacity, dtype=np.int64)
+        self.actions = np.zeros((capacity, len(_ACTIONS)), dtype=np.int64)
+        self.newest = -1
+
+    def add(self, epoch_seconds: float, fps: int, has_hand: bool, action_code: int) -> None:
+        bucket = int(epoch_seconds // self.width_s)
+        slot = bucket % self.capacity
+        current = self.bucket[slot]
+        if current != bucket:
+            if current > bucket:
+                return
+            self.bucket[slot] = bucket
+            self.newest = max(self.newest, bucket)
+            self.samples[slot] = self.hand[slot] = self.fps_sum[slot] = 0
+            self.fps_min[slot] = self.fps_max[slot] = fps
+            self.actions[slot] = 0
+        self.samples[slot] += 1
+        self.hand[slot] += has_hand
+        self.fps_sum[slot] += fps
+        if fps < self.fps_min[slot]:
+            self.fps_min[slot] = fps
+        elif fps > self.fps_max[slot]:
+            self.fps_max[slot] = fps
+        self.actions[slot, action_code] += 1
+
+    def query(self, start_s: float, end_s: float) -> list[list[int]]:
+        """Rows of non-empty buckets overlapping ``[start_s, end_s)``, oldest first.
+
+        Each row is ``(bucket, samples, hand, fps_min, fps_max, fps_sum, *actions)``.
+        """
+        # Only the newest `capacity` buckets can still be in the ring.
+        last = min(math.ceil(end_s / self.width_s) - 1, self.newest)
+        first = max(math.floor(start_s / self.width_s), self.newest - self.capacity + 1)
+        if last < first:
+            return []
+        buckets = np.arange(first, last + 1, dtype=np.int64)
+        slots = buckets % self.capacity
+        slots = slots[self.bucket[slots] == buckets]
+        table = np.column_stack(
+            (
+                self.bucket[slots],
+                self.samples[slots],
+                self.hand[slots],
+                self.fps_min[slots],
+                self.fps_max[slots],
+                self.fps_sum[slots],
+                self.actions[slots],
+            )
+        )
+        rows: list[list[int]] = table.tolist()
+        return rows
+
+
+class TelemetryRollups:
+    """Per-second and per-minute FPS, hand-presence and action aggregates.
+
+    Defaults keep one hour of seconds and one day of minutes.
+    """
+
+    def __init__(self, second_capacity: int = 3600, minute_capacity: int = 1440) -> None:
+        self._rings = {
+            "second": RollupRing(RESOLUTIONS["second"], second_capacity),
+            "minute": RollupRing(RESOLUTIONS["minute"], minute_capacity),
+        }
+
+    def add(self, snapshot: TelemetrySnapshot) -> None:
+        epoch = snapshot.epoch_seconds
+        code = _ACTION_CODES[snapshot.action]
+        for ring in self._rings.values():
+            ring.add(epoch, snapshot.fps, snapshot.has_hand, code)
+
+    def add_record(self, record: dict[str, Any]) -> None:
+        """Add a sample in :meth:`TelemetrySnapshot.to_dict` form."""
+        self.add(TelemetrySnapshot.from_dict(record))
+
+    def query(self, start_s: float, end_s: float, resolution: str) -> list[dict[str, Any]]:
+        """Buckets of *resolution* (``"second"`` or ``"minute"``) in ``[start_s, end_s)``."""
+        ring = self._rings.get(resolution)
+        if ring is None:
+            raise ValueError(f"resolution must be one of {sorted(self._rings)}.")
+        items: list[dict[str, Any]] = []
+        for bucket, samples, hand, fps_min, fps_max, fps_sum, *actions in ring.query(
+            start_s, end_s
+        ):
+            items.append(
+                {
+                    "start": iso_timestamp(bucket * ring.width_s),
+                    "samples": samples,
+                    "fps_min": fps_min,
+                    "fps_avg": round(fps_sum / samples, 2),
+                    "fps_max": fps_max,
+                    "hand_ratio": round(hand / samples, 4),
+                    "actions": {
+                        _ACTIONS[code].value: count for code, count in enumerate(actions) if count
+                    },
+                }
+            )
+        return items
+
+
+class RollupFollower:
+    """Keeps a :class:`TelemetryRollups` in step with a feed owned by another process.
+
+    Each :meth:`catch_up` ingests only the samples whose ``seq`` is past the
+    last one ingested (at most what the feed still retains), so serving
+    rollups for an out-of-process controller never rescans old samples and
+    never counts one twice.  The feed only retains its newest samples, so
+    :meth:`follow` drains it from a background thread every *interval_s*;
+    samples that still fell out of the window before being read are counted
+    in :attr:`missed` (those before the first read are not).  :meth:`seed` adds samples from another source (the
+    telemetry log) and skips feed samples that are not newer than them.
+    """
+
+    def __init__(self, rollups: TelemetryRollups | None = None) -> None:
+        self.rollups = rollups or TelemetryRollups()
+        self.missed = 0
+        self._seen = 0
+        self._after_ns = 0
+        self._lock = Lock()
+        self._stopped = Event()
+        self._thread: Thread | None = None
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    def seed(self, records: Iterable[dict[str, Any]]) -> RollupFollower:
+        with self._lock:
+            for record in records:
+                snapshot = TelemetrySnapshot.from_dict(record)
+                self.rollups.add(snapshot)
+                self._after_ns = max(self._after_ns, snapshot.timestamp_ns)
+        return self
+
+    def catch_up(self, feed: TelemetryFeedPort) -> TelemetryRollups:
+        with self._lock:
+            total = feed.total
+            if total < self._seen:
+                self._seen = 0  # the writer restarted with an empty channel
+            if total > self._seen:
+                # The writer may publish between reading total and history;
+                # the margin keeps the oldest unseen samples in the window.
+                for record in feed.history(limit=total - self._seen + _RACE_MARGIN):
+                    if record["seq"] <= self._seen:
+                        continue
+                    if self._seen:
+                        self.missed += record["seq"] - self._seen - 1
+                    self._seen = record["seq"]
+                    snapshot = TelemetrySnapshot.from_dict(record)
+                    if snapshot.timestamp_ns > self._after_ns:
+                        self.rollups.add(snapshot)
+        return self.rollups
+
+    def query(self, start_s: float, end_s: float, resolution: str) -> list[dict[str, Any]]:
+        """:meth:`TelemetryRollups.query`, serialised with the background drain."""
+        with self._lock:
+            return self.rollups.query(start_s, end_s, resolution)
+
+    def follow(self, feed: TelemetryFeedPort, interval_s: float = 1.0) -> RollupFollower:
+        """Call :meth:`catch_up` on *feed* every *interval_s* until :meth:`stop`."""
+        self._stopped.clear()
+        self._thread = Thread(
+            target=self._run, args=(feed, interval_s), name="rollup-follower", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None and self._thread.is_alive():
+            self._thread.join(timeout=2.0)
+
+    def _run(self, feed: TelemetryFeedPort, interval_s: float) -> None:
+        while not self._stopped.wait(interval_s):
+            try:
+                self.catch_up(feed)
+            except Exception:
+                self._logger.exception("Could not update telemetry rollups.")
@@ -1,51 +1,125 @@
 from __future__ import annotations
 
 import json
+import logging
+from collections import deque
 from pathlib import Path
-from threading import Lock
+from threading import Condition, Lock, Thread
 from typing import Any
 
 from src.domain.models import TelemetrySnapshot
+from src.infrastructure.telemetry_channel import TelemetryChannel
+from src.infrastructure.telemetry_log import TelemetryLog
+from src.services.telemetry_ring import TelemetryRing
+from src.services.telemetry_rollup import TelemetryRollups
 
 
 class TelemetryService:
-    """Thread-safe telemetry storage with in-memory buffer and JSON persistence.
+    """Thread-safe telemetry storage with in-memory buffer and NDJSON persistence.
 
     Design notes
     ------------
-    The service keeps the full history in a ``deque``-style in-memory list so
-    that ``publish()`` never needs to read the file back — only append and trim.
-    This removes the O(n) read on every publish call that the original
-    implementation had, making high-frequency telemetry inexpensive.
+    The service keeps the most recent ``max_history`` snapshots in a
+    preallocated :class:`TelemetryRing` (a NumPy structured array), so
+    ``publish()`` is an O(1) row write and ``history()`` never touches the
+    disk; dicts are only built for the rows a caller asks for.  Persistence goes
+    through an append-only :class:`TelemetryLog`: each publish writes one
+    compact JSON line, so disk cost is O(1) per snapshot instead of rewriting
+    the whole history.  Segments rotate by size (and optionally age), and on
+    start-up the buffer is seeded with a tail read of the newest lines.
 
-    The file is still written on every publish so the REST API always serves
-    up-to-date data even when queried by an out-of-process dashboard.
+    Files in the legacy JSON-array format (the previous ``telemetry.json``)
+    are still accepted: their entries are loaded and converted to NDJSON.
+
+    With ``write_behind=True`` ``publish()`` does no I/O at all: records are
+    queued in a bounded ``deque`` and a flusher thread writes them in batches
+    once ``flush_batch`` records are pending or ``flush_interval_s`` elapses.
+    When the queue is full the oldest pending record is dropped (and counted
+    in :attr:`dropped`) so the frame loop never blocks.  :meth:`close` writes
+    whatever is still queued.
+
+    Every snapshot also updates per-second and per-minute
+    :class:`TelemetryRollups`, so long time ranges are answered from
+    aggregates instead of raw samples.
+
+    An optional :class:`TelemetryChannel` mirrors every snapshot into shared
+    memory so API processes can read live telemetry without touching files.
     """
 
-    def __init__(self, telemetry_file: Path, max_history: int = 500) -> None:
+    def __init__(
+        self,
+        telemetry_file: Path,
+        max_history: int = 500,
+        segment_max_bytes: int = 1_048_576,
+        segment_max_age_s: float | None = None,
+        write_behind: bool = False,
+        flush_interval_s: float = 0.5,
+        flush_batch: int = 64,
+        queue_capacity: int = 4096,
+        channel: TelemetryChannel | None = None,
+    ) -> None:
         self.telemetry_file = telemetry_file
         self.max_history = max_history
+        self.write_behind = write_behind
+        self.flush_interval_s = flush_interval_s
+        self.flush_batch = flush_batch
+        self._logger = logging.getLogger(self.__class__.__name__)
+        self._channel = channel
         self._lock = Lock()
         self._latest: TelemetrySnapshot | None = None
-        self._history: list[dict[str, Any]] = []
+        self._history = TelemetryRing(max_history)
+        self._rollups = TelemetryRollups()
+        self._log = TelemetryLog(
+            telemetry_file, max_bytes=segment_max_bytes, max_age_s=segment_max_age_s
+        )
+
+        for record in self._load_from_disk():
+            snapshot = TelemetrySnapshot.from_dict(record)
+            self._history.append(snapshot)
+            self._rollups.add(snapshot)
+        self.telemetry_file.touch(exist_ok=True)
 
-        self.telemetry_file.parent.mkdir(parents=True, exist_ok=True)
-        self._history = self._load_from_disk()
-        if not self.telemetry_file.exists():
-            self._flush()
+        # Write-behind state: _pending and _dropped are guarded by _pending_cond,
+        # log writes by _write_lock.
+        self._pending: deque[dict[str, Any]] = deque(maxlen=queue_capacity)
+        self._pending_cond = Condition()
+        self._write_lock = Lock()
+        self._dropped = 0
+        self._closing = False
+        self._flusher: Thread | None = None
+        if write_behind:
+            self._flusher = Thread(target=self._flush_loop, name="telemetry-flusher", daemon=True)
+            self._flusher.start()
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
     def publish(self, snapshot: TelemetrySnapshot) -> None:
-        """Append *snapshot* to the history buffer and persist to disk."""
+        """Append *snapshot* to the history buffer and the on-disk log."""
+        record = snapshot.to_dict()
+        if not self.write_behind:
+            with self._lock:
+                self._latest = snapshot
+                self._history.append(snapshot)
+                self._rollups.add(snapshot)
+                if self._channel is not None:
+                    self._channel.publish(snapshot)
+                self._log.append(record)
+            return
+
         with self._lock:
             self._latest = snapshot
-            self._history.append(snapshot.to_dict())
-            if len(self._history) > self.max_history:
-                self._history = self._history[-self.max_history :]
-            self._flush()
+            self._history.append(snapshot)
+            self._rollups.add(snapshot)
+            if self._channel is not None:
+                self._channel.publish(snapshot)
+        with self._pending_cond:
+            if len(self._pending) == self._pending.maxlen:
+                self._dropped += 1  # the append below evicts the oldest record
+            self._pending.append(record)
+            if len(self._pending) >= self.flush_batch:
+                self._pending_cond.notify()
 
     def latest(self) -> TelemetrySnapshot | None:
         """Return the most recently published snapshot, or None."""
@@ -56,25 +130,94 @@ class TelemetryService:
         """Return the last *limit* snapshots (capped by max_history)."""
         limit = max(1, min(limit, self.max_history))
         with self._lock:
-            return list(self._history[-limit:])
+            return self._history.tail(limit)
+
+    def rollups(self, start_s: float, end_s: float, resolution: str) -> list[dict[str, Any]]:
+        """Aggregated buckets in ``[start_s, end_s)`` (epoch seconds), oldest first."""
+        with self._lock:
+            return self._rollups.query(start_s, end_s, resolution)
+
+    @property
+    def total(self) -> int:
+        """Snapshots published since start-up plus those seeded from disk."""
+        with self._lock:
+            return self._history.total
+
+    @property
+    def dropped(self) -> int:
+        """Records discarded because the write-behind queue was full."""
+        return self._dropped
+
+    @property
+    def pending(self) -> int:
+        """Records queued but not yet written."""
+        return len(self._pending)
+
+    def flush(self) -> None:
+        """Write every queued record now (no-op in synchronous mode)."""
+        with self._write_lock:
+            with self._pending_cond:
+                batch = list(self._pending)
+                self._pending.clear()
+            try:
+                self._log.append_many(batch)
+            except OSError as exc:
+                with self._pending_cond:
+                    self._dropped += len(batch)
+                self._logger.warning("Could not write %d telemetry records: %s", len(batch), exc)
+
+    def close(self) -> None:
+        """Stop the flusher, write pending records and release the log file."""
+        flusher, self._flusher = self._flusher, None
+        if flusher is not None:
+            with self._pending_cond:
+                self._closing = True
+                self._pending_cond.notify()
+            flusher.join()
+        self.flush()
+        with self._lock, self._write_lock:
+            self._log.close()
+            if self._channel is not None:
+                self._channel.close()
+                self._channel = None
 
     # ------------------------------------------------------------------
     # Internals
     # ------------------------------------------------------------------
 
-    def _flush(self) -> None:
-        """Write current buffer to disk (must be called under _lock)."""
-        self.telemetry_file.write_text(
-            json.dumps(self._history, indent=2, ensure_ascii=False),
-            encoding="utf-8",
-        )
+    def _flush_loop(self) -> None:
+        while True:
+            with self._pending_cond:
+                self._pending_cond.wait_for(self._flush_due, self.flush_interval_s)
+                closing = self._closing
+            self.flush()
+            if closing:
+                return
+
+    def _flush_due(self) -> bool:
+        return self._closing or len(self._pending) >= self.flush_batch
 
     def _load_from_disk(self) -> list[dict[str, Any]]:
-        """Read history from the JSON file, returning [] on any error."""
+        """Seed the buffer from the log, migrating legacy JSON arrays first."""
+        for legacy in (self.telemetry_file, self.telemetry_file.with_suffix(".json")):
+            entries = self._read_legacy(legacy)
+            if entries is None:
+                continue
+            if legacy == self.telemetry_file or not self.telemetry_file.exists():
+                self._log.rewrite(entries[-self.max_history :])
+            break
+        return self._log.tail(self.max_history)
+
+    @staticmethod
+    def _read_legacy(path: Path) -> list[dict[str, Any]] | None:
+        """Return the entries of a JSON-array telemetry file, or None if it is not one."""
         try:
-            data = json.loads(self.telemetry_file.read_text(encoding="utf-8"))
-            if isinstance(data, list):
-                return data[-self.max_history :]
-            return []
-        except (json.JSONDecodeError, FileNotFoundError, OSError):
-            return []
+            with path.open("rb") as handle:
+                if handle.read(64).lstrip()[:1] != b"[":
+                    return None
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError):
+            return None
+        if not isinstance(data, list):
+            return None
+        return [entry for entry in data if isinstance(entry, dict)]
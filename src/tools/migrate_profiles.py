@@ -0,0 +1,85 @@
+"""Import ``profiles/*.json`` and the active-profile file into the SQLite store.
+
+Usage::
+
+    python -m src.tools.migrate_profiles [--database runtime/profiles.sqlite3]
+
+Paths default to the ones in the application config.  Existing rows with
+the same name are kept unless ``--overwrite`` is given, except the
+database's untouched bootstrap ``default``; the JSON files are never
+modified.  Afterwards set ``PROFILE_STORE=sqlite``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+from src.domain.models import Profile
+from src.services.sqlite_profile_service import SQLiteProfileService, bootstrap_profile
+from src.utils.config import load_config
+
+
+def migrate(
+    profiles_dir: Path,
+    active_profile_file: Path,
+    store: SQLiteProfileService,
+    overwrite: bool = False,
+) -> tuple[list[str], list[str]]:
+    """Copy JSON profiles into *store*; returns (imported names, skipped file messages)."""
+    existing = {profile.name: profile for profile in store.list_profiles()}
+    # Until someone edits it, the database's "default" is only the bootstrap
+    # row, so a first import takes the JSON one; after that it is kept too.
+    if existing.get("default") == bootstrap_profile():
+        del existing["default"]
+    imported: list[Profile] = []
+    skipped: list[str] = []
+    for path in sorted(profiles_dir.glob("*.json")):
+        try:
+            profile = Profile.from_dict(json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, json.JSONDecodeError, ValueError, KeyError) as exc:
+            skipped.append(f"{path.name}: {exc}")
+            continue
+        if profile.name in existing and not overwrite:
+            skipped.append(f"{path.name}: '{profile.name}' already in the database")
+            continue
+        imported.append(profile)
+    store.save_many(imported)
+
+    if active_profile_file.exists():
+        active = active_profile_file.read_text(encoding="utf-8").strip()
+        if active:
+            try:
+                store.activate_profile(active)
+            except (FileNotFoundError, ValueError) as exc:
+                skipped.append(f"{active_profile_file.name}: {exc}")
+    return [profile.name for profile in imported], skipped
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    config = load_config()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument("--profiles-dir", type=Path, default=config.profiles_dir)
+    parser.add_argument("--active-file", type=Path, default=config.active_profile_file)
+    parser.add_argument("--database", type=Path, default=config.profiles_db_file)
+    parser.add_argument(
+        "--overwrite", action="store_true", help="Replace profiles already in the database."
+    )
+    args = parser.parse_args(argv)
+
+    store = SQLiteProfileService(args.database)
+    try:
+        imported, skipped = migrate(args.profiles_dir, args.active_file, store, args.overwrite)
+    finally:
+        store.close()
+    for message in skipped:
+        print(f"skipped {message}", file=sys.stderr)
+    print(f"Imported {len(imported)} profile(s) into {args.database}.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,368 @@
+"""Grid-search lane bounds, cooldown and smoothing over labeled recorded sessions.
+
+Usage::
+
+    python -m src.tools.tune_profile sessions/*.ndjson --name tuned \\
+        --out profiles/tuned.json [--left 0.25:0.45:0.025] [--workers 8]
+
+Each session is NDJSON, one frame per line::
+
+    {"t_ms": 1033.4, "label": "left", "landmarks": [[x, y], ... 21 pairs]}
+
+``label`` is the action the player meant on that frame (``idle``,
+``center``, ``left``, ``right``, ``jump``, ``slide``, ``hoverboard``) and
+``landmarks`` is ``null`` when no hand was detected.  Every configuration is
+replayed through ``GestureInterpreter`` and ``GameController`` with a
+keyboard that only records presses on the session clock, and ranked by F1
+over the expected key presses, then by mean trigger latency.  The best one
+is written as a ``Profile`` JSON ready for ``profiles/``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import os
+import sys
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+from src.core.controller import GameController
+from src.domain.actions import Action
+from src.domain.models import PROFILE_NAME_PATTERN, Profile
+from src.services.gesture_service import GestureInterpreter
+
+# Presses later than this after the label changed are not credited to it.
+MATCH_WINDOW_MS = 600.0
+_PRESSABLE = frozenset({Action.LEFT, Action.RIGHT, Action.JUMP, Action.SLIDE, Action.HOVERBOARD})
+
+
+@dataclass(frozen=True, slots=True)
+class Session:
+    """A recorded session reduced to the per-frame features the replay needs.
+
+    Landmark-derived values (weighted centre, finger states) do not depend
+    on any tuned parameter, so they are computed once when loading.
+    """
+
+    name: str
+    t_ms: np.ndarray  # float64, (n,)
+    labels: tuple[Action, ...]
+    has_hand: np.ndarray  # bool, (n,)
+    centers: np.ndarray  # float64, (n,)
+    fingers: np.ndarray  # bool, (n, 5)
+
+
+@dataclass(frozen=True, slots=True)
+class TuningParams:
+    left_bound: float
+    right_bound: float
+    cooldown_ms: int
+    smoothing: float
+
+
+@dataclass(frozen=True, slots=True)
+class TuningResult:
+    params: TuningParams
+    expected: int
+    matched: int
+    presses: int
+    latency_ms: float  # mean over matched presses; inf when nothing matched
+
+    @property
+    def precision(self) -> float:
+        return self.matched / self.presses if self.presses else 0.0
+
+    @property
+    def recall(self) -> float:
+        return self.matched / self.expected if self.expected else 0.0
+
+    @property
+    def f1(self) -> float:
+        total = self.precision + self.recall
+        return 2 * self.precision * self.recall / total if total else 0.0
+
+    def rank_key(self) -> tuple[float, float]:
+        return (-self.f1, self.latency_ms)
+
+
+class SimulatedKeyboard:
+    """``KeyboardPort`` that records presses against the replay clock."""
+
+    def __init__(self, cooldown_ms: int) -> None:
+        self.cooldown_ms = cooldown_ms
+        self.now_ms = 0.0
+        self.presses: list[tuple[float, Action]] = []
+        self._last_sent: dict[Action, float] = {}
+
+    def send(self, action: Action) -> bool:
+        if action not in _PRESSABLE:
+            return False
+        last = self._last_sent.get(action)
+        if last is not None and self.now_ms - last < self.cooldown_ms:
+            return False
+        self._last_sent[action] = self.now_ms
+        self.presses.append((self.now_ms, action))
+        return True
+
+
+# ---------------------------------------------------------------------------
+# Loading
+# ---------------------------------------------------------------------------
+
+
+def load_session(path: Path) -> Session:
+    t_ms: list[float] = []
+    labels: list[Action] = []
+    has_hand: list[bool] = []
+    centers: list[float] = []
+    fingers: list[list[bool]] = []
+    with path.open(encoding="utf-8") as handle:
+        for line_no, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                label = Action(str(record["label"]).upper())
+                landmarks = record.get("landmarks")
+                t_ms.append(float(record["t_ms"]))
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError) as exc:
+                raise ValueError(f"{path}:{line_no}: invalid frame record ({exc}).") from exc
+            labels.append(label)
+            if landmarks:
+                hand = [SimpleNamespace(x=float(x), y=float(y)) for x, y, *_ in landmarks]
+                hand_fingers, center = GestureInterpreter.hand_features(hand)
+                has_hand.append(True)
+                centers.append(center)
+                fingers.append(hand_fingers)
+            else:
+                has_hand.append(False)
+                centers.append(0.0)
+                fingers.append([False] * 5)
+    return Session(
+        name=path.name,
+        t_ms=np.asarray(t_ms, dtype=np.float64),
+        labels=tuple(labels),
+        has_hand=np.asarray(has_hand, dtype=np.bool_),
+        centers=np.asarray(centers, dtype=np.float64),
+        fingers=np.asarray(fingers, dtype=np.bool_).reshape(-1, 5),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Replay & scoring
+# ---------------------------------------------------------------------------
+
+
+def expected_presses(session: Session) -> list[tuple[float, Action]]:
+    """Onsets of pressable labels: the moments a key press is wanted."""
+    onsets: list[tuple[float, Action]] = []
+    previous = Action.IDLE
+    for t_ms, label in zip(session.t_ms.tolist(), session.labels, strict=True):
+        if label != previous and label in _PRESSABLE:
+            onsets.append((t_ms, label))
+        previous = label
+    return onsets
+
+
+def replay(session: Session, params: TuningParams) -> list[tuple[float, Action]]:
+    """Key presses the controller would send for *session* under *params*."""
+    interpreter = GestureInterpreter(params.left_bound, params.right_bound, params.smoothing)
+    keyboard = SimulatedKeyboard(params.cooldown_ms)
+    controller = GameController(keyboard, window_title="", auto_focus_window=False)
+    rows = zip(
+        session.t_ms.tolist(),
+        session.has_hand.tolist(),
+        session.centers.tolist(),
+        session.fingers.tolist(),
+        strict=True,
+    )
+    # Landmarks were reduced to features in load_session; the interpreter
+    # takes it from there exactly as GestureInterpreter.interpret would.
+    for t_ms, has_hand, center, fingers in rows:
+        keyboard.now_ms = t_ms
+        snapshot = interpreter.interpret_features(fingers if has_hand else None, center)
+        controller.perform_action(snapshot.action)
+    return keyboard.presses
+
+
+def score(
+    expected: Sequence[tuple[float, Action]], presses: Sequence[tuple[float, Action]]
+) -> tuple[int, list[float]]:
+    """Greedily match presses to expected onsets; returns (matched, latencies)."""
+    latencies: list[float] = []
+    times = [t_ms for t_ms, _ in presses]
+    used = [False] * len(presses)
+    for onset, action in expected:
+        for index in range(bisect_left(times, onset), len(presses)):
+            t_ms, pressed = presses[index]
+            if t_ms > onset + MATCH_WINDOW_MS:
+                break
+            if not used[index] and pressed == action:
+                used[index] = True
+                latencies.append(t_ms - onset)
+                break
+    return len(latencies), latencies
+
+
+def evaluate(sessions: Sequence[Session], params: TuningParams) -> TuningResult:
+    expected_total = matched_total = press_total = 0
+    latencies: list[float] = []
+    for session in sessions:
+        expected = expected_presses(session)
+        presses = replay(session, params)
+        matched, session_latencies = score(expected, presses)
+        expected_total += len(expected)
+        matched_total += matched
+        press_total += len(presses)
+        latencies.extend(session_latencies)
+    return TuningResult(
+        params=params,
+        expected=expected_total,
+        matched=matched_total,
+        presses=press_total,
+        latency_ms=float(np.mean(latencies)) if latencies else float("inf"),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Parallel search
+# ---------------------------------------------------------------------------
+
+# Set once per worker process by _init_worker, so tasks only carry parameters.
+_WORKER_SESSIONS: tuple[Session, ...] = ()
+
+
+def _init_worker(sessions: tuple[Session, ...]) -> None:
+    global _WORKER_SESSIONS
+    _WORKER_SESSIONS = sessions
+
+
+def _evaluate_chunk(chunk: Sequence[TuningParams]) -> list[TuningResult]:
+    return [evaluate(_WORKER_SESSIONS, params) for params in chunk]
+
+
+def build_grid(
+    left: Iterable[float],
+    right: Iterable[float],
+    cooldown: Iterable[int],
+    smoothing: Iterable[float],
+) -> list[TuningParams]:
+    """Every combination that forms a valid profile."""
+    grid = []
+    for left_bound, right_bound, cooldown_ms, alpha in itertools.product(
+        left, right, cooldown, smoothing
+    ):
+        if not 0.05 <= left_bound < right_bound <= 0.95 or not 80 <= cooldown_ms <= 1200:
+            continue
+        if not 0.0 <= alpha <= 1.0:
+            continue
+        grid.append(TuningParams(left_bound, right_bound, cooldown_ms, alpha))
+    return grid
+
+
+def search(
+    sessions: Sequence[Session], grid: Sequence[TuningParams], workers: int | None = None
+) -> list[TuningResult]:
+    """Evaluate *grid* over *sessions*, best first.
+
+    The grid is cut into a few chunks per worker: large enough that task
+    overhead is negligible, small enough that workers finish together.
+    Sessions travel to each worker once, through the pool initializer.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(grid) < 2:
+        results = [evaluate(sessions, params) for params in grid]
+    else:
+        chunk_size = max(1, len(grid) // (workers * 4))
+        chunks = [grid[i : i + chunk_size] for i in range(0, len(grid), chunk_size)]
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(tuple(sessions),)
+        ) as pool:
+            results = [result for batch in pool.map(_evaluate_chunk, chunks) for result in batch]
+    return sorted(results, key=TuningResult.rank_key)
+
+
+def _float_range(spec: str) -> list[float]:
+    """``"0.3"``, ``"0.3,0.35"`` or ``"start:stop:step"`` (stop inclusive)."""
+    if ":" in spec:
+        start, stop, step = (float(part) for part in spec.split(":"))
+        return [round(value, 4) for value in np.arange(start, stop + step / 2, step)]
+    return [float(part) for part in spec.split(",")]
+
+
+def _int_range(spec: str) -> list[int]:
+    return [round(value) for value in _float_range(spec)]
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument("sessions", nargs="+", type=Path, help="Labeled NDJSON sessions.")
+    parser.add_argument("--name", default="tuned", help="Name of the emitted profile.")
+    parser.add_argument("--out", type=Path, default=None, help="Profile JSON path (stdout).")
+    parser.add_argument("--left", default="0.25:0.45:0.025")
+    parser.add_argument("--right", default="0.55:0.75:0.025")
+    parser.add_argument("--cooldown", default="120:400:40")
+    parser.add_argument(
+        "--smoothing",
+        default="0.22",
+        help="EMA alphas to sweep. The controller uses 0.22; profiles do not store it.",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Processes (all cores).")
+    parser.add_argument("--top", type=int, default=5, help="Results listed on stderr.")
+    args = parser.parse_args(argv)
+    if not PROFILE_NAME_PATTERN.match(args.name):
+        parser.error("--name must be 1-40 letters, numbers, '_' or '-'.")
+
+    try:
+        sessions = [load_session(path) for path in args.sessions]
+    except (OSError, ValueError) as exc:
+        print(exc, file=sys.stderr)
+        return 2
+    grid = build_grid(
+        _float_range(args.left),
+        _float_range(args.right),
+        _int_range(args.cooldown),
+        _float_range(args.smoothing),
+    )
+    if not grid:
+        print("The parameter grid has no valid combination.", file=sys.stderr)
+        return 2
+
+    results = search(sessions, grid, args.workers)
+    for result in results[: args.top]:
+        p = result.params
+        print(
+            f"f1={result.f1:.3f} latency={result.latency_ms:.0f}ms "
+            f"left={p.left_bound} right={p.right_bound} "
+            f"cooldown={p.cooldown_ms} smoothing={p.smoothing}",
+            file=sys.stderr,
+        )
+
+    best = results[0]
+    profile = Profile(
+        name=args.name,
+        description=f"Tuned on {len(sessions)} session(s), F1 {best.f1:.2f}.",
+        left_bound=best.params.left_bound,
+        right_bound=best.params.right_bound,
+        cooldown_ms=best.params.cooldown_ms,
+    )
+    profile.validate()
+    payload = json.dumps(profile.to_dict(), indent=2, ensure_ascii=False)
+    if args.out is None:
+        print(payload)
+    else:
+        args.out.write_text(payload, encoding="utf-8")
+        print(f"Wrote {args.out}.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import math
 import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
 
 import cv2
 import numpy as np
@@ -9,12 +12,264 @@ import numpy as np
 from src.domain.actions import Action
 from src.domain.models import GestureSnapshot
 
+# Fixed HUD geometry shared by the layer builders and the per-frame pass.
+_HEADER_H = 64
+_FOOTER_H = 48
+_LANE_TOP = 64
+_LANE_BOTTOM_MARGIN = 72
+_LEGEND_W = 330
+_LANDMARK_MARGIN = 10  # outer ring radius (max 8) plus anti-aliasing
+_MAX_CACHED_LAYOUTS = 4
+_TEXT_CACHE_CAPACITY = 256
+
+# MediaPipe hand skeleton as (start, end) landmark index pairs.
+# Reference: https://developers.google.com/mediapipe/solutions/vision/hand_landmarker
+_HAND_CONNECTIONS = np.array(
+    [
+        (0, 1), (1, 2), (2, 3), (3, 4),  # thumb
+        (0, 5), (5, 6), (6, 7), (7, 8),  # index
+        (5, 9), (9, 10), (10, 11), (11, 12),  # middle
+        (9, 13), (13, 14), (14, 15), (15, 16),  # ring
+        (13, 17), (0, 17), (17, 18), (18, 19), (19, 20),  # pinky and palm
+    ],
+    dtype=np.intp,
+)  # fmt: skip
+
+Rect = tuple[int, int, int, int]  # (x0, y0, x1, y1), end-exclusive
+
+
+def _intersect(a: Rect, b: Rect) -> Rect | None:
+    x0, y0 = max(a[0], b[0]), max(a[1], b[1])
+    x1, y1 = min(a[2], b[2]), min(a[3], b[3])
+    if x0 >= x1 or y0 >= y1:
+        return None
+    return x0, y0, x1, y1
+
+
+def _union(a: Rect | None, b: Rect) -> Rect:
+    if a is None:
+        return b
+    return min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3])
+
+
+@dataclass(slots=True)
+class _Layer:
+    """Pre-rendered HUD fragment anchored at ``(x, y)`` on the canvas.
+
+    Opaque layers are plain copies.  Translucent layers store premultiplied
+    colour and a per-channel inverse alpha (both uint8, 255 = 1.0) so
+    compositing is one saturating multiply-add in OpenCV.
+    """
+
+    x: int
+    y: int
+    pixels: np.ndarray
+    inverse_alpha: np.ndarray | None = None
+
+    @property
+    def rect(self) -> Rect:
+        h, w = self.pixels.shape[:2]
+        return self.x, self.y, self.x + w, self.y + h
+
+    def blit(self, canvas, clip: Rect | None = None) -> None:
+        """Composite the layer, or only the part inside *clip*, onto *canvas*."""
+        self._composite(canvas, self.rect if clip is None else clip, self.x, self.y)
+
+    def stamp(self, canvas, x: int, y: int) -> None:
+        """Composite with ``(self.x, self.y)`` taken relative to ``(x, y)``."""
+        h, w = self.pixels.shape[:2]
+        ox, oy = x + self.x, y + self.y
+        rect = _intersect((ox, oy, ox + w, oy + h), (0, 0, canvas.shape[1], canvas.shape[0]))
+        if rect is not None:
+            self._composite(canvas, rect, ox, oy)
+
+    def _composite(self, canvas, rect: Rect, ox: int, oy: int) -> None:
+        x0, y0, x1, y1 = rect
+        roi = canvas[y0:y1, x0:x1]
+        src = (slice(y0 - oy, y1 - oy), slice(x0 - ox, x1 - ox))
+        if self.inverse_alpha is None:
+            roi[:] = self.pixels[src]
+            return
+        behind = cv2.multiply(roi, self.inverse_alpha[src], scale=1 / 255.0)
+        cv2.add(behind, self.pixels[src], dst=roi)
+
+
+_PIXEL = np.dtype("V3")
+
+
+@dataclass(slots=True)
+class _MarkerSprite:
+    """Joint marker kept as the sparse set of pixels it touches.
+
+    Offsets are relative to the marker centre, so the joints of a hand are
+    stamped with a few gather/blend/scatter passes instead of per-point
+    draws.  Markers that would overlap go into separate passes, stamped in
+    point order, so each one blends over the markers drawn before it.
+    Markers crossing the image border are drawn with *draw*, the OpenCV
+    calls the sprite was rasterised from.
+    """
+
+    dx: np.ndarray
+    dy: np.ndarray
+    pixels: np.ndarray  # (K, 3) premultiplied colour, +0.5 for rounding
+    inverse_alpha: np.ndarray  # (K, 3) in [0, 1]
+    extent: int
+    draw: Callable[[np.ndarray, int, int], None]  # one marker centred on (x, y)
+    _tiled: dict[int, tuple[np.ndarray, np.ndarray]] = field(default_factory=dict)
+
+    def stamp_all(self, image, points: np.ndarray) -> None:
+        """Blend the marker centred on each of *points* into *image* (C-contiguous)."""
+        h, w = image.shape[:2]
+        e = self.extent
+        for layer in self._layers(points):
+            group = points[layer]
+            xs, ys = group[:, 0], group[:, 1]
+            inside = (xs >= e) & (xs < w - e) & (ys >= e) & (ys < h - e)
+            if inside.all():
+                self._blend(image, group)
+                continue
+            if inside.any():
+                self._blend(image, group[inside])
+            for x, y in group[~inside].tolist():
+                self.draw(image, x, y)
+
+    def _layers(self, points: np.ndarray) -> list[np.ndarray]:
+        """Indices of *points* grouped so no two markers in a group overlap.
+
+        A point goes one layer above the highest earlier point it overlaps,
+        so overlapping markers are composited in the same order as stamping
+        them one at a time.
+        """
+        count = len(points)
+        if count == 0:
+            return []
+        gaps = np.abs(points[:, None, :] - points[None, :, :]).max(axis=2)
+        overlaps = gaps <= 2 * self.extent
+        depth = np.zeros(count, dtype=np.intp)
+        for index in range(1, count):
+            below = overlaps[index, :index]
+            if below.any():
+                depth[index] = depth[:index][below].max() + 1
+        return [np.flatnonzero(depth == level) for level in range(int(depth.max()) + 1)]
+
+    def _blend(self, image, points: np.ndarray) -> None:
+        """One gather/blend/scatter for non-overlapping markers inside *image*."""
+        w = image.shape[1]
+        xs = points[:, 0, None] + self.dx
+        ys = points[:, 1, None] + self.dy
+        index = (ys * w + xs).ravel()
+        inverse_alpha, pixels = self._tiles(len(points))
+
+        # One 3-byte item per pixel: gathers and scatters whole pixels at once,
+        # several times faster than fancy indexing an (N, 3) view.
+        flat = image.reshape(-1).view(_PIXEL)
+        under = np.take(flat, index).view(np.uint8).reshape(-1, 3)
+        blended = (under * inverse_alpha + pixels).astype(np.uint8)
+        np.put(flat, index, blended.reshape(-1).view(_PIXEL))
+
+    def _tiles(self, count: int) -> tuple[np.ndarray, np.ndarray]:
+        tiles = self._tiled.get(count)
+        if tiles is None:
+            tiles = (
+                np.tile(self.inverse_alpha, (count, 1)),
+                np.tile(self.pixels, (count, 1)),
+            )
+            self._tiled[count] = tiles
+        return tiles
+
+
+_SpriteKey = tuple[str, int, float, tuple[int, int, int], int]
+
+
+class _TextSpriteCache:
+    """Rasterises each distinct HUD string once and alpha-blits it afterwards.
+
+    Static labels are pinned for the HUD's lifetime.  Dynamic ones (action
+    names, FPS readouts, profile names) live in an LRU of *capacity* entries.
+    Sprites are stored relative to the ``cv2.putText`` baseline origin.
+    """
+
+    def __init__(self, capacity: int = _TEXT_CACHE_CAPACITY) -> None:
+        self.capacity = capacity
+        self._pinned: dict[_SpriteKey, _Layer] = {}
+        self._recent: OrderedDict[_SpriteKey, _Layer] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._pinned) + len(self._recent)
+
+    def get(self, key: _SpriteKey, pinned: bool = False) -> _Layer:
+        sprite = self._pinned.get(key)
+        if sprite is not None:
+            return sprite
+        sprite = self._recent.get(key)
+        if sprite is not None:
+            self._recent.move_to_end(key)
+            return sprite
+
+        sprite = self._rasterise(*key)
+        if pinned:
+            self._pinned[key] = sprite
+        else:
+            self._recent[key] = sprite
+            if len(self._recent) > self.capacity:
+                self._recent.popitem(last=False)
+        return sprite
+
+    @staticmethod
+    def _rasterise(
+        text: str, font: int, scale: float, color: tuple[int, int, int], thickness: int
+    ) -> _Layer:
+        (text_w, text_h), baseline = cv2.getTextSize(text, font, scale, thickness)
+        pad = thickness + 2
+        org_x, org_y = pad, pad + text_h
+        mask = np.zeros((text_h + baseline + 2 * pad, text_w + 2 * pad), dtype=np.uint8)
+        cv2.putText(mask, text, (org_x, org_y), font, scale, 255, thickness, cv2.LINE_AA)
+
+        rows = np.flatnonzero(mask.any(axis=1))
+        cols = np.flatnonzero(mask.any(axis=0))
+        if not rows.size:
+            return _Layer(x=0, y=0, pixels=np.zeros((0, 0, 3), dtype=np.uint8))
+        y0, y1 = int(rows[0]), int(rows[-1]) + 1
+        x0, x1 = int(cols[0]), int(cols[-1]) + 1
+        coverage = cv2.cvtColor(mask[y0:y1, x0:x1], cv2.COLOR_GRAY2BGR)
+        solid = np.empty_like(coverage)
+        solid[:] = color
+        return _Layer(
+            x=x0 - org_x,
+            y=y0 - org_y,
+            pixels=cv2.multiply(solid, coverage, scale=1 / 255.0),
+            inverse_alpha=255 - coverage,
+        )
+
+
+@dataclass(slots=True)
+class _LayerSet:
+    """Static layers plus the reusable canvas for one (resolution, help) key.
+
+    ``base`` is the fully static frame (gradient, neutral lanes, header and
+    footer bars) without the legend.  ``canvas`` always holds ``base`` with
+    the active lane and legend on top, except for the ``dirty`` rects that
+    the previous frame drew dynamic content into.
+    """
+
+    base: np.ndarray
+    canvas: np.ndarray
+    bars: tuple[Rect, Rect]
+    lanes: dict[Action, _Layer] = field(default_factory=dict)
+    legend: _Layer | None = None
+    active_lane: _Layer | None = None
+    dirty: list[Rect] = field(default_factory=list)
+
 
 class HUD:
     def __init__(self) -> None:
         self.font_title = cv2.FONT_HERSHEY_DUPLEX
         self.font_body = cv2.FONT_HERSHEY_SIMPLEX
         self._show_help = True
+        self._splash: np.ndarray | None = None
+        self._layers: dict[tuple[int, int, bool], _LayerSet] = {}
+        self._text = _TextSpriteCache()
+        self._markers: dict[int, _MarkerSprite] = {}
 
         self.palette = {
             "bg_dark": (16, 22, 27),
@@ -39,44 +294,242 @@ class HUD:
         fps: int,
         profile_name: str,
     ):
-        canvas = frame.copy()
-        h, w, _ = canvas.shape
+        """Render the HUD for *frame*'s resolution and return the canvas.
+
+        The returned image is reused by the next ``draw`` call; copy it if it
+        must outlive the current frame.
+        """
+        h, w = frame.shape[:2]
+        layers = self._get_layers(w, h)
+        canvas = layers.canvas
+
+        # Regions drawn over last frame go back to their static content.
+        restore = layers.dirty
+        lane = layers.lanes.get(snapshot.action)
+        if lane is not layers.active_lane:
+            restore += [layer.rect for layer in (layers.active_lane, lane) if layer is not None]
+            layers.active_lane = lane
 
-        self._draw_atmosphere(canvas, w, h)
-        self._draw_lanes(canvas, snapshot.action, w, h)
+        header_rect = (0, 0, w, _HEADER_H + 1)
+        dirty: list[Rect] = [header_rect]
+        points = None
         if landmarks:
-            self._draw_landmarks(canvas, landmarks[0], w, h)
+            points = self._landmark_points(landmarks[0], w, h)
+            bbox = _intersect(self._points_rect(points), (0, 0, w, h))
+            if bbox is not None:
+                dirty.append(bbox)
+
+        # The legend sits above lanes and landmarks, so every touched pixel
+        # under it is restored and re-blended once, within one bounding ROI.
+        legend_clip: Rect | None = None
+        if layers.legend is not None:
+            for rect in (*restore, *dirty):
+                overlap = _intersect(rect, layers.legend.rect)
+                if overlap is not None:
+                    legend_clip = _union(legend_clip, overlap)
+            if legend_clip is not None:
+                restore.append(legend_clip)
+
+        for rect in dict.fromkeys(restore):
+            self._restore(layers, rect)
+        if points is not None:
+            self._draw_landmarks(canvas, points)
+            # Header and footer bars are drawn above the landmarks.
+            for bar in layers.bars:
+                for rect in dirty[1:]:
+                    overlap = _intersect(rect, bar)
+                    if overlap is not None:
+                        self._restore(layers, overlap)
         self._draw_header(canvas, snapshot, fps, profile_name, w)
-        self._draw_footer(canvas, w, h)
-        if self._show_help:
-            self._draw_legend(canvas, w, h)
+        if legend_clip is not None and layers.legend is not None:
+            layers.legend.blit(canvas, legend_clip)
+
+        layers.dirty = dirty
         return canvas
 
-    def show_startup_screen(self, window_title: str) -> None:
-        screen = np.zeros((520, 900, 3), dtype=np.uint8)
-        self._draw_atmosphere(screen, 900, 520)
-        cv2.putText(
-            screen,
-            "SUBWAY SURF CONTROL HUB",
-            (120, 230),
-            self.font_title,
-            1.1,
-            self.palette["text_main"],
-            2,
-            cv2.LINE_AA,
-        )
-        cv2.putText(
-            screen,
-            "Loading camera, detector and input pipeline...",
-            (160, 280),
-            self.font_body,
-            0.7,
-            self.palette["text_muted"],
-            1,
-            cv2.LINE_AA,
-        )
+    def show_startup_screen(self, window_title: str, steps: Sequence[tuple[str, str]] = ()) -> None:
+        """Draw the splash screen with one line per ``(label, status)`` startup step.
+
+        *status* is ``"pending"``, ``"ready"`` or ``"failed"``.  Only pumps
+        the window event loop; the caller redraws it as steps complete.
+        """
+        if self._splash is None:
+            base = np.zeros((520, 900, 3), dtype=np.uint8)
+            self._draw_atmosphere(base, 900, 520)
+            self._put_text(
+                base,
+                "SUBWAY SURF CONTROL HUB",
+                (120, 200),
+                self.font_title,
+                1.1,
+                self.palette["text_main"],
+                2,
+                pinned=True,
+            )
+            self._splash = base
+        screen = self._splash.copy()
+
+        colors = {
+            "pending": self.palette["text_muted"],
+            "ready": self.palette["success"],
+            "failed": self.palette["danger"],
+        }
+        done = sum(status != "pending" for _, status in steps)
+        if steps:
+            cv2.rectangle(screen, (160, 240), (740, 250), self.palette["bg_soft"], -1)
+            filled = 160 + (740 - 160) * done // len(steps)
+            cv2.rectangle(screen, (160, 240), (filled, 250), self.palette["accent_secondary"], -1)
+        for row, (label, status) in enumerate(steps):
+            self._put_text(
+                screen,
+                f"{label}: {status}",
+                (160, 290 + row * 34),
+                self.font_body,
+                0.7,
+                colors.get(status, self.palette["text_muted"]),
+                1,
+            )
         cv2.imshow(window_title, screen)
-        cv2.waitKey(850)
+        cv2.waitKey(1)
+
+    # ------------------------------------------------------------------
+    # Static layer cache
+    # ------------------------------------------------------------------
+
+    def _get_layers(self, w: int, h: int) -> _LayerSet:
+        key = (w, h, self._show_help)
+        layers = self._layers.get(key)
+        if layers is None:
+            if len(self._layers) >= _MAX_CACHED_LAYOUTS:
+                self._layers.clear()
+            layers = self._build_layers(w, h, self._show_help)
+            self._layers[key] = layers
+        return layers
+
+    def _build_layers(self, w: int, h: int, show_help: bool) -> _LayerSet:
+        """Render every static HUD element once for a given resolution."""
+
+        def base(image) -> None:
+            self._draw_atmosphere(image, w, h)
+            self._draw_lanes(image, Action.IDLE, w, h)
+            self._draw_header_static(image, w)
+            self._draw_footer(image, w, h)
+
+        base_pixels = self._capture(base, w, h, (0, 0, w, h)).pixels
+        bars = ((0, 0, w, _HEADER_H + 1), (0, h - _FOOTER_H, w, h))
+
+        # Lane patches start below the header bar, which covers their top row.
+        lanes: dict[Action, _Layer] = {}
+        lane_bottom = h - _LANE_BOTTOM_MARGIN + 1
+        for action, (x0, x1) in self._lane_spans(w).items():
+
+            def highlighted(image, action: Action = action) -> None:
+                self._draw_atmosphere(image, w, h)
+                self._draw_lanes(image, action, w, h)
+
+            lanes[action] = self._capture(
+                highlighted, w, h, (x0, _HEADER_H + 1, x1 + 1, lane_bottom)
+            )
+
+        legend = None
+        if show_help:
+            legend = self._capture(
+                lambda image: self._draw_legend(image, w, h),
+                w,
+                h,
+                self._legend_rect(w, h),
+                grow=True,
+            )
+
+        canvas = base_pixels.copy()
+        if legend is not None:
+            legend.blit(canvas)
+        return _LayerSet(base=base_pixels, canvas=canvas, bars=bars, lanes=lanes, legend=legend)
+
+    @staticmethod
+    def _restore(layers: _LayerSet, rect: Rect) -> None:
+        """Reset *rect* on the canvas to the static base plus the active lane."""
+        x0, y0, x1, y1 = rect
+        layers.canvas[y0:y1, x0:x1] = layers.base[y0:y1, x0:x1]
+        if layers.active_lane is not None:
+            overlap = _intersect(rect, layers.active_lane.rect)
+            if overlap is not None:
+                layers.active_lane.blit(layers.canvas, overlap)
+
+    @staticmethod
+    def _landmark_points(landmarks, w: int, h: int) -> np.ndarray:
+        """Normalised landmarks -> (N, 2) int32 pixel coordinates."""
+        coords = np.array([(lm.x, lm.y) for lm in landmarks], dtype=np.float32)
+        return (coords * np.array((w, h), dtype=np.float32)).astype(np.int32)
+
+    @staticmethod
+    def _points_rect(points: np.ndarray) -> Rect:
+        x0, y0 = points.min(axis=0).tolist()
+        x1, y1 = points.max(axis=0).tolist()
+        return (
+            x0 - _LANDMARK_MARGIN,
+            y0 - _LANDMARK_MARGIN,
+            x1 + _LANDMARK_MARGIN + 1,
+            y1 + _LANDMARK_MARGIN + 1,
+        )
+
+    @staticmethod
+    def _capture(
+        draw: Callable[[np.ndarray], None],
+        w: int,
+        h: int,
+        rect: Rect,
+        grow: bool = False,
+    ) -> _Layer:
+        """Rasterise *draw* into a layer clipped to *rect* (x0, y0, x1, y1).
+
+        The drawing is rendered over black and over white; pixels that come
+        out identical are opaque, the rest yield an exact alpha mask.  This
+        lets translucent overlays keep their original blending maths.  With
+        *grow*, the rect is extended to everything the drawing touched.
+        """
+        x0, y0 = max(0, rect[0]), max(0, rect[1])
+        x1, y1 = min(w, rect[2]), min(h, rect[3])
+        over_black = np.zeros((h, w, 3), dtype=np.uint8)
+        over_white = np.full((h, w, 3), 255, dtype=np.uint8)
+        draw(over_black)
+        draw(over_white)
+
+        # Legend lines can overflow the card on small frames.
+        touched = np.any((over_black != 0) | (over_white != 255), axis=2)
+        rows = np.flatnonzero(touched.any(axis=1))
+        cols = np.flatnonzero(touched.any(axis=0))
+        if grow and rows.size:
+            y0, y1 = min(y0, int(rows[0])), max(y1, int(rows[-1]) + 1)
+            x0, x1 = min(x0, int(cols[0])), max(x1, int(cols[-1]) + 1)
+
+        black = over_black[y0:y1, x0:x1]
+        white = over_white[y0:y1, x0:x1]
+        if np.array_equal(black, white):
+            return _Layer(x=x0, y=y0, pixels=black.copy())
+        # Over black the result is the premultiplied colour; the extra
+        # brightness picked up over white is exactly the inverse alpha.
+        return _Layer(x=x0, y=y0, pixels=black.copy(), inverse_alpha=white - black)
+
+    @staticmethod
+    def _lane_spans(w: int) -> dict[Action, tuple[int, int]]:
+        left_x = int(w * 0.35)
+        right_x = int(w * 0.65)
+        return {
+            Action.LEFT: (0, left_x),
+            Action.CENTER: (left_x, right_x),
+            Action.RIGHT: (right_x, w),
+        }
+
+    @staticmethod
+    def _legend_rect(w: int, h: int) -> Rect:
+        x0, y0 = w - _LEGEND_W - 16, 78
+        y1 = min(h - 90, y0 + 220)
+        return x0, y0, x0 + _LEGEND_W + 1, y1 + 1
+
+    # ------------------------------------------------------------------
+    # Drawing primitives
+    # ------------------------------------------------------------------
 
     def _draw_atmosphere(self, image, w: int, h: int) -> None:
         # Vectorised vertical gradient — O(1) NumPy ops instead of O(h) cv2.line calls.
@@ -95,39 +548,72 @@ class HUD:
     def _draw_lanes(self, image, action: Action, w: int, h: int) -> None:
         left_x = int(w * 0.35)
         right_x = int(w * 0.65)
+        top, bottom = _LANE_TOP, h - _LANE_BOTTOM_MARGIN
 
-        overlay = image.copy()
+        # Blend only the lane band, in place through a view of *image*.
+        band = image[top : bottom + 1]
+        overlay = band.copy()
         neutral = (54, 69, 81)
         active_left = (53, 161, 255)
         active_center = (69, 220, 169)
         active_right = (65, 120, 255)
+        band_h = bottom - top
 
-        cv2.rectangle(overlay, (0, 64), (left_x, h - 72), neutral, -1)
-        cv2.rectangle(overlay, (left_x, 64), (right_x, h - 72), neutral, -1)
-        cv2.rectangle(overlay, (right_x, 64), (w, h - 72), neutral, -1)
+        cv2.rectangle(overlay, (0, 0), (left_x, band_h), neutral, -1)
+        cv2.rectangle(overlay, (left_x, 0), (right_x, band_h), neutral, -1)
+        cv2.rectangle(overlay, (right_x, 0), (w, band_h), neutral, -1)
 
         if action == Action.LEFT:
-            cv2.rectangle(overlay, (0, 64), (left_x, h - 72), active_left, -1)
+            cv2.rectangle(overlay, (0, 0), (left_x, band_h), active_left, -1)
         elif action == Action.CENTER:
-            cv2.rectangle(overlay, (left_x, 64), (right_x, h - 72), active_center, -1)
+            cv2.rectangle(overlay, (left_x, 0), (right_x, band_h), active_center, -1)
         elif action == Action.RIGHT:
-            cv2.rectangle(overlay, (right_x, 64), (w, h - 72), active_right, -1)
+            cv2.rectangle(overlay, (right_x, 0), (w, band_h), active_right, -1)
 
-        cv2.addWeighted(overlay, 0.20, image, 0.80, 0, image)
+        cv2.addWeighted(overlay, 0.20, band, 0.80, 0, band)
 
-        cv2.line(image, (left_x, 64), (left_x, h - 72), (179, 201, 214), 2, cv2.LINE_AA)
-        cv2.line(image, (right_x, 64), (right_x, h - 72), (179, 201, 214), 2, cv2.LINE_AA)
+        cv2.line(image, (left_x, top), (left_x, bottom), (179, 201, 214), 2, cv2.LINE_AA)
+        cv2.line(image, (right_x, top), (right_x, bottom), (179, 201, 214), 2, cv2.LINE_AA)
+
+    def _draw_landmarks(self, image, points: np.ndarray) -> None:
+        if len(points) > int(_HAND_CONNECTIONS.max()):
+            bones = points[_HAND_CONNECTIONS]  # (connections, 2, 2)
+            cv2.polylines(image, bones, False, self.palette["text_muted"], 1, cv2.LINE_AA)
 
-    def _draw_landmarks(self, image, landmarks, w: int, h: int) -> None:
         pulse = 0.6 + (0.4 * (math.sin(time.time() * 5) + 1) / 2)
-        outer_radius = int(5 + pulse * 3)
-        for landmark in landmarks:
-            x, y = int(landmark.x * w), int(landmark.y * h)
+        self._marker_sprite(int(5 + pulse * 3)).stamp_all(image, points)
+
+    def _marker_sprite(self, outer_radius: int) -> _MarkerSprite:
+        """Pulsing ring plus centre dot, rasterised once per ring radius."""
+        sprite = self._markers.get(outer_radius)
+        if sprite is not None:
+            return sprite
+
+        c = outer_radius + 2
+        size = 2 * c + 1
+
+        def draw(image, x: int, y: int) -> None:
             cv2.circle(
                 image, (x, y), outer_radius, self.palette["accent_secondary"], 1, cv2.LINE_AA
             )
             cv2.circle(image, (x, y), 2, self.palette["text_main"], -1, cv2.LINE_AA)
 
+        layer = self._capture(lambda image: draw(image, c, c), size, size, (0, 0, size, size))
+        inverse_alpha = layer.inverse_alpha
+        if inverse_alpha is None:  # pragma: no cover - the ring never fills its box
+            inverse_alpha = np.zeros_like(layer.pixels)
+        ys, xs = np.nonzero(np.any(inverse_alpha != 255, axis=2))
+        sprite = _MarkerSprite(
+            dx=(xs - c).astype(np.int32),
+            dy=(ys - c).astype(np.int32),
+            pixels=layer.pixels[ys, xs].astype(np.float32) + 0.5,
+            inverse_alpha=inverse_alpha[ys, xs].astype(np.float32) / 255.0,
+            extent=c,
+            draw=draw,
+        )
+        self._markers[outer_radius] = sprite
+        return sprite
+
     def _draw_header(
         self,
         image,
@@ -136,22 +622,10 @@ class HUD:
         profile_name: str,
         w: int,
     ) -> None:
-        cv2.rectangle(image, (0, 0), (w, 64), (10, 14, 18), -1)
-
         action_text = snapshot.action.value
         action_color = self._action_color(snapshot.action)
 
-        cv2.putText(
-            image,
-            "SUBWAY SURF CONTROL HUB",
-            (18, 24),
-            self.font_body,
-            0.55,
-            self.palette["text_muted"],
-            1,
-            cv2.LINE_AA,
-        )
-        cv2.putText(
+        self._put_text(
             image,
             f"Action: {action_text}",
             (18, 50),
@@ -159,10 +633,9 @@ class HUD:
             0.85,
             action_color,
             2,
-            cv2.LINE_AA,
         )
 
-        cv2.putText(
+        self._put_text(
             image,
             f"{fps:>3} FPS",
             (w - 150, 28),
@@ -170,9 +643,8 @@ class HUD:
             0.75,
             self.palette["text_main"],
             2,
-            cv2.LINE_AA,
         )
-        cv2.putText(
+        self._put_text(
             image,
             f"Profile: {profile_name}",
             (w - 260, 52),
@@ -180,12 +652,24 @@ class HUD:
             0.55,
             self.palette["text_muted"],
             1,
-            cv2.LINE_AA,
+        )
+
+    def _draw_header_static(self, image, w: int) -> None:
+        cv2.rectangle(image, (0, 0), (w, _HEADER_H), (10, 14, 18), -1)
+        self._put_text(
+            image,
+            "SUBWAY SURF CONTROL HUB",
+            (18, 24),
+            self.font_body,
+            0.55,
+            self.palette["text_muted"],
+            1,
+            pinned=True,
         )
 
     def _draw_footer(self, image, w: int, h: int) -> None:
-        cv2.rectangle(image, (0, h - 48), (w, h), (10, 14, 18), -1)
-        cv2.putText(
+        cv2.rectangle(image, (0, h - _FOOTER_H), (w, h), (10, 14, 18), -1)
+        self._put_text(
             image,
             "Q = Quit | P = Next Profile | H = Toggle Help",
             (18, h - 18),
@@ -193,17 +677,18 @@ class HUD:
             0.6,
             self.palette["text_muted"],
             1,
-            cv2.LINE_AA,
+            pinned=True,
         )
 
     def _draw_legend(self, image, w: int, h: int) -> None:
-        card_w = 330
+        card_w = _LEGEND_W
         x0, y0 = w - card_w - 16, 78
         y1 = min(h - 90, y0 + 220)
 
-        overlay = image.copy()
-        cv2.rectangle(overlay, (x0, y0), (x0 + card_w, y1), (12, 18, 22), -1)
-        cv2.addWeighted(overlay, 0.8, image, 0.2, 0, image)
+        card = image[max(0, y0) : y1 + 1, max(0, x0) : x0 + card_w + 1]
+        fill = np.empty_like(card)
+        fill[:] = (12, 18, 22)
+        cv2.addWeighted(fill, 0.8, card, 0.2, 0, card)
         cv2.rectangle(image, (x0, y0), (x0 + card_w, y1), (118, 146, 165), 1)
 
         lines = [
@@ -215,7 +700,7 @@ class HUD:
             "Hand Right    -> Move right",
         ]
 
-        cv2.putText(
+        self._put_text(
             image,
             lines[0],
             (x0 + 16, y0 + 26),
@@ -223,11 +708,11 @@ class HUD:
             0.65,
             self.palette["accent_secondary"],
             1,
-            cv2.LINE_AA,
+            pinned=True,
         )
         step = 31
         for idx, text in enumerate(lines[1:], start=1):
-            cv2.putText(
+            self._put_text(
                 image,
                 text,
                 (x0 + 16, y0 + 26 + idx * step),
@@ -235,9 +720,24 @@ class HUD:
                 0.58,
                 self.palette["text_main"],
                 1,
-                cv2.LINE_AA,
+                pinned=True,
             )
 
+    def _put_text(
+        self,
+        image,
+        text: str,
+        org: tuple[int, int],
+        font: int,
+        scale: float,
+        color: tuple[int, int, int],
+        thickness: int,
+        pinned: bool = False,
+    ) -> None:
+        """Anti-aliased ``cv2.putText`` equivalent backed by the sprite cache."""
+        sprite = self._text.get((text, font, scale, color, thickness), pinned=pinned)
+        sprite.stamp(image, org[0], org[1])
+
     def _action_color(self, action: Action) -> tuple[int, int, int]:
         if action == Action.IDLE:
             return self.palette["text_muted"]
@@ -65,11 +65,29 @@ class AppConfig:
     profiles_dir: Path
     runtime_dir: Path
     telemetry_file: Path
+    telemetry_channel_file: Path
     active_profile_file: Path
+    profiles_db_file: Path
+    flight_dump_dir: Path
     api_host: str
     api_port: int
     api_key: str
     api_allow_origins: tuple[str, ...] = field(default_factory=lambda: ("*",))
+    preview_max_fps: float = 10.0
+    preview_jpeg_quality: int = 70
+    telemetry_max_history: int = 500
+    telemetry_segment_bytes: int = 1_048_576
+    telemetry_segment_seconds: float | None = None
+    telemetry_write_behind: bool = True
+    telemetry_flush_ms: int = 500
+    profile_stat_interval_ms: int = 1000
+    profile_watch_ms: int = 500
+    profile_store: str = "json"
+    calibration_seconds: float = 8.0
+    detector_warmup_frames: int = 3
+    log_queue_size: int = 10_000
+    flight_recorder_frames: int = 300
+    flight_spike_ms: float = 100.0
 
     def ensure_directories(self) -> None:
         for path in (self.logs_dir, self.profiles_dir, self.runtime_dir):
@@ -93,6 +111,7 @@ class AppConfig:
             "api_host": self.api_host,
             "api_port": self.api_port,
             "api_key_enabled": bool(self.api_key),
+            "preview_max_fps": self.preview_max_fps,
         }
 
 
@@ -126,8 +145,11 @@ def load_config(project_root: Path | None = None) -> AppConfig:
         logs_dir=runtime_dir / "logs",
         profiles_dir=root / "profiles",
         runtime_dir=runtime_dir,
-        telemetry_file=runtime_dir / "telemetry.json",
+        telemetry_file=runtime_dir / "telemetry.ndjson",
+        telemetry_channel_file=runtime_dir / "telemetry.shm",
         active_profile_file=runtime_dir / "active_profile.txt",
+        profiles_db_file=runtime_dir / "profiles.sqlite3",
+        flight_dump_dir=runtime_dir / "flight",
         api_host=os.environ.get("API_HOST", "127.0.0.1"),
         api_port=_env_int("API_PORT", 8000, min_value=1),
         api_key=os.environ.get("API_KEY", "").strip(),
@@ -137,7 +159,25 @@ def load_config(project_root: Path | None = None) -> AppConfig:
             if origin.strip()
         )
         or ("*",),
+        preview_max_fps=_env_float("PREVIEW_MAX_FPS", 10.0, min_value=1.0, max_value=60.0),
+        preview_jpeg_quality=min(_env_int("PREVIEW_JPEG_QUALITY", 70, min_value=10), 100),
+        telemetry_max_history=_env_int("TELEMETRY_MAX_HISTORY", 500, min_value=10),
+        telemetry_segment_bytes=_env_int("TELEMETRY_SEGMENT_BYTES", 1_048_576, min_value=4096),
+        telemetry_segment_seconds=_env_float("TELEMETRY_SEGMENT_SECONDS", 0.0, min_value=0.0)
+        or None,
+        telemetry_write_behind=_env_bool("TELEMETRY_WRITE_BEHIND", True),
+        telemetry_flush_ms=_env_int("TELEMETRY_FLUSH_MS", 500, min_value=10),
+        profile_stat_interval_ms=_env_int("PROFILE_STAT_INTERVAL_MS", 1000, min_value=0),
+        profile_watch_ms=_env_int("PROFILE_WATCH_MS", 500, min_value=50),
+        profile_store=os.environ.get("PROFILE_STORE", "json").strip().lower(),
+        calibration_seconds=_env_float("CALIBRATION_SECONDS", 8.0, min_value=2.0, max_value=60.0),
+        detector_warmup_frames=_env_int("DETECTOR_WARMUP_FRAMES", 3, min_value=0),
+        log_queue_size=_env_int("LOG_QUEUE_SIZE", 10_000, min_value=100),
+        flight_recorder_frames=_env_int("FLIGHT_RECORDER_FRAMES", 300, min_value=30),
+        flight_spike_ms=_env_float("FLIGHT_SPIKE_MS", 100.0, min_value=10.0),
     )
+    if config.profile_store not in {"json", "sqlite"}:
+        config.profile_store = "json"
     if config.left_bound >= config.right_bound:
         config.left_bound, config.right_bound = 0.35, 0.65
     config.ensure_directories()
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Any
 
 _LOG_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
 _DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
@@ -11,18 +15,106 @@ _FILE_NAME = "subway-controller.log"
 _MAX_BYTES = 1_048_576  # 1 MiB
 _BACKUP_COUNT = 3
 
+_listener: QueueListener | None = None
 
-def configure_logging(log_level: str, log_dir: Path) -> None:
-    """Configure the root logger with a rotating file handler and a stderr stream handler.
 
-    Both handlers share the same formatter so log output is consistent
-    regardless of where it is consumed (terminal vs log file).
+class DroppingQueueHandler(QueueHandler):
+    """``QueueHandler`` over a bounded queue that never blocks the caller.
+
+    When the queue is full, records below WARNING are discarded; WARNING
+    and above evict the oldest queued record instead, so a burst of debug
+    output cannot hide an error.  ``dropped`` counts discarded records.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._bounded: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=capacity)
+        super().__init__(self._bounded)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self._bounded.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+        if record.levelno >= logging.WARNING:
+            try:
+                self._bounded.get_nowait()
+                self._bounded.put_nowait(record)
+            except (queue.Empty, queue.Full):
+                pass
+        self.dropped += 1
+
+    @property
+    def depth(self) -> int:
+        """Records waiting for the listener thread."""
+        return self._bounded.qsize()
+
+
+class _DrainingListener(QueueListener):
+    def enqueue_sentinel(self) -> None:
+        # The stock put_nowait() fails on a full queue; the listener thread
+        # is still draining it, so waiting for a slot is safe.
+        self.queue.put(self._sentinel)  # type: ignore[attr-defined]
+
+
+class RateLimitedLogger:
+    """Emits each *key* at most once per *interval_s* seconds.
+
+    Meant for conditions that can fire every frame (camera hiccups, a
+    missing window).  Suppressed calls are counted and reported with the
+    next emitted one; calls for a level the logger has disabled return
+    before any formatting.
+    """
+
+    def __init__(self, logger: logging.Logger, interval_s: float = 5.0) -> None:
+        self.logger = logger
+        self.interval_s = interval_s
+        self._next_emit: dict[str, float] = {}
+        self._suppressed: dict[str, int] = {}
+
+    def log(self, key: str, level: int, msg: str, *args: Any) -> bool:
+        """Log unless *key* was emitted within the interval; returns whether it was."""
+        if not self.logger.isEnabledFor(level):
+            return False
+        now = time.monotonic()
+        if now < self._next_emit.get(key, 0.0):
+            self._suppressed[key] = self._suppressed.get(key, 0) + 1
+            return False
+        self._next_emit[key] = now + self.interval_s
+        suppressed = self._suppressed.pop(key, 0)
+        if suppressed:
+            msg = f"{msg} ({suppressed} similar messages suppressed)"
+        self.logger.log(level, msg, *args)
+        return True
+
+    def debug(self, key: str, msg: str, *args: Any) -> bool:
+        return self.log(key, logging.DEBUG, msg, *args)
+
+    def info(self, key: str, msg: str, *args: Any) -> bool:
+        return self.log(key, logging.INFO, msg, *args)
+
+    def warning(self, key: str, msg: str, *args: Any) -> bool:
+        return self.log(key, logging.WARNING, msg, *args)
+
+
+def configure_logging(log_level: str, log_dir: Path, queue_size: int = 10_000) -> QueueListener:
+    """Route the root logger through a bounded queue to file and stderr handlers.
+
+    Logging calls only format the record and enqueue it; a ``QueueListener``
+    thread does the file writes, rotation and stderr output, so a log call
+    from the frame loop never waits on I/O.  Both handlers share the same
+    formatter so log output is consistent regardless of where it is
+    consumed (terminal vs log file).  The listener is flushed and stopped at
+    interpreter exit, or when logging is configured again.
 
     Args:
-        log_level: One of DEBUG / INFO / WARNING / ERROR / CRITICAL (case-insensitive).
-                   Defaults to INFO when the string is not recognised.
-        log_dir:   Directory for the rotating log file; created if absent.
+        log_level:  One of DEBUG / INFO / WARNING / ERROR / CRITICAL (case-insensitive).
+                    Defaults to INFO when the string is not recognised.
+        log_dir:    Directory for the rotating log file; created if absent.
+        queue_size: Records buffered before the drop policy applies.
     """
+    global _listener
     log_dir.mkdir(parents=True, exist_ok=True)
     level = getattr(logging, log_level.upper(), logging.INFO)
 
@@ -39,8 +131,49 @@ def configure_logging(log_level: str, log_dir: Path) -> None:
     stream_handler = logging.StreamHandler(stream=sys.stderr)
     stream_handler.setFormatter(formatter)
 
+    if _listener is not None:
+        stop_logging()
+
+    queue_handler = DroppingQueueHandler(queue_size)
+    listener = _DrainingListener(
+        queue_handler.queue, file_handler, stream_handler, respect_handler_level=True
+    )
+
     root = logging.getLogger()
     root.handlers.clear()
     root.setLevel(level)
-    root.addHandler(file_handler)
-    root.addHandler(stream_handler)
+    root.addHandler(queue_handler)
+    listener.start()
+    _listener = listener
+    return listener
+
+
+def log_queue_depth() -> int:
+    """Records waiting in the root logger's queue (0 when logging is not queued)."""
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, DroppingQueueHandler):
+            return handler.depth
+    return 0
+
+
+def stop_logging() -> None:
+    """Flush queued records and close the handlers behind the queue."""
+    global _listener
+    listener, _listener = _listener, None
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+    root = logging.getLogger()
+    dropped = 0
+    # Nothing drains the queue any more; later records go to logging.lastResort.
+    for handler in list(root.handlers):
+        if isinstance(handler, DroppingQueueHandler):
+            dropped += handler.dropped
+            root.removeHandler(handler)
+    if dropped:
+        logging.getLogger(__name__).warning("Dropped %d log records (queue full).", dropped)
+
+
+atexit.register(stop_logging)
@@ -0,0 +1,307 @@
+"""In-process metrics exposed in the Prometheus text format.
+
+Recording is designed for the frame loop: every metric keeps one plain
+Python list per thread, so ``inc()`` / ``observe()`` are a thread-local
+lookup plus a list update with no lock and no allocation.  Shards are only
+locked when a thread first touches a metric and when ``/metrics`` renders
+them, summing the per-thread values.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence
+from typing import Any, Generic, TypeVar
+
+# Latency buckets in seconds: 0.1 ms .. 1 s.
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+)
+
+
+class _Sharded:
+    """Per-thread float slots, summed on read.
+
+    Each thread writes only its own list, so the GIL is the only
+    synchronisation the recording path needs.
+    """
+
+    __slots__ = ("_local", "_lock", "_shards", "_size")
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._local = threading.local()
+        self._shards: list[list[float]] = []
+        self._lock = threading.Lock()
+
+    def _new_shard(self) -> list[float]:
+        values = [0.0] * self._size
+        with self._lock:
+            self._shards.append(values)
+        self._local.values = values
+        return values
+
+    def _totals(self) -> list[float]:
+        with self._lock:
+            shards = list(self._shards)
+        return (
+            [sum(column) for column in zip(*shards, strict=True)] if shards else [0.0] * self._size
+        )
+
+
+class CounterChild(_Sharded):
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        super().__init__(1)
+
+    def inc(self, amount: float = 1.0) -> None:
+        try:
+            self._local.values[0] += amount
+        except AttributeError:
+            self._new_shard()[0] += amount
+
+    @property
+    def value(self) -> float:
+        return self._totals()[0]
+
+
+class HistogramChild(_Sharded):
+    __slots__ = ("_bounds",)
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        # One slot per finite bucket, one for +Inf, one for the running sum.
+        super().__init__(len(bounds) + 2)
+        self._bounds = bounds
+
+    def observe(self, value: float) -> None:
+        try:
+            values: list[float] = self._local.values
+        except AttributeError:
+            values = self._new_shard()
+        values[bisect_left(self._bounds, value)] += 1
+        values[-1] += value
+
+    def snapshot(self) -> tuple[list[int], float]:
+        """Cumulative bucket counts (``le`` order, +Inf last) and the sum."""
+        totals = self._totals()
+        cumulative: list[int] = []
+        running = 0
+        for count in totals[:-1]:
+            running += int(count)
+            cumulative.append(running)
+        return cumulative, totals[-1]
+
+
+ChildT = TypeVar("ChildT", bound=_Sharded)
+
+
+class _Metric(ABC, Generic[ChildT]):
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], ChildT] = {}
+        self._lock = threading.Lock()
+
+    def _unlabelled(self) -> ChildT | None:
+        """The single child of a metric without labels, created up front."""
+        return None if self.labelnames else self._child(())
+
+    def _child(self, values: tuple[str, ...]) -> ChildT:
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}.")
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    @abstractmethod
+    def _new_child(self) -> ChildT:
+        """A fresh child for one combination of label values."""
+
+    def _label_text(self, values: tuple[str, ...], extra: str = "") -> str:
+        pairs = [
+            f'{name}="{_escape(value)}"'
+            for name, value in zip(self.labelnames, values, strict=True)
+        ]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.kind}"
+        with self._lock:
+            children = sorted(self._children.items())
+        yield from self._render_children(children)
+
+    @abstractmethod
+    def _render_children(self, children: list[tuple[tuple[str, ...], ChildT]]) -> Iterable[str]:
+        """Sample lines for *children*, sorted by label values."""
+
+
+class Counter(_Metric[CounterChild]):
+    """Monotonic counter; bind labels once with :meth:`labels` outside hot loops."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._default = self._unlabelled()
+
+    def _new_child(self) -> CounterChild:
+        return CounterChild()
+
+    def labels(self, *values: str) -> CounterChild:
+        return self._child(values)
+
+    def inc(self, amount: float = 1.0) -> None:
+        if self._default is None:
+            raise ValueError(f"{self.name} has labels; use labels(...).inc().")
+        self._default.inc(amount)
+
+    def _render_children(
+        self, children: list[tuple[tuple[str, ...], CounterChild]]
+    ) -> Iterable[str]:
+        for values, child in children:
+            yield f"{self.name}{self._label_text(values)} {_format(child.value)}"
+
+
+class Histogram(_Metric[HistogramChild]):
+    """Fixed-bucket histogram; bucket bounds are upper limits (``le``)."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+        self._default = self._unlabelled()
+
+    def _new_child(self) -> HistogramChild:
+        return HistogramChild(self.buckets)
+
+    def labels(self, *values: str) -> HistogramChild:
+        return self._child(values)
+
+    def observe(self, value: float) -> None:
+        if self._default is None:
+            raise ValueError(f"{self.name} has labels; use labels(...).observe().")
+        self._default.observe(value)
+
+    def _render_children(
+        self, children: list[tuple[tuple[str, ...], HistogramChild]]
+    ) -> Iterable[str]:
+        bounds = [_format(bound) for bound in self.buckets] + ["+Inf"]
+        for values, child in children:
+            cumulative, total = child.snapshot()
+            for bound, count in zip(bounds, cumulative, strict=True):
+                labels = self._label_text(values, f'le="{bound}"')
+                yield f"{self.name}_bucket{labels} {count}"
+            yield f"{self.name}_sum{self._label_text(values)} {_format(total)}"
+            yield f"{self.name}_count{self._label_text(values)} {cumulative[-1]}"
+
+
+MetricT = TypeVar("MetricT", bound="_Metric[Any]")
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric[Any]] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = [line for metric in metrics for line in metric.render()]
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric: MetricT) -> MetricT:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is None:
+                self._metrics[metric.name] = metric
+                return metric
+            if isinstance(existing, type(metric)) and existing.labelnames == metric.labelnames:
+                return existing
+            raise ValueError(f"Metric '{metric.name}' already registered differently.")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+# ---------------------------------------------------------------------------
+# Application metrics
+# ---------------------------------------------------------------------------
+
+REGISTRY = MetricsRegistry()
+
+FRAMES_PROCESSED = REGISTRY.counter(
+    "subway_frames_processed_total", "Camera frames that went through the full pipeline."
+)
+FRAMES_DROPPED = REGISTRY.counter(
+    "subway_frames_dropped_total", "Camera reads that returned no frame."
+)
+ACTIONS_EMITTED = REGISTRY.counter(
+    "subway_actions_emitted_total", "Key presses sent to the game, per action.", ("action",)
+)
+DETECTOR_LATENCY = REGISTRY.histogram(
+    "subway_detector_latency_seconds", "Hand-landmark detection time per frame."
+)
+LOOP_LATENCY = REGISTRY.histogram(
+    "subway_loop_latency_seconds", "Controller loop time per processed frame."
+)
+TELEMETRY_PUBLISH_LATENCY = REGISTRY.histogram(
+    "subway_telemetry_publish_latency_seconds", "Time spent in TelemetryService.publish."
+)
+API_REQUEST_LATENCY = REGISTRY.histogram(
+    "subway_api_request_latency_seconds",
+    "API request handling time until the response starts.",
+    ("method", "route"),
+)
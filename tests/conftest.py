@@ -68,9 +68,11 @@ def make_hand(fingers: list[bool], center_x: float = 0.5) -> list[list[Landmark]
 
 @pytest.fixture()
 def profile_service(tmp_path: Path) -> ProfileService:
+    # Tests edit files behind the service's back: revalidate on every read.
     return ProfileService(
         profiles_dir=tmp_path / "profiles",
         active_profile_file=tmp_path / "runtime" / "active_profile.txt",
+        stat_interval_s=0.0,
     )
 
 
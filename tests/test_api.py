@@ -2,13 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 from pathlib import Path
 
+import numpy as np
 from fastapi.testclient import TestClient
 
 from src.api.app import create_api_app
+from src.api.cache import ResponseCache
+from src.api.schemas import TelemetryResponse
+from src.api.serialization import EncodedTelemetry, TelemetryFormatter
 from src.domain.actions import Action
-from src.domain.models import TelemetrySnapshot
+from src.domain.models import TelemetrySnapshot, monotonic_ns_at
+from src.infrastructure.telemetry_channel import TelemetryChannel
+from src.services.flight_recorder import FlightRecorder
+from src.services.preview_service import PreviewService
 from src.services.profile_service import ProfileService
 from src.services.telemetry_service import TelemetryService
 from src.utils.config import load_config
@@ -21,16 +30,22 @@ from src.utils.config import load_config
 def _build_client(
     tmp_path: Path,
     api_key: str = "",
+    preview_service: PreviewService | None = None,
+    flight_recorder: FlightRecorder | None = None,
 ) -> tuple[TestClient, ProfileService, TelemetryService]:
     config = load_config(project_root=tmp_path)
     # Override api_key via object attribute (config is a dataclass)
     object.__setattr__(config, "api_key", api_key)
-    profile_service = ProfileService(config.profiles_dir, config.active_profile_file)
+    profile_service = ProfileService(
+        config.profiles_dir, config.active_profile_file, stat_interval_s=0.0
+    )
     telemetry_service = TelemetryService(config.telemetry_file)
     app = create_api_app(
         config=config,
         profile_service=profile_service,
         telemetry_service=telemetry_service,
+        preview_service=preview_service,
+        flight_recorder=flight_recorder,
     )
     return TestClient(app), profile_service, telemetry_service
 
@@ -102,6 +117,48 @@ def test_activate_profile(tmp_path: Path) -> None:
     assert list_resp.json()["active"] == "second"
 
 
+def test_calibrate_profile_from_recent_telemetry(tmp_path: Path) -> None:
+    client, profiles, telemetry = _build_client(tmp_path)
+    for index in range(60):
+        center_x = (0.2, 0.5, 0.8)[index % 3] + (index % 5 - 2) * 0.01
+        telemetry.publish(
+            TelemetrySnapshot(
+                action=Action.CENTER, fps=30, has_hand=True, profile="default", center_x=center_x
+            )
+        )
+
+    response = client.post("/v1/profiles/lanes/calibrate", json={})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "activated"
+    assert body["samples"] == 60
+    assert abs(body["profile"]["left_bound"] - 0.35) < 0.02
+    assert abs(body["profile"]["right_bound"] - 0.65) < 0.02
+    assert profiles.get_active_profile_name() == "lanes"
+
+
+def test_calibrate_without_hand_samples_returns_400(tmp_path: Path) -> None:
+    client, _, telemetry = _build_client(tmp_path)
+    telemetry.publish(
+        TelemetrySnapshot(
+            action=Action.IDLE, fps=30, has_hand=False, profile="default", center_x=0.5
+        )
+    )
+    response = client.post("/v1/profiles/lanes/calibrate", json={"activate": False})
+    assert response.status_code == 400
+
+
+def test_list_profiles_paginates(tmp_path: Path) -> None:
+    client, _, _ = _build_client(tmp_path)
+    for name in ("alpha", "beta", "gamma"):
+        client.put(f"/v1/profiles/{name}", json={})
+
+    page = client.get("/v1/profiles", params={"offset": 1, "limit": 2}).json()
+    assert page["total"] == 4
+    assert [item["name"] for item in page["items"]] == ["beta", "default"]
+    assert client.get("/v1/profiles").json()["total"] == 4
+
+
 def test_get_unknown_profile_returns_404(tmp_path: Path) -> None:
     client, _, _ = _build_client(tmp_path)
     response = client.get("/v1/profiles/nonexistent")
@@ -145,6 +202,268 @@ def test_telemetry_returns_published_snapshot(tmp_path: Path) -> None:
     assert data["history"][-1]["fps"] == 48
 
 
+def test_telemetry_since_returns_only_newer_samples(tmp_path: Path) -> None:
+    client, _, telemetry = _build_client(tmp_path)
+    for fps in (10, 20, 30):
+        telemetry.publish(_snap(fps=fps))
+
+    first = client.get("/v1/telemetry").json()
+    assert first["seq"] == 3
+    assert [entry["seq"] for entry in first["history"]] == [1, 2, 3]
+
+    telemetry.publish(_snap(fps=40))
+    data = client.get("/v1/telemetry", params={"since": first["seq"]}).json()
+    assert data["seq"] == 4
+    assert [entry["fps"] for entry in data["history"]] == [40]
+
+    caught_up = client.get("/v1/telemetry", params={"since": 4}).json()
+    assert caught_up["history"] == [] and caught_up["seq"] == 4
+    # A cursor from before a reset gets the full window back.
+    reset = client.get("/v1/telemetry", params={"since": 99}).json()
+    assert len(reset["history"]) == 4
+
+
+def test_telemetry_etag_returns_304_until_new_sample(tmp_path: Path) -> None:
+    client, _, telemetry = _build_client(tmp_path)
+    telemetry.publish(_snap())
+
+    response = client.get("/v1/telemetry")
+    etag = response.headers["etag"]
+    cached = client.get("/v1/telemetry", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    telemetry.publish(_snap())
+    fresh = client.get("/v1/telemetry", headers={"If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert fresh.headers["etag"] != etag
+
+
+def test_telemetry_etag_depends_on_limit(tmp_path: Path) -> None:
+    client, _, telemetry = _build_client(tmp_path)
+    for _ in range(5):
+        telemetry.publish(_snap())
+
+    etag = client.get("/v1/telemetry", params={"limit": 2}).headers["etag"]
+    wider = client.get("/v1/telemetry", params={"limit": 5}, headers={"If-None-Match": etag})
+    assert wider.status_code == 200
+    assert len(wider.json()["history"]) == 5
+    assert client.get("/v1/telemetry", params={"limit": 0}).status_code == 422
+    assert client.get("/v1/telemetry", params={"limit": 501}).status_code == 422
+
+
+def test_telemetry_formats_iso_timestamp_from_nanoseconds(tmp_path: Path) -> None:
+    client, _, telemetry = _build_client(tmp_path)
+    snap = _snap()
+    snap.monotonic_ns = monotonic_ns_at(1_767_225_600_250_000_000)
+    telemetry.publish(snap)
+
+    entry = client.get("/v1/telemetry").json()["history"][-1]
+    assert entry["timestamp_ns"] == 1_767_225_600_250_000_000
+    assert entry["timestamp"] == "2026-01-01T00:00:00+00:00"
+
+
+def test_telemetry_reads_shared_channel_from_controller(tmp_path: Path) -> None:
+    config = load_config(project_root=tmp_path)
+    channel = TelemetryChannel(config.telemetry_channel_file)
+    client = TestClient(create_api_app(config=config))
+    assert client.get("/v1/telemetry").json()["latest"] is None
+
+    channel.publish(_snap(Action.RIGHT, fps=57))
+    data = client.get("/v1/telemetry?limit=5").json()
+    assert data["latest"]["action"] == "RIGHT"
+    assert [entry["fps"] for entry in data["history"]] == [57]
+    channel.close()
+
+
+def test_telemetry_rollups_aggregate_published_samples(tmp_path: Path) -> None:
+    client, _, telemetry = _build_client(tmp_path)
+    for fps, offset_s in ((30, 10), (50, 40)):
+        snap = _snap(Action.LEFT, fps=fps)
+        snap.monotonic_ns = monotonic_ns_at((1_767_225_600 + offset_s) * 1_000_000_000)
+        telemetry.publish(snap)
+
+    response = client.get(
+        "/v1/telemetry/rollups",
+        params={"from": "2026-01-01T00:00:00Z", "to": "2026-01-01T00:05:00Z"},
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["resolution"] == "minute"
+    assert body["from"] == "2026-01-01T00:00:00+00:00"
+    assert body["buckets"] == [
+        {
+            "start": "2026-01-01T00:00:00+00:00",
+            "samples": 2,
+            "fps_min": 30,
+            "fps_avg": 40.0,
+            "fps_max": 50,
+            "hand_ratio": 1.0,
+            "actions": {"LEFT": 2},
+        }
+    ]
+
+
+def test_telemetry_rollups_join_log_and_shared_channel(tmp_path: Path) -> None:
+    config = load_config(project_root=tmp_path)
+    logged = [_snap(Action.LEFT, fps=30), _snap(Action.LEFT, fps=40)]
+    for offset_s, snap in enumerate(logged):
+        snap.monotonic_ns = monotonic_ns_at((1_767_225_600 + offset_s) * 1_000_000_000)
+    writer = TelemetryService(config.telemetry_file)
+    for snap in logged:
+        writer.publish(snap)
+    writer.close()
+    channel = TelemetryChannel(config.telemetry_channel_file, capacity=2)
+    live = _snap(Action.RIGHT, fps=50)
+    live.monotonic_ns = monotonic_ns_at((1_767_225_600 + 2) * 1_000_000_000)
+    # The channel repeats what was logged but no longer holds the first sample.
+    for snap in (*logged, live):
+        channel.publish(snap)
+
+    with TestClient(create_api_app(config=config)) as client:
+        response = client.get(
+            "/v1/telemetry/rollups",
+            params={"from": "2026-01-01T00:00:00Z", "to": "2026-01-01T00:05:00Z"},
+        )
+    channel.close()
+    assert response.status_code == 200
+    [bucket] = response.json()["buckets"]
+    assert bucket["samples"] == 3
+    assert bucket["actions"] == {"LEFT": 2, "RIGHT": 1}
+
+
+def test_telemetry_rollups_validate_range(tmp_path: Path) -> None:
+    client, _, _ = _build_client(tmp_path)
+    inverted = {"from": "2026-01-01T01:00:00Z", "to": "2026-01-01T00:00:00Z"}
+    assert client.get("/v1/telemetry/rollups", params=inverted).status_code == 400
+    bad = client.get("/v1/telemetry/rollups", params={"resolution": "hour"})
+    assert bad.status_code == 422
+    default = client.get("/v1/telemetry/rollups", params={"resolution": "second"})
+    assert default.status_code == 200
+    assert default.json()["buckets"] == []
+
+
+# ---------------------------------------------------------------------------
+# Live preview
+# ---------------------------------------------------------------------------
+
+
+def test_stream_without_preview_returns_503(tmp_path: Path) -> None:
+    client, _, _ = _build_client(tmp_path)
+    response = client.get("/v1/stream.mjpg")
+    assert response.status_code == 503
+
+
+def test_stream_serves_latest_frame_as_multipart(tmp_path: Path) -> None:
+    preview = PreviewService(max_fps=1000.0, encoder=lambda frame: b"JPEG")
+
+    async def encode_one() -> bytes:
+        viewer = asyncio.ensure_future(anext(preview.frames()))
+        while not preview.viewers:
+            await asyncio.sleep(0)
+        assert preview.submit(np.zeros((2, 2, 3), dtype=np.uint8))
+        return await asyncio.wait_for(viewer, 2.0)
+
+    # Encode one frame, then close so the stream ends after replaying it.
+    assert asyncio.run(encode_one()) == b"JPEG"
+    preview.close()
+
+    client, _, _ = _build_client(tmp_path, preview_service=preview)
+    response = client.get("/v1/stream.mjpg")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("multipart/x-mixed-replace")
+    assert response.content == (
+        b"--frame\r\nContent-Type: image/jpeg\r\nContent-Length: 4\r\n\r\nJPEG\r\n"
+    )
+
+
+# ---------------------------------------------------------------------------
+# Response cache
+# ---------------------------------------------------------------------------
+
+
+def test_response_cache_rebuilds_only_when_version_changes() -> None:
+    cache = ResponseCache()
+    builds: list[int] = []
+
+    def build() -> dict[str, int]:
+        builds.append(1)
+        return {"n": len(builds)}
+
+    assert cache.get("key", 1, build) == b'{"n":1}'
+    assert cache.get("key", 1, build) == b'{"n":1}'
+    assert cache.get("key", 2, build) == b'{"n":2}'
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_response_cache_evicts_oldest_key_when_full() -> None:
+    cache = ResponseCache(max_entries=2)
+    for key in ("a", "b", "c"):
+        cache.get(key, 1, lambda: {})
+    cache.get("c", 1, lambda: {})
+    cache.get("b", 1, lambda: {})
+    assert cache.misses == 3  # "b" and "c" survived
+    cache.get("a", 1, lambda: {})
+    assert cache.misses == 4
+
+
+def test_encoded_telemetry_slices_one_tail_per_cursor() -> None:
+    history = [{"seq": seq, "fps": fps} for seq, fps in ((1, 10), (2, 20), (3, 30))]
+    tail = EncodedTelemetry.build(TelemetryFormatter(), history, {"fps": 30})
+
+    bodies = [json.loads(tail.body(since, total=3)) for since in (None, 1, 3)]
+    assert [[entry["fps"] for entry in body["history"]] for body in bodies] == [
+        [10, 20, 30],
+        [20, 30],
+        [],
+    ]
+    assert [body["seq"] for body in bodies] == [3, 3, 3]
+    assert bodies[0] == TelemetryResponse.model_validate(bodies[0]).model_dump()
+    assert json.loads(EncodedTelemetry.build(TelemetryFormatter(), [], None).body(None, 0)) == (
+        TelemetryResponse().model_dump()
+    )
+
+
+def test_cached_profile_listing_reflects_writes(tmp_path: Path) -> None:
+    client, profiles, _ = _build_client(tmp_path)
+    first = client.get("/v1/profiles")
+    assert first.headers["content-type"] == "application/json"
+    assert [item["name"] for item in first.json()["items"]] == ["default"]
+
+    client.put("/v1/profiles/arcade", json={"cooldown_ms": 150})
+    names = [item["name"] for item in client.get("/v1/profiles").json()["items"]]
+    assert names == ["arcade", "default"]
+
+    # Activation from another process only touches the active-profile file.
+    other = ProfileService(profiles.profiles_dir, profiles.active_profile_file)
+    other.activate_profile("arcade")
+    assert client.get("/v1/config").json()["active_profile"] == "arcade"
+    assert client.get("/v1/profiles").json()["active"] == "arcade"
+
+
+# ---------------------------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------------------------
+
+
+def test_metrics_expose_request_latency_by_route_template(tmp_path: Path) -> None:
+    client, _, _ = _build_client(tmp_path)
+    client.get("/v1/profiles/default")
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE subway_frames_processed_total counter" in response.text
+    assert (
+        'subway_api_request_latency_seconds_count{method="GET",route="/v1/profiles/{name}"}'
+        in response.text
+    )
+
+
+def test_metrics_require_api_key(tmp_path: Path) -> None:
+    client, _, _ = _build_client(tmp_path, api_key="secret123")
+    assert client.get("/metrics").status_code == 401
+
+
 # ---------------------------------------------------------------------------
 # API key authentication
 # ---------------------------------------------------------------------------
@@ -168,8 +487,56 @@ def test_protected_endpoint_with_wrong_key_returns_401(tmp_path: Path) -> None:
     assert response.status_code == 401
 
 
+def test_telemetry_stream_requires_api_key(tmp_path: Path) -> None:
+    client, _, _ = _build_client(tmp_path, api_key="secret123")
+    response = client.get("/v1/telemetry/stream")
+    assert response.status_code == 401
+
+
 def test_health_is_public_regardless_of_api_key(tmp_path: Path) -> None:
     """Health check must be reachable without authentication."""
     client, _, _ = _build_client(tmp_path, api_key="secret123")
     response = client.get("/v1/health")
     assert response.status_code == 200
+
+
+# ---------------------------------------------------------------------------
+# Flight recorder
+# ---------------------------------------------------------------------------
+
+
+def test_flight_dump_requires_in_process_recorder(tmp_path: Path) -> None:
+    client, _, _ = _build_client(tmp_path)
+    assert client.post("/v1/flight-recorder/dump").status_code == 503
+    assert client.get("/v1/flight-recorder/dumps").json() == {"items": []}
+
+
+def test_flight_dump_on_demand_then_download(tmp_path: Path) -> None:
+    recorder = FlightRecorder(load_config(project_root=tmp_path).flight_dump_dir, capacity=10)
+    client, _, _ = _build_client(tmp_path, flight_recorder=recorder)
+    try:
+        response = client.post("/v1/flight-recorder/dump")
+        assert response.status_code == 200
+        name = response.json()["name"]
+
+        listing = client.get("/v1/flight-recorder/dumps").json()
+        assert [item["name"] for item in listing["items"]] == [name]
+        dump = client.get(f"/v1/flight-recorder/dumps/{name}")
+        assert dump.status_code == 200
+        assert dump.json()["reason"] == "api"
+        assert client.get("/v1/flight-recorder/dumps/..%2Fsecret.json").status_code == 404
+    finally:
+        recorder.close()
+
+
+def test_flight_dump_reports_write_failure(tmp_path: Path) -> None:
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("", encoding="utf-8")
+    recorder = FlightRecorder(blocker / "dumps", capacity=10)
+    client, _, _ = _build_client(tmp_path, flight_recorder=recorder)
+    try:
+        response = client.post("/v1/flight-recorder/dump")
+        assert response.status_code == 500
+        assert response.json()["detail"].startswith("Could not write the flight recorder dump")
+    finally:
+        recorder.close()
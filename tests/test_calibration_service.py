@@ -0,0 +1,102 @@
+"""Unit tests for lane calibration."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.domain.models import Profile
+from src.services.calibration_service import (
+    CalibrationService,
+    CalibrationSession,
+    fit_lane_bounds,
+)
+from src.services.profile_service import ProfileService
+
+
+def _lanes(centers: tuple[float, float, float], per_lane: int = 40, noise: float = 0.02):
+    rng = np.random.default_rng(7)
+    return np.concatenate([rng.normal(center, noise, per_lane) for center in centers])
+
+
+# ---------------------------------------------------------------------------
+# Fitting
+# ---------------------------------------------------------------------------
+
+
+def test_fit_places_bounds_between_lane_centres() -> None:
+    fit = fit_lane_bounds(_lanes((0.25, 0.5, 0.75)))
+    assert fit.samples == 120
+    assert fit.centers == pytest.approx((0.25, 0.5, 0.75), abs=0.01)
+    assert fit.left_bound == pytest.approx(0.375, abs=0.01)
+    assert fit.right_bound == pytest.approx(0.625, abs=0.01)
+
+
+def test_fit_handles_uneven_time_per_lane() -> None:
+    samples = np.concatenate(
+        [_lanes((0.3,), per_lane=15), _lanes((0.45,), per_lane=90), _lanes((0.7,), per_lane=20)]
+    )
+    fit = fit_lane_bounds(samples)
+    assert fit.left_bound == pytest.approx(0.375, abs=0.02)
+    assert fit.right_bound == pytest.approx(0.575, abs=0.02)
+
+
+def test_fit_rejects_too_few_samples() -> None:
+    with pytest.raises(ValueError):
+        fit_lane_bounds([0.2, 0.5, 0.8])
+
+
+def test_fit_rejects_a_single_lane() -> None:
+    with pytest.raises(ValueError):
+        fit_lane_bounds(_lanes((0.5, 0.5, 0.5), noise=0.005))
+
+
+def test_fit_ignores_non_finite_samples() -> None:
+    samples = np.append(_lanes((0.25, 0.5, 0.75)), [np.nan, np.inf])
+    assert fit_lane_bounds(samples).samples == 120
+
+
+# ---------------------------------------------------------------------------
+# Session & service
+# ---------------------------------------------------------------------------
+
+
+def test_session_stops_when_buffer_is_full() -> None:
+    session = CalibrationSession(duration_s=60.0, max_samples=4)
+    for value in (0.1, 0.2, 0.3, 0.4, 0.5):
+        session.add(value)
+    assert session.done
+    assert session.samples.tolist() == pytest.approx([0.1, 0.2, 0.3, 0.4])
+
+
+def test_calibrate_saves_and_activates_profile(profile_service: ProfileService) -> None:
+    profile_service.save_profile(Profile(name="base", cooldown_ms=150))
+    service = CalibrationService(profile_service)
+    base = profile_service.get_profile("base")
+
+    profile, fit = service.calibrate(_lanes((0.25, 0.5, 0.75)), name="mine", base=base)
+
+    assert profile_service.get_active_profile_name() == "mine"
+    stored = profile_service.get_profile("mine")
+    assert (stored.left_bound, stored.right_bound) == (fit.left_bound, fit.right_bound)
+    assert stored.cooldown_ms == 150
+    assert profile is not base
+
+
+def test_calibrate_without_activation(profile_service: ProfileService) -> None:
+    CalibrationService(profile_service).calibrate(_lanes((0.25, 0.5, 0.75)), activate=False)
+    assert profile_service.get_active_profile_name() == "default"
+    assert profile_service.get_profile("calibrated").left_bound == pytest.approx(0.375, abs=0.01)
+
+
+def test_fit_profile_leaves_the_store_untouched(profile_service: ProfileService) -> None:
+    service = CalibrationService(profile_service)
+    version = profile_service.version
+
+    profile, fit = service.fit_profile(_lanes((0.25, 0.5, 0.75)), base=Profile(name="base"))
+
+    assert profile_service.version == version
+    assert [item.name for item in profile_service.list_profiles()] == ["default"]
+    assert (profile.left_bound, profile.right_bound) == (fit.left_bound, fit.right_bound)
+    assert service.save(profile, activate=False).name == "calibrated"
+    assert profile_service.get_active_profile_name() == "default"
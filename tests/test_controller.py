@@ -44,8 +44,8 @@ def test_idle_resets_discrete_state(controller: GameController, mock_keyboard: M
 def test_discrete_action_sent_only_once(
     controller: GameController, mock_keyboard: MagicMock
 ) -> None:
-    controller.perform_action(Action.JUMP)
-    controller.perform_action(Action.JUMP)  # second call — already active
+    assert controller.perform_action(Action.JUMP) is True
+    assert controller.perform_action(Action.JUMP) is False  # already active
     assert mock_keyboard.send.call_count == 1
 
 
@@ -71,7 +71,7 @@ def test_all_discrete_actions_work(controller: GameController, mock_keyboard: Ma
 
 
 def test_center_does_not_send_key(controller: GameController, mock_keyboard: MagicMock) -> None:
-    controller.perform_action(Action.CENTER)
+    assert controller.perform_action(Action.CENTER) is False
     mock_keyboard.send.assert_not_called()
 
 
@@ -107,6 +107,6 @@ def test_center_resets_lane_tracking(controller: GameController, mock_keyboard:
 def test_failed_send_does_not_update_state(mock_keyboard: MagicMock) -> None:
     mock_keyboard.send.return_value = False
     ctrl = GameController(keyboard=mock_keyboard, window_title="T", auto_focus_window=False)
-    ctrl.perform_action(Action.JUMP)
+    assert ctrl.perform_action(Action.JUMP) is False
     # State should NOT be marked active when the send failed.
     assert ctrl._discrete_state[Action.JUMP] is False
@@ -0,0 +1,51 @@
+"""Unit tests for HUD joint marker stamping."""
+
+from __future__ import annotations
+
+import cv2
+import numpy as np
+
+from src.ui.display import HUD
+
+
+def _canvas() -> np.ndarray:
+    return np.full((60, 80, 3), 40, dtype=np.uint8)
+
+
+def test_overlapping_markers_match_stamping_one_at_a_time() -> None:
+    sprite = HUD()._marker_sprite(8)
+    points = np.array([[20, 30], [30, 30], [25, 35], [60, 30]], dtype=np.int32)
+
+    together = _canvas()
+    sprite.stamp_all(together, points)
+    one_by_one = _canvas()
+    for point in points:
+        sprite.stamp_all(one_by_one, point[None])
+
+    assert np.array_equal(together, one_by_one)
+
+
+def test_markers_on_the_border_are_drawn_like_opencv_circles() -> None:
+    sprite = HUD()._marker_sprite(8)
+    points = np.array([[0, 30], [79, 30], [40, 0]], dtype=np.int32)
+
+    stamped = _canvas()
+    sprite.stamp_all(stamped, points)
+    drawn = _canvas()
+    for x, y in points.tolist():
+        sprite.draw(drawn, x, y)
+
+    assert np.array_equal(stamped, drawn)
+
+
+def test_overlapping_markers_match_opencv_circles() -> None:
+    hud = HUD()
+    stamped = _canvas()
+    hud._marker_sprite(8).stamp_all(stamped, np.array([[20, 30], [30, 30]], dtype=np.int32))
+    drawn = _canvas()
+    for x in (20, 30):
+        cv2.circle(drawn, (x, 30), 8, hud.palette["accent_secondary"], 1, cv2.LINE_AA)
+        cv2.circle(drawn, (x, 30), 2, hud.palette["text_main"], -1, cv2.LINE_AA)
+
+    # Only rounding differences, no ring pixels overwritten by the other marker.
+    assert np.abs(stamped.astype(int) - drawn).max() <= 3
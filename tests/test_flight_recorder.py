@@ -0,0 +1,88 @@
+"""Unit tests for the flight recorder."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from src.domain.actions import Action
+from src.services.flight_recorder import FlightRecorder, list_dumps
+
+
+@pytest.fixture()
+def recorder(tmp_path: Path) -> Iterator[FlightRecorder]:
+    flight = FlightRecorder(tmp_path / "flight", capacity=50, spike_ms=50.0, min_interval_s=60.0)
+    yield flight
+    flight.close()
+
+
+def _frame(recorder: FlightRecorder, loop_ms: float = 16.0, read_ok: bool = True) -> None:
+    recorder.record(
+        read_ok=read_ok,
+        read_failures=0 if read_ok else 1,
+        read_ms=2.0,
+        detect_ms=8.0,
+        render_ms=3.0,
+        loop_ms=loop_ms,
+        fps=60,
+        action=Action.LEFT,
+        hands=1,
+        center_x=0.3,
+        wrist_x=0.31,
+        wrist_y=0.8,
+        telemetry_queue=2,
+        log_queue=0,
+    )
+
+
+def test_ring_keeps_the_newest_frames_in_order(recorder: FlightRecorder) -> None:
+    for index in range(80):
+        _frame(recorder, loop_ms=float(index))
+    rows = recorder.rows()
+    assert len(rows) == 50
+    assert rows["loop_ms"].tolist() == [float(index) for index in range(30, 80)]
+
+
+def test_dump_writes_json_with_readable_frames(recorder: FlightRecorder) -> None:
+    for _ in range(3):
+        _frame(recorder)
+    path = recorder.dump("manual").result(timeout=5)
+
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    assert payload["reason"] == "manual"
+    assert len(payload["frames"]) == 3
+    frame = payload["frames"][0]
+    assert frame["action"] == "LEFT"
+    assert frame["center_x"] == 0.3
+    assert list_dumps(recorder.dump_dir) == [path]
+
+
+def test_latency_spike_triggers_one_rate_limited_dump(recorder: FlightRecorder) -> None:
+    for _ in range(40):
+        _frame(recorder)
+    _frame(recorder, loop_ms=400.0)
+    _frame(recorder, loop_ms=400.0)
+    recorder.close()  # wait for the background write
+    dumps = list_dumps(recorder.dump_dir)
+    assert len(dumps) == 1
+    assert dumps[0].name.endswith("-latency-spike.json")
+
+
+def test_failed_reads_do_not_count_as_spikes(recorder: FlightRecorder) -> None:
+    for _ in range(40):
+        _frame(recorder)
+    _frame(recorder, loop_ms=400.0, read_ok=False)
+    recorder.close()
+    assert list_dumps(recorder.dump_dir) == []
+
+
+def test_old_dumps_are_pruned(tmp_path: Path) -> None:
+    flight = FlightRecorder(tmp_path, capacity=5, max_dumps=2)
+    _frame(flight)
+    paths = [flight.dump(f"reason-{index}").result(timeout=5) for index in range(4)]
+    flight.close()
+    assert set(list_dumps(tmp_path)) <= set(paths)
+    assert len(list_dumps(tmp_path)) == 2
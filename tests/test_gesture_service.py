@@ -96,6 +96,25 @@ def test_smoothing_resets_on_hand_lost() -> None:
     assert snap.center_x < 0.35
 
 
+def test_interpret_features_matches_interpret_frame_by_frame() -> None:
+    frames = [
+        make_hand([False] * 5, center_x=0.80),
+        make_hand([True] * 5, center_x=0.60),
+        None,
+        make_hand([True, False, False, False, True], center_x=0.20),
+        make_hand([False] * 5, center_x=0.50),
+    ]
+    from_landmarks = GestureInterpreter(left_bound=0.35, right_bound=0.65, smoothing=0.5)
+    from_features = GestureInterpreter(left_bound=0.35, right_bound=0.65, smoothing=0.5)
+    for frame in frames:
+        expected = from_landmarks.interpret(frame)
+        if frame is None:
+            actual = from_features.interpret_features(None, 0.0)
+        else:
+            actual = from_features.interpret_features(*GestureInterpreter.hand_features(frame[0]))
+        assert actual == expected
+
+
 # ---------------------------------------------------------------------------
 # Boundary validation
 # ---------------------------------------------------------------------------
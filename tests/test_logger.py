@@ -0,0 +1,111 @@
+"""Unit tests for queue-based logging and RateLimitedLogger."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from src.utils import logger as logger_module
+from src.utils.logger import (
+    DroppingQueueHandler,
+    RateLimitedLogger,
+    configure_logging,
+    stop_logging,
+)
+
+
+@pytest.fixture()
+def restore_root_logger() -> Iterator[None]:
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield
+    stop_logging()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+# ---------------------------------------------------------------------------
+# Queue routing
+# ---------------------------------------------------------------------------
+
+
+def test_records_reach_the_file_through_the_listener(
+    tmp_path: Path, restore_root_logger: None
+) -> None:
+    configure_logging("INFO", tmp_path)
+    root = logging.getLogger()
+    assert [type(handler) for handler in root.handlers] == [DroppingQueueHandler]
+
+    logging.getLogger("test").info("hello %s", "queue")
+    logging.getLogger("test").debug("not at INFO")
+    stop_logging()
+
+    text = (tmp_path / "subway-controller.log").read_text(encoding="utf-8")
+    assert "hello queue" in text
+    assert "not at INFO" not in text
+
+
+def test_stop_reports_dropped_records_through_last_resort(
+    tmp_path: Path, restore_root_logger: None, capsys: pytest.CaptureFixture[str]
+) -> None:
+    configure_logging("INFO", tmp_path)
+    (handler,) = logging.getLogger().handlers
+    assert isinstance(handler, DroppingQueueHandler)
+    handler.dropped = 3
+    stop_logging()
+
+    assert logging.getLogger().handlers == []
+    assert "Dropped 3 log records (queue full)." in capsys.readouterr().err
+
+
+def _record(level: int, msg: str) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 1, msg, None, None)
+
+
+def test_full_queue_drops_low_levels_and_keeps_warnings() -> None:
+    handler = DroppingQueueHandler(capacity=2)
+    handler.emit(_record(logging.DEBUG, "a"))
+    handler.emit(_record(logging.INFO, "b"))
+    handler.emit(_record(logging.DEBUG, "c"))  # dropped
+    handler.emit(_record(logging.ERROR, "d"))  # evicts "a"
+
+    queued = [handler.queue.get_nowait().getMessage() for _ in range(2)]
+    assert queued == ["b", "d"]
+    assert handler.dropped == 2
+
+
+# ---------------------------------------------------------------------------
+# RateLimitedLogger
+# ---------------------------------------------------------------------------
+
+
+def test_rate_limited_logger_suppresses_and_reports(
+    caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    now = [100.0]
+    monkeypatch.setattr(logger_module.time, "monotonic", lambda: now[0])
+    limited = RateLimitedLogger(logging.getLogger("frames"), interval_s=1.0)
+
+    with caplog.at_level(logging.WARNING, logger="frames"):
+        assert limited.warning("read", "read failed %d", 1)
+        assert not limited.warning("read", "read failed %d", 2)
+        assert not limited.warning("read", "read failed %d", 3)
+        assert limited.warning("other", "different key")
+        now[0] += 1.5
+        assert limited.warning("read", "read failed %d", 4)
+
+    assert [record.getMessage() for record in caplog.records] == [
+        "read failed 1",
+        "different key",
+        "read failed 4 (2 similar messages suppressed)",
+    ]
+
+
+def test_rate_limited_logger_skips_disabled_levels(caplog: pytest.LogCaptureFixture) -> None:
+    limited = RateLimitedLogger(logging.getLogger("frames"), interval_s=0.0)
+    with caplog.at_level(logging.INFO, logger="frames"):
+        assert not limited.debug("key", "per-frame detail")
+    assert caplog.records == []
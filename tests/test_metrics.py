@@ -0,0 +1,72 @@
+"""Unit tests for the in-process metrics registry."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from src.utils.metrics import MetricsRegistry
+
+
+def test_counter_sums_increments_from_all_threads() -> None:
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs_total", "Jobs.")
+
+    def work() -> None:
+        for _ in range(1000):
+            counter.inc()
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    counter.inc(0.5)
+
+    assert counter.labels().value == 4000.5
+    assert "jobs_total 4000.5" in registry.render()
+
+
+def test_labelled_counter_renders_one_series_per_label() -> None:
+    registry = MetricsRegistry()
+    counter = registry.counter("actions_total", "Actions.", ("action",))
+    counter.labels("JUMP").inc()
+    counter.labels("LEFT").inc(2)
+
+    text = registry.render()
+    assert 'actions_total{action="JUMP"} 1' in text
+    assert 'actions_total{action="LEFT"} 2' in text
+    with pytest.raises(ValueError):
+        counter.inc()
+
+
+def test_histogram_buckets_are_cumulative() -> None:
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+
+    lines = registry.render().splitlines()
+    assert lines[:2] == ["# HELP latency_seconds Latency.", "# TYPE latency_seconds histogram"]
+    assert lines[2:] == [
+        'latency_seconds_bucket{le="0.1"} 2',
+        'latency_seconds_bucket{le="1"} 3',
+        'latency_seconds_bucket{le="+Inf"} 4',
+        "latency_seconds_sum 2.65",
+        "latency_seconds_count 4",
+    ]
+
+
+def test_registering_same_name_returns_existing_metric() -> None:
+    registry = MetricsRegistry()
+    first = registry.counter("hits_total", "Hits.")
+    assert registry.counter("hits_total", "Hits.") is first
+    with pytest.raises(ValueError):
+        registry.histogram("hits_total", "Hits.")
+
+
+def test_label_values_are_escaped() -> None:
+    registry = MetricsRegistry()
+    registry.counter("paths_total", "Paths.", ("path",)).labels('a"b\\c').inc()
+    assert 'paths_total{path="a\\"b\\\\c"} 1' in registry.render()
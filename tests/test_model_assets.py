@@ -0,0 +1,49 @@
+"""Unit tests for the shared model-bytes cache."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from src.core.model_assets import clear_model_cache, load_model_asset, model_cache_size
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache() -> Iterator[None]:
+    clear_model_cache()
+    yield
+    clear_model_cache()
+
+
+def test_repeated_loads_share_one_buffer(tmp_path: Path) -> None:
+    model = tmp_path / "hand.task"
+    model.write_bytes(b"model-v1")
+    first = load_model_asset(model)
+    assert first == b"model-v1"
+    assert load_model_asset(model) is first
+
+
+def test_identical_files_share_one_buffer(tmp_path: Path) -> None:
+    (tmp_path / "a.task").write_bytes(b"same")
+    (tmp_path / "b.task").write_bytes(b"same")
+    assert load_model_asset(tmp_path / "a.task") is load_model_asset(tmp_path / "b.task")
+    assert model_cache_size() == 1
+
+
+def test_changed_file_is_reloaded_and_old_buffer_dropped(tmp_path: Path) -> None:
+    model = tmp_path / "hand.task"
+    model.write_bytes(b"model-v1")
+    load_model_asset(model)
+
+    model.write_bytes(b"model-v2-longer")
+    os.utime(model, ns=(2_000_000_000, 2_000_000_000))
+    assert load_model_asset(model) == b"model-v2-longer"
+    assert model_cache_size() == 1
+
+
+def test_missing_model_raises(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        load_model_asset(tmp_path / "missing.task")
@@ -5,7 +5,7 @@ from __future__ import annotations
 import pytest
 
 from src.domain.actions import Action, parse_action
-from src.domain.models import GestureSnapshot, Profile, TelemetrySnapshot
+from src.domain.models import GestureSnapshot, Profile, TelemetrySnapshot, monotonic_ns_at
 
 # ---------------------------------------------------------------------------
 # Action / parse_action
@@ -123,6 +123,24 @@ class TestTelemetrySnapshot:
         assert restored.action == original.action
         assert restored.fps == original.fps
         assert restored.profile == original.profile
+        assert restored.monotonic_ns == original.monotonic_ns
+
+    def test_to_dict_carries_integer_epoch_nanoseconds(self) -> None:
+        snap = TelemetrySnapshot(
+            action=Action.JUMP,
+            fps=30,
+            has_hand=True,
+            profile="default",
+            center_x=0.5,
+            monotonic_ns=monotonic_ns_at(1_767_225_600_000_000_123),
+        )
+        assert snap.to_dict()["timestamp_ns"] == 1_767_225_600_000_000_123
+        assert "timestamp" not in snap.to_dict()
+        assert snap.timestamp == "2026-01-01T00:00:00+00:00"
+
+    def test_from_dict_accepts_legacy_iso_timestamp(self) -> None:
+        snap = TelemetrySnapshot.from_dict({"action": "LEFT", "timestamp": "2026-01-01T00:00:01"})
+        assert snap.timestamp_ns == 1_767_225_601_000_000_000
 
     def test_center_x_is_rounded_in_dict(self) -> None:
         snap = TelemetrySnapshot(
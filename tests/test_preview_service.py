@@ -0,0 +1,144 @@
+"""Unit tests for PreviewService."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import numpy as np
+import pytest
+
+from src.services.preview_service import PreviewService, jpeg_encoder
+
+
+def _first_pixel_encoder(calls: list[np.ndarray]):
+    def encode(frame: np.ndarray) -> bytes:
+        calls.append(frame)
+        return bytes(frame[0, 0])
+
+    return encode
+
+
+async def _subscribe(service: PreviewService, count: int = 1) -> list[asyncio.Task[bytes]]:
+    """Start *count* viewers, each waiting for its next frame."""
+    streams: list[AsyncIterator[bytes]] = [service.frames() for _ in range(count)]
+    tasks = [asyncio.ensure_future(anext(stream)) for stream in streams]
+    while service.viewers < count:
+        await asyncio.sleep(0)
+    return tasks
+
+
+# ---------------------------------------------------------------------------
+# Submit gating
+# ---------------------------------------------------------------------------
+
+
+def test_submit_is_ignored_without_viewers() -> None:
+    calls: list[np.ndarray] = []
+    service = PreviewService(encoder=_first_pixel_encoder(calls))
+    assert service.submit(np.zeros((4, 4, 3), dtype=np.uint8)) is False
+    assert service.latest() == (0, None)
+    assert calls == []
+    service.close()
+
+
+def test_submit_respects_max_fps() -> None:
+    now = [100.0]
+    service = PreviewService(max_fps=2.0, encoder=_first_pixel_encoder([]), clock=lambda: now[0])
+    frame = np.zeros((4, 4, 3), dtype=np.uint8)
+
+    async def scenario() -> list[bool]:
+        (viewer,) = await _subscribe(service)
+        taken = [service.submit(frame), service.submit(frame)]
+        now[0] += 0.49
+        taken.append(service.submit(frame))
+        now[0] += 0.01
+        taken.append(service.submit(frame))
+        await asyncio.wait_for(viewer, 2.0)
+        return taken
+
+    assert asyncio.run(scenario()) == [True, False, False, True]
+    service.close()
+
+
+# ---------------------------------------------------------------------------
+# Encoding and fan-out
+# ---------------------------------------------------------------------------
+
+
+def test_viewer_receives_encoded_copy_of_frame() -> None:
+    calls: list[np.ndarray] = []
+    service = PreviewService(max_fps=1000.0, encoder=_first_pixel_encoder(calls))
+    frame = np.full((4, 4, 3), 7, dtype=np.uint8)
+
+    async def scenario() -> bytes:
+        (viewer,) = await _subscribe(service)
+        assert service.submit(frame)
+        frame[:] = 0  # the caller reuses its buffer right away
+        return await asyncio.wait_for(viewer, 2.0)
+
+    assert asyncio.run(scenario()) == b"\x07\x07\x07"
+    assert calls[0] is not frame
+    assert service.latest() == (1, b"\x07\x07\x07")
+    service.close()
+
+
+def test_viewers_share_one_encode() -> None:
+    calls: list[np.ndarray] = []
+    service = PreviewService(max_fps=1000.0, encoder=_first_pixel_encoder(calls))
+
+    async def scenario() -> list[bytes]:
+        viewers = await _subscribe(service, count=2)
+        assert service.submit(np.full((2, 2, 3), 3, dtype=np.uint8))
+        return list(await asyncio.wait_for(asyncio.gather(*viewers), 2.0))
+
+    assert asyncio.run(scenario()) == [b"\x03\x03\x03", b"\x03\x03\x03"]
+    assert len(calls) == 1
+    service.close()
+
+
+def test_late_viewer_starts_with_latest_frame() -> None:
+    service = PreviewService(max_fps=1000.0, encoder=_first_pixel_encoder([]))
+
+    async def scenario() -> bytes:
+        (first,) = await _subscribe(service)
+        assert service.submit(np.full((2, 2, 3), 5, dtype=np.uint8))
+        await asyncio.wait_for(first, 2.0)
+        return await asyncio.wait_for(anext(service.frames()), 2.0)
+
+    assert asyncio.run(scenario()) == b"\x05\x05\x05"
+    service.close()
+
+
+def test_close_ends_streams_and_releases_viewers() -> None:
+    service = PreviewService(encoder=_first_pixel_encoder([]))
+
+    async def scenario() -> None:
+        (viewer,) = await _subscribe(service)
+        service.close()
+        with pytest.raises(StopAsyncIteration):
+            await asyncio.wait_for(viewer, 2.0)
+
+    asyncio.run(scenario())
+    assert service.viewers == 0
+
+
+def test_cancelled_viewer_is_released() -> None:
+    service = PreviewService(encoder=_first_pixel_encoder([]))
+
+    async def scenario() -> None:
+        (viewer,) = await _subscribe(service)
+        viewer.cancel()  # what the server does when the client disconnects
+        with pytest.raises(asyncio.CancelledError):
+            await viewer
+
+    asyncio.run(scenario())
+    assert service.viewers == 0
+    service.close()
+
+
+def test_jpeg_encoder_produces_jpeg() -> None:
+    encode = jpeg_encoder(quality=50)
+    data = encode(np.zeros((16, 16, 3), dtype=np.uint8))
+    assert data is not None
+    assert data[:2] == b"\xff\xd8"
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import os
+from pathlib import Path
+
 import pytest
 
 from src.domain.models import Profile
+from src.services import profile_service as profile_service_module
 from src.services.profile_service import ProfileService
 
 # ---------------------------------------------------------------------------
@@ -102,3 +106,59 @@ def test_get_active_falls_back_to_default_when_file_missing(
     profile_service.active_profile_file.unlink(missing_ok=True)
     active = profile_service.get_active_profile()
     assert active.name == "default"
+
+
+def test_version_changes_on_writes_and_external_edits(profile_service: ProfileService) -> None:
+    before = profile_service.version
+    profile_service.save_profile(Profile(name="fast", cooldown_ms=150))
+    after_save = profile_service.version
+    assert after_save > before
+
+    # Another process (e.g. the controller) switching the active profile.
+    other = ProfileService(profile_service.profiles_dir, profile_service.active_profile_file)
+    other.activate_profile("fast")
+    assert profile_service.version > after_save
+
+
+def _age(path: Path) -> None:
+    """Backdate *path* so its stamp is outside the racy-modification window."""
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+
+def test_unchanged_profiles_are_not_reparsed(
+    profile_service: ProfileService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    profile_service.save_profile(Profile(name="fast", cooldown_ms=150))
+    for path in profile_service.profiles_dir.iterdir():
+        _age(path)
+    _age(profile_service.profiles_dir)
+    profile_service.list_profiles()  # picks up the backdated stamps
+
+    loads: list[Path] = []
+    original = profile_service_module._load_profile
+    monkeypatch.setattr(
+        profile_service_module, "_load_profile", lambda path: loads.append(path) or original(path)
+    )
+    assert [p.name for p in profile_service.list_profiles()] == ["default", "fast"]
+    assert profile_service.get_profile("fast").cooldown_ms == 150
+    assert loads == []
+
+    fast = profile_service.profiles_dir / "fast.json"
+    fast.write_text(fast.read_text().replace("150", "180"), encoding="utf-8")
+    assert profile_service.get_profile("fast").cooldown_ms == 180
+    assert loads == [fast]
+
+
+def test_reads_within_stat_interval_skip_the_filesystem(tmp_path: Path) -> None:
+    service = ProfileService(tmp_path / "profiles", tmp_path / "active.txt", stat_interval_s=60.0)
+    assert service.get_active_profile_name() == "default"
+    version = service.version
+
+    (tmp_path / "active.txt").write_text("other", encoding="utf-8")
+    assert service.get_active_profile_name() == "default"
+    assert service.version == version
+
+    service.stat_interval_s = 0.0
+    service._next_check = 0.0
+    assert service.get_active_profile_name() == "other"
+    assert service.version > version
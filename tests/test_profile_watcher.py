@@ -0,0 +1,106 @@
+"""Unit tests for profile change listeners and ProfileWatcher."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from src.domain.models import Profile
+from src.services.profile_service import ProfileService
+from src.services.profile_watcher import ProfileWatcher
+from src.services.sqlite_profile_service import SQLiteProfileService
+
+# ---------------------------------------------------------------------------
+# Store listeners
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def store(request: pytest.FixtureRequest, tmp_path: Path):
+    if request.param == "json":
+        yield ProfileService(tmp_path / "profiles", tmp_path / "active.txt", stat_interval_s=0.0)
+        return
+    service = SQLiteProfileService(tmp_path / "profiles.sqlite3")
+    yield service
+    service.close()
+
+
+def test_listeners_fire_on_writes(store) -> None:
+    calls: list[str] = []
+    listener = lambda: calls.append("changed")  # noqa: E731
+    store.add_listener(listener)
+
+    store.save_profile(Profile(name="fast", cooldown_ms=150))
+    store.activate_profile("fast")
+    assert calls == ["changed", "changed"]
+
+    store.remove_listener(listener)
+    store.activate_profile("default")
+    assert calls == ["changed", "changed"]
+
+
+def test_failing_listener_does_not_break_writes(store) -> None:
+    def broken() -> None:
+        raise RuntimeError("boom")
+
+    store.add_listener(broken)
+    store.save_profile(Profile(name="fast"))
+    assert store.get_profile("fast").name == "fast"
+
+
+# ---------------------------------------------------------------------------
+# ProfileWatcher
+# ---------------------------------------------------------------------------
+
+
+def test_check_reports_activation_from_another_store(tmp_path: Path) -> None:
+    controller_store = ProfileService(tmp_path / "p", tmp_path / "active.txt", stat_interval_s=0.0)
+    api_store = ProfileService(tmp_path / "p", tmp_path / "active.txt", stat_interval_s=0.0)
+    seen: list[Profile] = []
+    watcher = ProfileWatcher(controller_store, seen.append, controller_store.get_active_profile())
+
+    assert watcher.check() is False
+    api_store.save_profile(Profile(name="turbo", cooldown_ms=100))
+    api_store.activate_profile("turbo")
+    assert watcher.check() is True
+    assert [(p.name, p.cooldown_ms) for p in seen] == [("turbo", 100)]
+
+    # Editing the active profile in place is a change too.
+    api_store.save_profile(Profile(name="turbo", cooldown_ms=120))
+    assert watcher.check() is True
+    assert seen[-1].cooldown_ms == 120
+
+
+def test_check_ignores_writes_that_leave_the_active_profile_unchanged(
+    profile_service: ProfileService,
+) -> None:
+    seen: list[Profile] = []
+    watcher = ProfileWatcher(profile_service, seen.append, profile_service.get_active_profile())
+
+    profile_service.save_profile(Profile(name="other"))
+    profile_service.activate_profile("default")
+    assert watcher.check() is False
+    assert seen == []
+
+
+def test_watcher_thread_wakes_on_in_process_writes(profile_service: ProfileService) -> None:
+    applied = threading.Event()
+    seen: list[Profile] = []
+
+    def on_change(profile: Profile) -> None:
+        seen.append(profile)
+        applied.set()
+
+    # A long poll interval: only the listener can wake the thread in time.
+    watcher = ProfileWatcher(
+        profile_service, on_change, profile_service.get_active_profile(), interval_s=60.0
+    ).start()
+    try:
+        profile_service.save_profile(Profile(name="turbo"))
+        profile_service.activate_profile("turbo")
+        assert applied.wait(timeout=5.0)
+    finally:
+        watcher.stop()
+    assert seen[-1].name == "turbo"
@@ -0,0 +1,112 @@
+"""Unit tests for SQLiteProfileService and the JSON-to-SQLite migration tool."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.domain.models import Profile
+from src.services.profile_service import ProfileService, create_profile_service
+from src.services.sqlite_profile_service import SCHEMA_VERSION, SQLiteProfileService
+from src.tools.migrate_profiles import main as migrate_main
+
+
+@pytest.fixture()
+def store(tmp_path: Path):
+    service = SQLiteProfileService(tmp_path / "profiles.sqlite3")
+    yield service
+    service.close()
+
+
+def test_bootstraps_default_profile_and_schema(store: SQLiteProfileService) -> None:
+    assert store.get_active_profile().name == "default"
+    assert store.schema_version == SCHEMA_VERSION
+
+
+def test_save_get_and_replace(store: SQLiteProfileService) -> None:
+    store.save_profile(Profile(name="fast", cooldown_ms=150))
+    store.save_profile(Profile(name="fast", cooldown_ms=300))
+    assert store.get_profile("fast").cooldown_ms == 300
+    with pytest.raises(FileNotFoundError):
+        store.get_profile("missing")
+    with pytest.raises(ValueError):
+        store.get_profile("../etc")
+
+
+def test_list_page_orders_by_name_and_counts_all(store: SQLiteProfileService) -> None:
+    store.save_many([Profile(name=f"p{index:02d}") for index in range(25)])
+    page, total = store.list_page(offset=10, limit=5)
+    assert total == 26  # plus "default"
+    assert [profile.name for profile in page] == ["p09", "p10", "p11", "p12", "p13"]
+    assert [profile.name for profile in store.list_profiles()][:2] == ["default", "p00"]
+
+
+def test_version_follows_commits_from_other_connections(tmp_path: Path) -> None:
+    first = SQLiteProfileService(tmp_path / "profiles.sqlite3")
+    second = SQLiteProfileService(tmp_path / "profiles.sqlite3")
+    second.save_profile(Profile(name="arcade"))
+    version = first.version
+
+    second.activate_profile("arcade")
+    assert first.version > version
+    assert first.get_active_profile_name() == "arcade"
+    first.close()
+    second.close()
+
+
+def test_factory_selects_backend(tmp_path: Path) -> None:
+    args = (tmp_path / "profiles", tmp_path / "active.txt", tmp_path / "profiles.sqlite3")
+    assert isinstance(create_profile_service("json", *args), ProfileService)
+    sqlite_store = create_profile_service("sqlite", *args)
+    assert isinstance(sqlite_store, SQLiteProfileService)
+    sqlite_store.close()
+    with pytest.raises(ValueError):
+        create_profile_service("yaml", *args)
+
+
+def test_migration_imports_json_profiles_and_active_selection(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    json_store = ProfileService(tmp_path / "profiles", tmp_path / "active.txt")
+    json_store.save_profile(Profile(name="night", left_bound=0.3, right_bound=0.7))
+    json_store.activate_profile("night")
+    (tmp_path / "profiles" / "broken.json").write_text("{", encoding="utf-8")
+    database = tmp_path / "profiles.sqlite3"
+
+    argv = [
+        "--profiles-dir",
+        str(tmp_path / "profiles"),
+        "--active-file",
+        str(tmp_path / "active.txt"),
+        "--database",
+        str(database),
+    ]
+    assert migrate_main(argv) == 0
+    assert "skipped broken.json" in capsys.readouterr().err
+
+    store = SQLiteProfileService(database)
+    assert [profile.name for profile in store.list_profiles()] == ["default", "night"]
+    assert store.get_active_profile().to_dict() == json.loads(
+        (tmp_path / "profiles" / "night.json").read_text(encoding="utf-8")
+    )
+    store.close()
+
+
+def test_migration_rerun_keeps_edited_default(tmp_path: Path) -> None:
+    json_store = ProfileService(tmp_path / "profiles", tmp_path / "active.txt")
+    json_store.save_profile(Profile(name="default", cooldown_ms=300))
+    database = tmp_path / "profiles.sqlite3"
+    argv = ["--profiles-dir", str(tmp_path / "profiles"), "--database", str(database)]
+
+    assert migrate_main(argv) == 0  # first import replaces the bootstrap row
+    store = SQLiteProfileService(database)
+    assert store.get_profile("default").cooldown_ms == 300
+    store.save_profile(Profile(name="default", cooldown_ms=500))
+    store.close()
+
+    assert migrate_main(argv) == 0
+    store = SQLiteProfileService(database)
+    assert store.get_profile("default").cooldown_ms == 500
+    store.close()
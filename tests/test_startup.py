@@ -0,0 +1,15 @@
+"""Guards for the mode-aware lazy imports in main.py."""
+
+from __future__ import annotations
+
+from benchmarks.startup import measure
+
+
+def test_importing_main_loads_no_heavy_dependencies() -> None:
+    _, loaded = measure("bare")
+    assert loaded == []
+
+
+def test_api_mode_does_not_import_opencv_or_mediapipe() -> None:
+    _, loaded = measure("api")
+    assert loaded == []
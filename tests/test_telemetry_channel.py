@@ -0,0 +1,111 @@
+"""Unit tests for the shared-memory telemetry channel."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+from src.domain.actions import Action
+from src.domain.models import TelemetrySnapshot, monotonic_ns_at
+from src.infrastructure.telemetry_channel import TelemetryChannel, TelemetryChannelReader
+
+
+def _snap(fps: int, action: Action = Action.CENTER) -> TelemetrySnapshot:
+    return TelemetrySnapshot(
+        action=action,
+        fps=fps,
+        has_hand=True,
+        profile="night_mode",
+        center_x=0.4321,
+        monotonic_ns=monotonic_ns_at(1_767_323_045_123_456_789),
+    )
+
+
+def test_reader_sees_latest_and_history(tmp_path: Path) -> None:
+    path = tmp_path / "telemetry.shm"
+    writer = TelemetryChannel(path, capacity=4)
+    reader = TelemetryChannelReader(path)
+    for fps in range(6):
+        writer.publish(_snap(fps))
+
+    assert reader.total == 6
+    assert [row["fps"] for row in reader.history(10)] == [2, 3, 4, 5]
+    latest = reader.latest()
+    assert latest is not None
+    assert latest.to_dict() == _snap(5).to_dict()
+    reader.close()
+    writer.close()
+
+
+def test_reader_attaches_once_the_writer_appears(tmp_path: Path) -> None:
+    path = tmp_path / "telemetry.shm"
+    reader = TelemetryChannelReader(path, reopen_interval_s=0.0)
+    assert reader.total == 0
+    assert reader.latest() is None
+
+    writer = TelemetryChannel(path, capacity=8)
+    writer.publish(_snap(1, Action.JUMP))
+    latest = reader.latest()
+    assert latest is not None
+    assert latest.action == Action.JUMP
+    reader.close()
+    writer.close()
+
+
+def test_read_during_write_is_rejected(tmp_path: Path) -> None:
+    path = tmp_path / "telemetry.shm"
+    writer = TelemetryChannel(path, capacity=8)
+    writer.publish(_snap(1))
+    reader = TelemetryChannelReader(path)
+    assert reader.history(1)
+
+    writer._header[3] += 1  # leave the sequence odd, as a writer mid-update would
+    assert reader.history(1) == []
+    writer._header[3] += 1
+    assert reader.history(1)
+    reader.close()
+    writer.close()
+
+
+def test_writer_reuses_compatible_file(tmp_path: Path) -> None:
+    path = tmp_path / "telemetry.shm"
+    first = TelemetryChannel(path, capacity=8)
+    first.publish(_snap(7))
+    first.close()
+
+    second = TelemetryChannel(path, capacity=8)
+    reader = TelemetryChannelReader(path)
+    assert [row["fps"] for row in reader.history(8)] == [7]
+    reader.close()
+    second.close()
+
+    resized = TelemetryChannel(path, capacity=16)
+    reader = TelemetryChannelReader(path)
+    assert reader.total == 0
+    reader.close()
+    resized.close()
+
+
+def test_reader_in_another_process(tmp_path: Path) -> None:
+    path = tmp_path / "telemetry.shm"
+    script = textwrap.dedent(
+        f"""
+        from pathlib import Path
+        from src.domain.actions import Action
+        from src.domain.models import TelemetrySnapshot, monotonic_ns_at
+        from src.infrastructure.telemetry_channel import TelemetryChannel
+
+        channel = TelemetryChannel(Path({str(path)!r}), capacity=16)
+        for fps in (10, 20, 30):
+            channel.publish(TelemetrySnapshot(Action.LEFT, fps, True, "default", 0.2))
+        channel.close()
+        """
+    )
+    root = Path(__file__).resolve().parents[1]
+    subprocess.run([sys.executable, "-c", script], cwd=root, check=True, timeout=60)
+
+    reader = TelemetryChannelReader(path)
+    assert [row["fps"] for row in reader.history(5)] == [10, 20, 30]
+    reader.close()
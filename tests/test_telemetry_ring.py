@@ -0,0 +1,71 @@
+"""Unit tests for TelemetryRing."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.domain.actions import Action
+from src.domain.models import TelemetrySnapshot, monotonic_ns_at
+from src.services.telemetry_ring import TELEMETRY_DTYPE, TelemetryRing
+
+
+def _snap(fps: int, action: Action = Action.CENTER, profile: str = "default") -> TelemetrySnapshot:
+    return TelemetrySnapshot(
+        action=action,
+        fps=fps,
+        has_hand=fps % 2 == 0,
+        profile=profile,
+        center_x=0.123456,
+        monotonic_ns=monotonic_ns_at(1_767_323_045_123_456_789),
+    )
+
+
+def test_tail_round_trips_snapshot_dicts() -> None:
+    ring = TelemetryRing(4)
+    snap = _snap(30, Action.JUMP, profile="night")
+    ring.append(snap)
+    assert ring.tail(1) == [{"seq": 1, **snap.to_dict()}]
+
+
+def test_wraps_around_keeping_newest_in_order() -> None:
+    ring = TelemetryRing(4)
+    for fps in range(10):
+        ring.append(_snap(fps))
+    assert len(ring) == 4
+    assert ring.total == 10
+    assert [row["fps"] for row in ring.tail(100)] == [6, 7, 8, 9]
+    assert [row["fps"] for row in ring.tail(2)] == [8, 9]
+
+
+def test_rows_are_a_structured_copy() -> None:
+    ring = TelemetryRing(3)
+    for fps in range(5):
+        ring.append(_snap(fps, profile=f"p{fps % 2}"))
+    rows = ring.rows(3)
+    assert rows.dtype == TELEMETRY_DTYPE
+    assert rows["fps"].tolist() == [2, 3, 4]
+    assert rows["profile"].tolist() == [0, 1, 0]
+    rows["fps"] = 0
+    assert ring.rows(1)["fps"].tolist() == [4]
+
+
+def test_append_dict_accepts_legacy_records() -> None:
+    ring = TelemetryRing(2)
+    ring.append_dict({"action": "LEFT", "fps": 12, "timestamp": "2026-01-02T03:04:05"})
+    row = ring.tail(1)[0]
+    assert row["action"] == "LEFT"
+    assert row["timestamp_ns"] == 1_767_323_045_000_000_000
+
+
+def test_empty_ring_and_invalid_capacity() -> None:
+    assert TelemetryRing(5).tail(10) == []
+    with pytest.raises(ValueError):
+        TelemetryRing(0)
+
+
+def test_profile_table_is_compacted_to_names_still_in_the_ring() -> None:
+    ring = TelemetryRing(4)
+    for index in range(50):
+        ring.append(_snap(index, profile=f"p{index}"))
+    assert len(ring._profiles) <= 2 * ring.capacity
+    assert [row["profile"] for row in ring.tail(4)] == ["p46", "p47", "p48", "p49"]
@@ -0,0 +1,187 @@
+"""Unit tests for telemetry rollups."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from src.domain.actions import Action
+from src.domain.models import TelemetrySnapshot, monotonic_ns_at
+from src.services.telemetry_rollup import RollupFollower, RollupRing, TelemetryRollups
+
+T0 = 1_767_225_600  # 2026-01-01T00:00:00Z
+
+
+def _snap(offset_s: float, fps: int, action: Action = Action.CENTER, hand: bool = True):
+    return TelemetrySnapshot(
+        action=action,
+        fps=fps,
+        has_hand=hand,
+        profile="default",
+        center_x=0.5,
+        monotonic_ns=monotonic_ns_at(int((T0 + offset_s) * 1e9)),
+    )
+
+
+def test_second_buckets_aggregate_samples() -> None:
+    rollups = TelemetryRollups()
+    rollups.add(_snap(0, 30, Action.LEFT))
+    rollups.add(_snap(0, 20, Action.JUMP, hand=False))
+    rollups.add(_snap(0, 40, Action.LEFT))
+    rollups.add(_snap(1, 50))
+
+    buckets = rollups.query(T0, T0 + 2, "second")
+    assert buckets[0] == {
+        "start": "2026-01-01T00:00:00+00:00",
+        "samples": 3,
+        "fps_min": 20,
+        "fps_avg": 30.0,
+        "fps_max": 40,
+        "hand_ratio": round(2 / 3, 4),
+        "actions": {"LEFT": 2, "JUMP": 1},
+    }
+    assert buckets[1]["samples"] == 1
+    assert rollups.query(T0 + 1, T0 + 2, "second") == buckets[1:]
+
+
+def test_minute_buckets_span_seconds() -> None:
+    rollups = TelemetryRollups()
+    for second in range(0, 120, 10):
+        rollups.add(_snap(second, second))
+    minutes = rollups.query(T0, T0 + 3600, "minute")
+    assert [bucket["samples"] for bucket in minutes] == [6, 6]
+    assert [bucket["fps_max"] for bucket in minutes] == [50, 110]
+
+
+def test_ring_reuses_slots_and_ignores_stale_samples() -> None:
+    ring = RollupRing(width_s=1, capacity=4)
+    ring.add(T0, 10, True, 0)
+    ring.add(T0 + 4, 20, True, 0)  # same slot, newer bucket: the old one is evicted
+    ring.add(T0, 99, True, 0)  # older than the slot's bucket: ignored
+    rows = ring.query(T0 - 10, T0 + 10)
+    assert [(row[0] - T0, row[1], row[3]) for row in rows] == [(4, 1, 20)]
+
+
+def test_query_rejects_unknown_resolution() -> None:
+    with pytest.raises(ValueError):
+        TelemetryRollups().query(T0, T0 + 1, "hour")
+
+
+class _Feed:
+    def __init__(self) -> None:
+        self.records: list[dict[str, Any]] = []
+        self.reads: list[int] = []
+
+    @property
+    def total(self) -> int:
+        return len(self.records)
+
+    def history(self, limit: int = 60) -> list[dict[str, Any]]:
+        self.reads.append(limit)
+        start = max(0, len(self.records) - limit)
+        return [
+            {"seq": seq, **record} for seq, record in enumerate(self.records[start:], start + 1)
+        ]
+
+
+class _WindowFeed(_Feed):
+    """Retains only the newest *capacity* samples, like the shared channel."""
+
+    def __init__(self, capacity: int) -> None:
+        super().__init__()
+        self.capacity = capacity
+
+    def history(self, limit: int = 60) -> list[dict[str, Any]]:
+        return super().history(min(limit, self.capacity))
+
+
+class _RacingFeed(_Feed):
+    """Publishes a sample between every read of ``total`` and ``history``."""
+
+    def history(self, limit: int = 60) -> list[dict[str, Any]]:
+        self.records.append(_snap(0, 50).to_dict())
+        return super().history(limit)
+
+
+def test_follower_ingests_only_new_samples() -> None:
+    feed = _Feed()
+    follower = RollupFollower()
+    feed.records += [_snap(0, 10).to_dict(), _snap(0, 20).to_dict()]
+    follower.catch_up(feed)
+    feed.records.append(_snap(0, 30).to_dict())
+    rollups = follower.catch_up(feed)
+    follower.catch_up(feed)
+
+    assert len(feed.reads) == 2  # the third call found nothing new
+    bucket = rollups.query(T0, T0 + 1, "second")[0]
+    assert (bucket["samples"], bucket["fps_max"]) == (3, 30)
+
+
+def test_follower_counts_samples_published_mid_catch_up_once() -> None:
+    feed = _RacingFeed()
+    follower = RollupFollower()
+    for fps in (10, 20):
+        feed.records.append(_snap(0, fps).to_dict())
+        follower.catch_up(feed)
+    rollups = follower.catch_up(feed)
+
+    assert len(feed.records) == 4
+    assert rollups.query(T0, T0 + 1, "second")[0]["samples"] == 4
+
+
+def _samples(rollups: TelemetryRollups | RollupFollower) -> int:
+    return sum(bucket["samples"] for bucket in rollups.query(T0, T0 + 60, "second"))
+
+
+def _wait_for(predicate: Callable[[], bool], timeout_s: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout_s
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached in time"
+        time.sleep(0.001)
+
+
+def test_follower_thread_keeps_counts_exact_past_feed_window() -> None:
+    feed = _WindowFeed(capacity=4)
+    follower = RollupFollower().follow(feed, interval_s=0.001)
+    try:
+        for batch in range(5):  # 15 samples between the two reads below, window of 4
+            feed.records += [_snap(batch, 10 * batch + n).to_dict() for n in range(3)]
+            _wait_for(lambda: _samples(follower) == len(feed.records))
+    finally:
+        follower.stop()
+
+    rollups = follower.catch_up(feed)
+    assert _samples(rollups) == 15
+    assert follower.missed == 0
+    assert [bucket["fps_max"] for bucket in rollups.query(T0, T0 + 60, "second")] == [
+        2,
+        12,
+        22,
+        32,
+        42,
+    ]
+
+
+def test_follower_reports_samples_that_left_the_window_unread() -> None:
+    feed = _WindowFeed(capacity=4)
+    follower = RollupFollower()
+    feed.records.append(_snap(0, 10).to_dict())
+    follower.catch_up(feed)
+    feed.records += [_snap(1, 20).to_dict() for _ in range(10)]
+    rollups = follower.catch_up(feed)
+
+    assert follower.missed == 6
+    assert _samples(rollups) == 5
+
+
+def test_follower_skips_feed_samples_already_seeded() -> None:
+    feed = _Feed()
+    feed.records += [_snap(0, 10).to_dict(), _snap(1, 20).to_dict()]
+    follower = RollupFollower().seed(feed.records)
+    feed.records.append(_snap(2, 30).to_dict())
+    rollups = follower.catch_up(feed)
+
+    assert [bucket["samples"] for bucket in rollups.query(T0, T0 + 60, "second")] == [1, 1, 1]
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import json
+import time
 from pathlib import Path
 
 from src.domain.actions import Action
 from src.domain.models import TelemetrySnapshot
+from src.infrastructure.telemetry_log import TelemetryLog
 from src.services.telemetry_service import TelemetryService
 
 
@@ -91,3 +94,120 @@ def test_corrupt_file_does_not_raise(tmp_path: Path) -> None:
     # publish should succeed by starting with an empty history.
     svc.publish(_snap())
     assert len(svc.history()) == 1
+
+
+# ---------------------------------------------------------------------------
+# NDJSON log
+# ---------------------------------------------------------------------------
+
+
+def test_publish_appends_one_compact_line(tmp_path: Path) -> None:
+    svc = TelemetryService(telemetry_file=tmp_path / "t.ndjson")
+    svc.publish(_snap(fps=1))
+    svc.publish(_snap(fps=2))
+    svc.close()
+    lines = (tmp_path / "t.ndjson").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[1])["fps"] == 2
+    assert ": " not in lines[0]
+
+
+def test_segments_rotate_by_size(tmp_path: Path) -> None:
+    log = TelemetryLog(tmp_path / "t.ndjson", max_bytes=200, backup_count=2)
+    for i in range(40):
+        log.append({"fps": i})
+    log.close()
+    segments = log.segments()
+    assert [p.name for p in segments] == ["t.ndjson", "t.ndjson.1", "t.ndjson.2"]
+    assert all(p.stat().st_size < 250 for p in segments)
+    assert [r["fps"] for r in log.tail(3)] == [37, 38, 39]
+
+
+def test_segments_rotate_by_age(tmp_path: Path) -> None:
+    log = TelemetryLog(tmp_path / "t.ndjson", max_age_s=0.0)
+    log.append({"fps": 1})
+    log.append({"fps": 2})
+    log.close()
+    assert [p.name for p in log.segments()] == ["t.ndjson", "t.ndjson.1"]
+
+
+def test_tail_spans_segments_and_skips_partial_lines(tmp_path: Path) -> None:
+    log = TelemetryLog(tmp_path / "t.ndjson", max_bytes=60)
+    for i in range(10):
+        log.append({"fps": i})
+    log.close()
+    with (tmp_path / "t.ndjson").open("a", encoding="utf-8") as handle:
+        handle.write('{"fps": 9')  # interrupted write
+    assert [r["fps"] for r in log.tail(6)] == [5, 6, 7, 8, 9]
+
+    # The next append starts on a fresh line instead of extending the fragment.
+    log.append({"fps": 10})
+    log.close()
+    assert [r["fps"] for r in log.tail(3)] == [9, 10]
+
+
+def test_history_is_seeded_from_log_tail(tmp_path: Path) -> None:
+    svc = TelemetryService(telemetry_file=tmp_path / "t.ndjson", max_history=3)
+    for fps in range(10):
+        svc.publish(_snap(fps=fps))
+    svc.close()
+    reloaded = TelemetryService(telemetry_file=tmp_path / "t.ndjson", max_history=3)
+    assert [e["fps"] for e in reloaded.history(limit=10)] == [7, 8, 9]
+
+
+def test_legacy_json_array_is_migrated(tmp_path: Path) -> None:
+    legacy = tmp_path / "telemetry.json"
+    legacy.write_text(json.dumps([_snap(fps=5).to_dict(), _snap(fps=6).to_dict()], indent=2))
+    svc = TelemetryService(telemetry_file=tmp_path / "telemetry.ndjson")
+    assert [e["fps"] for e in svc.history(limit=10)] == [5, 6]
+    svc.publish(_snap(fps=7))
+    svc.close()
+    lines = (tmp_path / "telemetry.ndjson").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["fps"] for line in lines] == [5, 6, 7]
+
+
+# ---------------------------------------------------------------------------
+# Write-behind mode
+# ---------------------------------------------------------------------------
+
+
+def _logged_fps(path: Path) -> list[int]:
+    return [json.loads(line)["fps"] for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_write_behind_publish_does_not_write_immediately(tmp_path: Path) -> None:
+    path = tmp_path / "t.ndjson"
+    svc = TelemetryService(path, write_behind=True, flush_interval_s=60, flush_batch=100)
+    svc.publish(_snap(fps=1))
+    assert svc.history(limit=1)[0]["fps"] == 1
+    assert svc.pending == 1
+    assert path.read_text(encoding="utf-8") == ""
+    svc.close()
+    assert _logged_fps(path) == [1]
+
+
+def test_write_behind_flushes_full_batches(tmp_path: Path) -> None:
+    path = tmp_path / "t.ndjson"
+    svc = TelemetryService(path, write_behind=True, flush_interval_s=60, flush_batch=4)
+    for fps in range(4):
+        svc.publish(_snap(fps=fps))
+    deadline = time.monotonic() + 2.0
+    while svc.pending and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert svc.pending == 0
+    svc.close()
+    assert _logged_fps(path) == [0, 1, 2, 3]
+
+
+def test_write_behind_overflow_drops_oldest(tmp_path: Path) -> None:
+    path = tmp_path / "t.ndjson"
+    svc = TelemetryService(
+        path, write_behind=True, flush_interval_s=60, flush_batch=100, queue_capacity=4
+    )
+    for fps in range(10):
+        svc.publish(_snap(fps=fps))
+    assert svc.dropped == 6
+    svc.close()
+    assert _logged_fps(path) == [6, 7, 8, 9]
+    # The in-memory history is unaffected by dropped writes.
+    assert len(svc.history(limit=100)) == 10
@@ -0,0 +1,118 @@
+"""Unit tests for the Server-Sent Events telemetry broadcaster."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+
+from src.api.telemetry_stream import TelemetryBroadcaster
+
+
+class _Feed:
+    def __init__(self) -> None:
+        self.records: list[dict[str, Any]] = []
+
+    @property
+    def total(self) -> int:
+        return len(self.records)
+
+    def history(self, limit: int = 60) -> list[dict[str, Any]]:
+        start = max(0, len(self.records) - limit)
+        return [
+            {"seq": seq, **record} for seq, record in enumerate(self.records[start:], start + 1)
+        ]
+
+
+class _RacingFeed(_Feed):
+    """Publishes a sample between every read of ``total`` and ``history``."""
+
+    def history(self, limit: int = 60) -> list[dict[str, Any]]:
+        self.records.append({"fps": len(self.records)})
+        return super().history(limit)
+
+
+def _data(frame: bytes) -> dict[str, Any]:
+    event_id, event, data = frame.decode().strip().split("\n")
+    assert event == "event: telemetry"
+    payload: dict[str, Any] = json.loads(data.removeprefix("data: "))
+    assert event_id == f"id: {payload['seq']}"
+    return payload
+
+
+def test_new_samples_reach_every_subscriber_once() -> None:
+    feed = _Feed()
+    feed.records.append({"fps": 0})  # already present before anyone subscribed
+
+    async def scenario() -> tuple[list[bytes], list[bytes]]:
+        broadcaster = TelemetryBroadcaster(lambda: feed, poll_interval_s=0.001)
+        first, second = broadcaster.subscribe(), broadcaster.subscribe()
+        await asyncio.sleep(0.01)
+        feed.records.extend([{"fps": 1}, {"fps": 2}])
+        frames = [await asyncio.wait_for(first.get(), 1), await asyncio.wait_for(first.get(), 1)]
+        others = [await asyncio.wait_for(second.get(), 1), await asyncio.wait_for(second.get(), 1)]
+        await asyncio.sleep(0.01)
+        assert first.empty() and second.empty()
+        broadcaster.unsubscribe(first)
+        broadcaster.unsubscribe(second)
+        return frames, others
+
+    frames, others = asyncio.run(scenario())
+    assert [_data(frame)["fps"] for frame in frames] == [1, 2]
+    assert frames == others  # encoded once, shared by both clients
+
+
+def test_slow_subscriber_drops_oldest_frames() -> None:
+    async def scenario() -> tuple[TelemetryBroadcaster, list[bytes]]:
+        broadcaster = TelemetryBroadcaster(_Feed, queue_size=2)
+        queue = broadcaster.subscribe()
+        for index in range(5):
+            broadcaster.broadcast(str(index).encode())
+        pending = [queue.get_nowait(), queue.get_nowait()]
+        broadcaster.unsubscribe(queue)
+        return broadcaster, pending
+
+    broadcaster, pending = asyncio.run(scenario())
+    assert pending == [b"3", b"4"]
+    assert broadcaster.dropped == 3
+    assert broadcaster.subscribers == 0
+
+
+def test_events_stream_ends_cleanly_and_unsubscribes() -> None:
+    feed = _Feed()
+
+    async def scenario() -> tuple[TelemetryBroadcaster, list[bytes]]:
+        broadcaster = TelemetryBroadcaster(lambda: feed, poll_interval_s=0.001)
+        stream = broadcaster.events(keepalive_s=0.2)
+        received = [await stream.__anext__()]
+        feed.records.append({"fps": 9})
+        received.append(await stream.__anext__())
+        received.append(await stream.__anext__())
+        await stream.aclose()
+        return broadcaster, received
+
+    broadcaster, received = asyncio.run(scenario())
+    assert received[0].startswith(b"retry:")
+    assert _data(received[1])["fps"] == 9
+    assert received[2] == b": keepalive\n\n"
+    assert broadcaster.subscribers == 0
+
+
+def test_samples_published_during_a_poll_are_sent_once_in_order() -> None:
+    feed = _RacingFeed()
+
+    async def scenario() -> list[bytes]:
+        broadcaster = TelemetryBroadcaster(lambda: feed, poll_interval_s=0.001)
+        queue = broadcaster.subscribe()
+        received: list[bytes] = []
+        for _ in range(3):
+            feed.records.append({"fps": len(feed.records)})
+            await asyncio.sleep(0.01)
+            while not queue.empty():
+                received.append(queue.get_nowait())
+        broadcaster.unsubscribe(queue)
+        return received
+
+    seqs = [_data(frame)["seq"] for frame in asyncio.run(scenario())]
+    assert seqs == list(range(1, len(seqs) + 1))
+    assert len(seqs) >= 6
@@ -0,0 +1,114 @@
+"""Unit tests for the offline profile tuner."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.domain.actions import Action
+from src.domain.models import Profile
+from src.tools.tune_profile import (
+    TuningParams,
+    build_grid,
+    evaluate,
+    load_session,
+    main,
+    replay,
+    search,
+)
+from tests.conftest import make_hand
+
+_FIST = [False] * 5
+_OPEN = [True] * 5
+
+# (label, center_x, fingers, frames) segments at 30 fps.  The player's lanes
+# sit at 0.3 / 0.5 / 0.7, so bounds around 0.4 / 0.6 fit them.
+_SCRIPT = [
+    ("center", 0.5, _FIST, 20),
+    ("left", 0.3, _FIST, 20),
+    ("center", 0.5, _FIST, 20),
+    ("right", 0.7, _FIST, 20),
+    ("center", 0.5, _FIST, 20),
+    ("jump", 0.5, _OPEN, 10),
+    ("center", 0.5, _FIST, 20),
+    ("idle", None, _FIST, 10),
+    ("right", 0.7, _FIST, 20),
+]
+
+
+def _write_session(path: Path) -> Path:
+    lines = []
+    frame = 0
+    for label, center_x, fingers, frames in _SCRIPT:
+        for _ in range(frames):
+            landmarks = None
+            if center_x is not None:
+                landmarks = [[lm.x, lm.y] for lm in make_hand(fingers, center_x)[0]]
+            lines.append(json.dumps({"t_ms": frame * 33.3, "label": label, "landmarks": landmarks}))
+            frame += 1
+    path.write_text("\n".join(lines), encoding="utf-8")
+    return path
+
+
+@pytest.fixture()
+def session_file(tmp_path: Path) -> Path:
+    return _write_session(tmp_path / "session.ndjson")
+
+
+def test_replay_presses_each_intended_action(session_file: Path) -> None:
+    session = load_session(session_file)
+    presses = replay(session, TuningParams(0.4, 0.6, 200, 0.5))
+    assert [action for _, action in presses] == [
+        Action.LEFT,
+        Action.RIGHT,
+        Action.JUMP,
+        Action.RIGHT,
+    ]
+
+
+def test_well_placed_bounds_beat_wide_ones(session_file: Path) -> None:
+    session = load_session(session_file)
+    good = evaluate([session], TuningParams(0.4, 0.6, 200, 0.5))
+    wide = evaluate([session], TuningParams(0.25, 0.75, 200, 0.5))
+    assert good.f1 == 1.0
+    assert wide.recall < good.recall
+    assert good.rank_key() < wide.rank_key()
+
+
+def test_build_grid_skips_invalid_combinations() -> None:
+    grid = build_grid([0.4, 0.7], [0.6], [200, 50], [0.22])
+    assert grid == [TuningParams(0.4, 0.6, 200, 0.22)]
+
+
+def test_parallel_search_matches_serial(session_file: Path) -> None:
+    session = load_session(session_file)
+    grid = build_grid([0.25, 0.4], [0.6, 0.75], [200], [0.5])
+    serial = search([session], grid, workers=1)
+    parallel = search([session], grid, workers=2)
+    assert [r.params for r in parallel] == [r.params for r in serial]
+    assert serial[0].params == TuningParams(0.4, 0.6, 200, 0.5)
+
+
+def test_main_writes_best_profile(session_file: Path, tmp_path: Path) -> None:
+    out = tmp_path / "tuned.json"
+    argv = [str(session_file), "--out", str(out), "--left", "0.25,0.4", "--right", "0.6,0.75"]
+    assert main([*argv, "--cooldown", "200", "--smoothing", "0.5", "--workers", "1"]) == 0
+    profile = Profile.from_dict(json.loads(out.read_text(encoding="utf-8")))
+    assert (profile.name, profile.left_bound, profile.right_bound) == ("tuned", 0.4, 0.6)
+
+
+def test_invalid_session_is_reported(tmp_path: Path) -> None:
+    bad = tmp_path / "bad.ndjson"
+    bad.write_text('{"t_ms": 0, "label": "sideways"}\n', encoding="utf-8")
+    assert main([str(bad)]) == 2
+
+
+def test_invalid_profile_name_is_a_usage_error(
+    session_file: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    with pytest.raises(SystemExit) as exc:
+        main([str(session_file), "--name", "no spaces"])
+    assert exc.value.code == 2
+    assert "--name" in capsys.readouterr().err